@@ -11,6 +11,8 @@ Create Date: 2026-02-25 20:00:00.000000
 """
 from typing import Sequence, Union
 
+import sqlalchemy as sa
+
 from alembic import op
 
 
@@ -20,41 +22,61 @@ down_revision: Union[str, Sequence[str], None] = "d6e7f8a9b0c1"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows per UPDATE. Each batch commits on its own so row locks and WAL are
+# bounded per batch instead of held for one table-wide statement.
+BATCH_SIZE = 10_000
+
+
+def _batched_update(set_clause: str, where_clause: str) -> None:
+    """Run ``UPDATE stores SET <set_clause>`` over countdown stores in id-ordered batches.
+
+    Candidate ids are numbered once into a temp table; each batch then updates
+    a ``row_number`` range of it in its own transaction.
+    """
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        bind.execute(sa.text("DROP TABLE IF EXISTS _cd_stores"))
+        bind.execute(sa.text(
+            "CREATE TEMP TABLE _cd_stores AS "
+            "SELECT id, row_number() OVER (ORDER BY id) AS rn "
+            "FROM stores WHERE chain = 'countdown'"
+        ))
+        bind.execute(sa.text("CREATE INDEX ON _cd_stores (rn)"))
+        total = bind.execute(sa.text("SELECT count(*) FROM _cd_stores")).scalar() or 0
+
+        stmt = sa.text(
+            f"UPDATE stores SET {set_clause} "
+            "FROM _cd_stores t "
+            "WHERE stores.id = t.id AND t.rn BETWEEN :lo AND :hi "
+            f"AND {where_clause}"
+        )
+        for lo in range(1, total + 1, BATCH_SIZE):
+            bind.execute(stmt, {"lo": lo, "hi": lo + BATCH_SIZE - 1})
+
+        bind.execute(sa.text("DROP TABLE _cd_stores"))
+
 
 def upgrade() -> None:
     # Step 1: Strip trailing " Woolworths" suffix
     # (CDX API returns "Eastgate Woolworths"; runner.py strips this then
     # prepends, so the canonical form is "Woolworths Eastgate".)
-    op.execute(
-        """
-        UPDATE stores
-        SET name = TRIM(LEFT(name, LENGTH(name) - LENGTH(' Woolworths')))
-        WHERE chain = 'countdown'
-          AND name ILIKE '%% Woolworths'
-          AND name NOT ILIKE 'Woolworths %%'
-        """
+    # Case-insensitive anchored regex to match the ILIKE filter below.
+    _batched_update(
+        "name = TRIM(regexp_replace(name, ' woolworths$', '', 'i'))",
+        "name ILIKE '% Woolworths' AND name NOT ILIKE 'Woolworths %'",
     )
 
     # Step 2: Prepend "Woolworths " to any countdown store that doesn't
     # already have the prefix (covers both bare names and newly-trimmed ones).
-    op.execute(
-        """
-        UPDATE stores
-        SET name = 'Woolworths ' || name
-        WHERE chain = 'countdown'
-          AND name NOT ILIKE 'Woolworths %%'
-          AND name NOT ILIKE 'Metro %%'
-        """
+    _batched_update(
+        "name = 'Woolworths ' || name",
+        "name NOT ILIKE 'Woolworths %' AND name NOT ILIKE 'Metro %'",
     )
 
 
 def downgrade() -> None:
     # Remove the "Woolworths " prefix we added.
-    op.execute(
-        """
-        UPDATE stores
-        SET name = TRIM(SUBSTRING(name FROM 13))
-        WHERE chain = 'countdown'
-          AND name ILIKE 'Woolworths %%'
-        """
+    _batched_update(
+        "name = TRIM(SUBSTRING(name FROM 13))",
+        "name ILIKE 'Woolworths %'",
     )
@@ -0,0 +1,92 @@
+"""Replace single-column price indexes with store-scoped and partial promo indexes.
+
+Revision ID: l1a2b3c4d5e6
+Revises: k1a2b3c4d5e6
+Create Date: 2026-10-16
+
+Product listing filters prices by store (via the radius/store filters) and
+then by price range / promo, so the standalone btrees on price_nzd and
+promo_price_nzd were rarely chosen on their own. A composite
+(store_id, price_nzd) index serves the store-scoped price filter directly,
+and a partial index on promo_price_nzd only covers rows that actually have a
+promo, which keeps it a fraction of the size of the full index.
+
+CONCURRENTLY so we don't lock writes on the prices table during creation.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+revision: str = "l1a2b3c4d5e6"
+down_revision: Union[str, Sequence[str], None] = "k1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_price_store_price",
+            "prices",
+            ["store_id", "price_nzd"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_price_promo",
+            "prices",
+            ["promo_price_nzd"],
+            unique=False,
+            postgresql_concurrently=True,
+            postgresql_where=sa.text("promo_price_nzd IS NOT NULL"),
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_price_price_nzd",
+            table_name="prices",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_price_promo_price_nzd",
+            table_name="prices",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_price_price_nzd",
+            "prices",
+            ["price_nzd"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_price_promo_price_nzd",
+            "prices",
+            ["promo_price_nzd"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_price_promo",
+            table_name="prices",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_price_store_price",
+            table_name="prices",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,62 @@
+"""Switch ix_price_last_changed from btree to BRIN.
+
+Revision ID: m1a2b3c4d5e6
+Revises: l1a2b3c4d5e6
+Create Date: 2026-10-16
+
+price_last_changed_at is written with the scrape time, so values track the
+physical insert/update order of the prices table closely. A BRIN index over
+that shape is a tiny fraction of the btree's size and is cheap to maintain
+during the bulk price upserts at the end of every scraper run, while still
+serving time-range scans.
+
+CONCURRENTLY so we don't lock writes on the prices table during the swap.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "m1a2b3c4d5e6"
+down_revision: Union[str, Sequence[str], None] = "l1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_price_last_changed",
+            table_name="prices",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_price_last_changed",
+            "prices",
+            ["price_last_changed_at"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_price_last_changed",
+            table_name="prices",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_price_last_changed",
+            "prices",
+            ["price_last_changed_at"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,38 @@
+"""Use the "C" collation for products.source_product_id.
+
+Revision ID: n1a2b3c4d5e6
+Revises: m1a2b3c4d5e6
+Create Date: 2026-10-16
+
+source_product_id is an opaque retailer id that is only compared for
+equality: the uq_product_source probe behind every scraper
+ON CONFLICT (chain, source_product_id) upsert, and the IN (...) lookups
+that map source ids back to product ids. Under the database's default
+locale collation each comparison goes through strcoll; "C" compares bytes.
+
+Changing the collation keeps the varchar type, so the table is not
+rewritten, but Postgres rebuilds uq_product_source as part of the ALTER
+(no separate REINDEX is needed). That rebuild holds an ACCESS EXCLUSIVE
+lock on products, so run this outside scraper windows.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "n1a2b3c4d5e6"
+down_revision: Union[str, Sequence[str], None] = "m1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'ALTER TABLE products ALTER COLUMN source_product_id TYPE varchar(128) COLLATE "C"'
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        'ALTER TABLE products ALTER COLUMN source_product_id TYPE varchar(128) COLLATE "default"'
+    )
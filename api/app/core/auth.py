@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import datetime as dt
 import hashlib
+import hmac
+import json
+import time
+from collections import OrderedDict
 from typing import Optional
 
 import bcrypt
@@ -9,6 +13,7 @@ import jwt
 import redis.asyncio as redis
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jwt.algorithms import HMACAlgorithm
 
 from app.core.config import get_settings
 
@@ -16,10 +21,113 @@ settings = get_settings()
 security = HTTPBearer(auto_error=False)
 
 
+class _PrecomputedHS256(HMACAlgorithm):
+    """
+    HS256 bound to one secret whose key checks and HMAC pads are computed once.
+
+    PyJWT re-validates the key in prepare_key() and rebuilds the HMAC inner/outer
+    pads in sign() on every encode/decode. For our fixed secret we do that once
+    and copy() the keyed template per call. Any other key falls back to the
+    stock implementation.
+    """
+
+    def __init__(self, secret: bytes) -> None:
+        super().__init__(HMACAlgorithm.SHA256)
+        self._secret = super().prepare_key(secret)
+        self._template = hmac.new(self._secret, digestmod=self.hash_alg)
+
+    def prepare_key(self, key: str | bytes) -> bytes:
+        if key is self._secret:
+            return self._secret
+        return super().prepare_key(key)
+
+    def sign(self, msg: bytes, key: bytes) -> bytes:
+        if key is not self._secret:
+            return super().sign(msg, key)
+        mac = self._template.copy()
+        mac.update(msg)
+        return mac.digest()
+
+
+# Shared JWS instance and pre-encoded signing key, reused by every encode/decode.
+# Only HS256 is registered, through PyJWS's public register_algorithm, so
+# the signature layer is stock PyJWT; claims are checked in _decode_token.
+_jwt_secret = settings.secret_key.encode("utf-8")
+_JWT_ALGORITHMS = ("HS256",)
+_jws = jwt.PyJWS(algorithms=[])
+_jws.register_algorithm("HS256", _PrecomputedHS256(_jwt_secret))
+
+
+def _encode_token(payload: dict) -> str:
+    """Sign a claims dict as a compact HS256 JWT."""
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return _jws.encode(body, _jwt_secret, algorithm="HS256")
+
+
+def _decode_token(token: str) -> dict:
+    """
+    Verify an HS256 JWT and return its claims.
+
+    Raises the same jwt.PyJWTError subclasses as jwt.decode() for a bad
+    signature, malformed payload, or exp/nbf outside the current time.
+    """
+    body = _jws.decode_complete(token, _jwt_secret, algorithms=_JWT_ALGORITHMS)["payload"]
+    try:
+        payload = json.loads(body)
+    except ValueError as exc:
+        raise jwt.DecodeError(f"Invalid payload string: {exc}") from exc
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+
+    now = time.time()
+    for claim in ("exp", "nbf", "iat"):
+        if claim in payload and (
+            isinstance(payload[claim], bool) or not isinstance(payload[claim], (int, float))
+        ):
+            raise jwt.DecodeError(f"The {claim} claim must be a number")
+    if "exp" in payload and payload["exp"] <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    if "nbf" in payload and payload["nbf"] > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    return payload
+
+# Verified admin tokens keyed by SHA-256(token) -> (sub, cache_expires_at).
+# Raw tokens are never stored. Entries are capped at _TOKEN_CACHE_TTL seconds
+# (or the token's own exp, whichever is sooner) and only successful admin
+# verifications are cached.
+_TOKEN_CACHE_MAXSIZE = 1024
+_TOKEN_CACHE_TTL = 30
+_token_cache: OrderedDict[bytes, tuple[str, float]] = OrderedDict()
+
+
+def _token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _cached_admin(token_key: bytes) -> Optional[str]:
+    """Return the cached subject for a verified token, or None on miss/expiry."""
+    entry = _token_cache.get(token_key)
+    if entry is None:
+        return None
+    sub, expires_at = entry
+    if expires_at <= time.time():
+        _token_cache.pop(token_key, None)
+        return None
+    _token_cache.move_to_end(token_key)
+    return sub
+
+
+def _cache_admin(token_key: bytes, sub: str, exp: float) -> None:
+    _token_cache[token_key] = (sub, min(float(exp), time.time() + _TOKEN_CACHE_TTL))
+    _token_cache.move_to_end(token_key)
+    while len(_token_cache) > _TOKEN_CACHE_MAXSIZE:
+        _token_cache.popitem(last=False)
+
+
 # Redis client for token blacklist
 async def get_redis_client() -> redis.Redis:
     """Get Redis client for token revocation."""
-    return redis.from_url(str(settings.redis_url), decode_responses=True)
+    return redis.from_url(settings.redis_url, decode_responses=True)
 
 
 def hash_password(password: str) -> str:
@@ -66,9 +174,9 @@ def create_admin_token() -> str:
     """
     payload = {
         "sub": settings.admin_username,
-        "exp": dt.datetime.utcnow() + dt.timedelta(hours=12),
+        "exp": int((dt.datetime.now(dt.timezone.utc) + dt.timedelta(hours=12)).timestamp()),
     }
-    return jwt.encode(payload, settings.secret_key, algorithm="HS256")
+    return _encode_token(payload)
 
 
 def create_token_with_credentials(username: str, password: str) -> str:
@@ -109,14 +217,14 @@ async def revoke_token(token: str) -> None:
     redis_client = None
     try:
         # Decode to get expiration
-        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+        payload = _decode_token(token)
         exp = payload.get("exp")
 
         if not exp:
             return  # Token has no expiration, can't revoke effectively
 
         # Calculate TTL (time until expiration)
-        now = dt.datetime.utcnow().timestamp()
+        now = time.time()
         ttl = int(exp - now)
 
         if ttl <= 0:
@@ -125,6 +233,10 @@ async def revoke_token(token: str) -> None:
         # Hash token for storage (shorter key, more privacy)
         token_hash = hashlib.sha256(token.encode()).hexdigest()
 
+        # Evict from the local verification cache first so a Redis failure
+        # can't leave a revoked token cached
+        _token_cache.pop(_token_digest(token), None)
+
         # Store in Redis with TTL matching token expiration
         redis_client = await get_redis_client()
         await redis_client.setex(f"revoked_token:{token_hash}", ttl, "1")
@@ -190,14 +302,23 @@ async def require_admin(
     if await is_token_revoked(token):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has been revoked")
 
+    # Skip signature verification for tokens already verified recently
+    token_key = _token_digest(token)
+    cached_sub = _cached_admin(token_key)
+    if cached_sub is not None:
+        return cached_sub
+
     try:
-        payload = jwt.decode(token, settings.secret_key, algorithms=["HS256"])
+        payload = _decode_token(token)
     except jwt.PyJWTError as exc:  # pragma: no cover - error path
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
 
     if payload.get("sub") != settings.admin_username:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
 
+    if "exp" in payload:
+        _cache_admin(token_key, payload["sub"], payload["exp"])
+
     return payload["sub"]
 
 
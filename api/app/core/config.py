@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import functools
 import os
+import re
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Optional
 
-from pydantic import AnyUrl, BaseSettings, Field, validator
+from pydantic import BaseSettings, Field, validator
+
+# "chain[:value]" entries in a comma-separated FEATURE_ENABLED_CHAINS string
+_FLAG_RE = re.compile(r"([^:,]+)(?::([^,]*))?")
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
 
 
 class Settings(BaseSettings):
@@ -15,11 +20,12 @@ class Settings(BaseSettings):
     environment: str = Field("development", env="ENVIRONMENT")
     secret_key: str = Field("changeme", env="SECRET_KEY")
 
-    database_url: AnyUrl = Field(
+    # Plain strings: SQLAlchemy / redis-py parse these URLs themselves
+    database_url: str = Field(
         "postgresql+psycopg://postgres:postgres@db:5432/liquorfy",
         env="DATABASE_URL",
     )
-    redis_url: AnyUrl = Field("redis://redis:6379/0", env="REDIS_URL")
+    redis_url: str = Field("redis://redis:6379/0", env="REDIS_URL")
 
     api_cache_ttl_seconds: int = 600
     default_radius_km: float = 2.0
@@ -29,6 +35,10 @@ class Settings(BaseSettings):
 
     feature_enabled_chains: Dict[str, bool] = Field(default_factory=dict)
 
+    # Private directory (created 0700) for saved scraper browser sessions;
+    # empty means ~/.cache/liquorfy/auth_state
+    scraper_auth_state_dir: str = Field("", env="SCRAPER_AUTH_STATE_DIR")
+
     admin_username: str = Field("admin", env="ADMIN_USERNAME")
     admin_password: str = Field("admin", env="ADMIN_PASSWORD")
 
@@ -101,13 +111,11 @@ class Settings(BaseSettings):
         if isinstance(value, dict):
             return {str(k): bool(v) for k, v in value.items()}
         if isinstance(value, str):
-            items: Iterable[str] = value.split(",")
             result: Dict[str, bool] = {}
-            for item in items:
-                if not item:
-                    continue
-                key, _, raw = item.partition(":")
-                result[key.strip()] = raw.strip().lower() in {"1", "true", "yes"}
+            for match in _FLAG_RE.finditer(value):
+                key = match.group(1).strip()
+                if key:
+                    result[key] = (match.group(2) or "").strip().lower() in _TRUTHY
             return result
         raise ValueError("Unsupported feature flag format")
 
@@ -16,6 +16,11 @@ def configure_logging() -> None:
         format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
         handlers=[logging.StreamHandler(sys.stdout)],
     )
+    # SQL statement logging goes through the normal logger instead of engine
+    # echo, so it is only formatted when the level is actually enabled.
+    logging.getLogger("sqlalchemy.engine").setLevel(
+        logging.INFO if settings.environment == "development" else logging.WARNING
+    )
 
 
 __all__ = ["configure_logging"]
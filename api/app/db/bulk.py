@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import Base
+
+
+async def copy_insert(session: AsyncSession, model: type[Base], rows: list[dict]) -> None:
+    """Write rows with COPY on asyncpg, falling back to one multi-row INSERT elsewhere.
+
+    Only use this for rows that cannot conflict: COPY has no ON CONFLICT.
+    """
+    if not rows:
+        return
+    conn = await session.connection()
+    if conn.dialect.driver != "asyncpg":
+        await session.execute(insert(model), rows)
+        return
+
+    # COPY skips SQLAlchemy's Python-side defaults (e.g. Price.id, Price.currency),
+    # so fill in any the rows don't set. Server defaults still apply.
+    columns = list(rows[0])
+    defaults = [
+        column.default
+        for column in model.__table__.columns
+        if column.name not in columns
+        and column.default is not None
+        and (column.default.is_scalar or column.default.is_callable)
+    ]
+    records = [
+        tuple(row[name] for name in columns)
+        + tuple(d.arg if d.is_scalar else d.arg(None) for d in defaults)
+        for row in rows
+    ]
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        model.__tablename__,
+        records=records,
+        columns=columns + [d.column.name for d in defaults],
+    )
+
+
+__all__ = ["copy_insert"]
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import os
+import time
 import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Computed, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint, text
+from sqlalchemy import Boolean, Computed, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint, literal_column, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from geoalchemy2 import Geography
@@ -14,8 +16,32 @@ from .base import Base
 UUID_TYPE = UUID(as_uuid=True)
 
 
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered UUID (RFC 9562 version 7).
+
+    48-bit Unix millisecond timestamp followed by random bits, so new primary
+    keys land at the right-hand edge of the btree instead of a random leaf.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 def _uuid() -> uuid.UUID:
-    return uuid.uuid4()
+    return uuid7()
+
+
+# uuid7() for rows generated inside an INSERT ... SELECT, where no Python
+# default runs. Postgres 17 has no uuidv7(), so overlay the millisecond clock
+# on the first six bytes of a v4 UUID and set bits 52/53 to turn version 4
+# into 7; the v4 variant bits are already correct.
+UUID7_SQL = literal_column(
+    "encode(set_bit(set_bit(overlay(uuid_send(gen_random_uuid()) placing "
+    "substring(int8send(floor(extract(epoch from clock_timestamp()) * 1000)::bigint) from 3) "
+    "from 1 for 6), 52, 1), 53, 1), 'hex')::uuid",
+    type_=UUID_TYPE,
+)
 
 
 class Store(Base):
@@ -48,7 +74,7 @@ class Store(Base):
     )
     licensing_trust_area: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
 
-    prices: Mapped[list["Price"]] = relationship(back_populates="store")
+    prices: Mapped[list["Price"]] = relationship(back_populates="store", lazy="raise_on_sql")
 
     __table_args__ = (
         UniqueConstraint("chain", "name", name="uq_store_chain_name"),
@@ -62,7 +88,11 @@ class Product(Base):
 
     id: Mapped[uuid.UUID] = mapped_column(UUID_TYPE, primary_key=True, default=_uuid)
     chain: Mapped[str] = mapped_column(String(64), nullable=False)
-    source_product_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    # Byte-wise "C" collation on Postgres: ids are only compared for equality
+    # (upsert conflict probes, IN lookups), never sorted for display.
+    source_product_id: Mapped[str] = mapped_column(
+        String(128).with_variant(String(128, collation="C"), "postgresql"), nullable=False
+    )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     brand: Mapped[Optional[str]] = mapped_column(String(128))
     category: Mapped[Optional[str]] = mapped_column(String(64))
@@ -75,7 +105,7 @@ class Product(Base):
     is_sugar_free: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, server_default="0")
     canonical_product_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID_TYPE, nullable=True)
 
-    prices: Mapped[list["Price"]] = relationship(back_populates="product")
+    prices: Mapped[list["Price"]] = relationship(back_populates="product", lazy="raise_on_sql")
 
     __table_args__ = (
         UniqueConstraint("chain", "source_product_id", name="uq_product_source"),
@@ -103,14 +133,23 @@ class Price(Base):
     price_last_changed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     is_member_only: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
-    product: Mapped[Product] = relationship(back_populates="prices")
-    store: Mapped[Store] = relationship(back_populates="prices")
+    product: Mapped[Product] = relationship(back_populates="prices", lazy="raise_on_sql")
+    store: Mapped[Store] = relationship(back_populates="prices", lazy="raise_on_sql")
 
     __table_args__ = (
         UniqueConstraint("product_id", "store_id", name="uq_price_product_store"),
-        Index("ix_price_price_nzd", "price_nzd"),
-        Index("ix_price_promo_price_nzd", "promo_price_nzd"),
-        Index("ix_price_last_changed", "price_last_changed_at"),
+        Index("ix_price_store_price", "store_id", "price_nzd"),  # Store-scoped price filters/sorts
+        Index(
+            "ix_price_promo",
+            "promo_price_nzd",
+            postgresql_where=text("promo_price_nzd IS NOT NULL"),
+        ),
+        Index(
+            "ix_price_last_changed",
+            "price_last_changed_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),  # Range scans on a near-monotonic timestamp
         Index("ix_price_product_id", "product_id"),  # FK index for JOINs
         Index("ix_price_store_id", "store_id"),  # FK index for JOINs
         Index("ix_price_last_seen", "last_seen_at"),  # For cleanup queries
@@ -181,4 +220,4 @@ class ProductView(Base):
     )
 
 
-__all__ = ["Store", "Product", "Price", "PriceHistory", "IngestionRun", "ProductView"]
+__all__ = ["Store", "Product", "Price", "PriceHistory", "IngestionRun", "ProductView", "UUID7_SQL", "uuid7"]
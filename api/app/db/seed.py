@@ -3,11 +3,11 @@ from __future__ import annotations
 import asyncio
 import random
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4
 
 from sqlalchemy import delete
 
-from app.db.models import Price, PriceHistory, Product, Store
+from app.db.bulk import copy_insert
+from app.db.models import Price, PriceHistory, Product, Store, uuid7
 from app.db.session import get_async_session
 from app.services.canonical import compute_canonical_id
 
@@ -22,23 +22,31 @@ async def seed() -> None:
         await session.execute(delete(Price))
         await session.execute(delete(Product))
         await session.execute(delete(Store))
+
+        # Build every row up front (ids generated in Python) so each table is
+        # written with a single COPY / multi-row INSERT instead of per-row flushes.
         stores = []
         for chain in CHAINS:
             for index in range(3):
-                store = Store(
-                    id=uuid4(),
-                    name=f"{chain.title()} Store {index+1}",
-                    chain=chain,
-                    lat=-36.85 + random.uniform(-0.5, 0.5),
-                    lon=174.76 + random.uniform(-0.5, 0.5),
-                    address=f"{100+index} Example Street",
-                    region="Auckland",
-                )
-                session.add(store)
-                stores.append(store)
-        await session.flush()
+                stores.append({
+                    "id": uuid7(),
+                    "name": f"{chain.title()} Store {index+1}",
+                    "chain": chain,
+                    "lat": -36.85 + random.uniform(-0.5, 0.5),
+                    "lon": 174.76 + random.uniform(-0.5, 0.5),
+                    "address": f"{100+index} Example Street",
+                    "region": "Auckland",
+                })
+
+        stores_by_chain: dict[str, list[dict]] = {chain: [] for chain in CHAINS}
+        for store in stores:
+            stores_by_chain[store["chain"]].append(store)
 
         now = datetime.now(timezone.utc)
+        history_days = [now - timedelta(days=day_offset) for day_offset in range(30, 0, -1)]
+        products = []
+        prices = []
+        history = []
 
         for i in range(60):
             chain = random.choice(CHAINS)
@@ -57,53 +65,55 @@ async def seed() -> None:
                 category=category,
             )
 
-            product = Product(
-                id=uuid4(),
-                chain=chain,
-                source_product_id=f"seed-{i}",
-                name=f"{brand} {category.title()} #{i}",
-                brand=brand,
-                category=category,
-                abv_percent=abv,
-                pack_count=pack_count,
-                unit_volume_ml=unit_volume_ml,
-                total_volume_ml=total_volume,
-                canonical_product_id=canonical_id,
-            )
-            session.add(product)
-            store = random.choice([s for s in stores if s.chain == chain])
+            product_id = uuid7()
+            products.append({
+                "id": product_id,
+                "chain": chain,
+                "source_product_id": f"seed-{i}",
+                "name": f"{brand} {category.title()} #{i}",
+                "brand": brand,
+                "category": category,
+                "abv_percent": abv,
+                "pack_count": pack_count,
+                "unit_volume_ml": unit_volume_ml,
+                "total_volume_ml": total_volume,
+                "canonical_product_id": canonical_id,
+            })
+            store = random.choice(stores_by_chain[chain])
             price_value = random.uniform(15.0, 80.0)
             promo_price = price_value * 0.9 if random.random() < 0.3 else None
-            price = Price(
-                id=uuid4(),
-                product_id=product.id,
-                store_id=store.id,
-                price_nzd=round(price_value, 2),
-                promo_price_nzd=round(promo_price, 2) if promo_price else None,
-                promo_text="10% off" if promo_price else None,
-                last_seen_at=now,
-                price_last_changed_at=now,
-                is_member_only=False,
-            )
-            session.add(price)
-            await session.flush()
+            prices.append({
+                "id": uuid7(),
+                "product_id": product_id,
+                "store_id": store["id"],
+                "price_nzd": round(price_value, 2),
+                "promo_price_nzd": round(promo_price, 2) if promo_price else None,
+                "promo_text": "10% off" if promo_price else None,
+                "last_seen_at": now,
+                "price_last_changed_at": now,
+                "is_member_only": False,
+            })
 
             # Generate 30 days of price history with realistic fluctuations
             base_price = price_value
-            for day_offset in range(30, 0, -1):
-                day = now - timedelta(days=day_offset)
+            for day in history_days:
                 # Simulate small daily price drift (+-5%)
                 daily_price = base_price * random.uniform(0.95, 1.05)
                 daily_promo = daily_price * 0.9 if random.random() < 0.2 else None
-                session.add(PriceHistory(
-                    product_id=product.id,
-                    store_id=store.id,
-                    price_nzd=round(daily_price, 2),
-                    promo_price_nzd=round(daily_promo, 2) if daily_promo else None,
-                    is_member_only=False,
-                    recorded_at=day,
-                ))
+                history.append({
+                    "id": uuid7(),
+                    "product_id": product_id,
+                    "store_id": store["id"],
+                    "price_nzd": round(daily_price, 2),
+                    "promo_price_nzd": round(daily_promo, 2) if daily_promo else None,
+                    "is_member_only": False,
+                    "recorded_at": day,
+                })
 
+        await copy_insert(session, Store, stores)
+        await copy_insert(session, Product, products)
+        await copy_insert(session, Price, prices)
+        await copy_insert(session, PriceHistory, history)
         await session.commit()
 
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import functools
 from contextlib import asynccontextmanager, contextmanager
 from typing import Any, AsyncIterator, Iterator
 
 from sqlalchemy import create_engine
-from sqlalchemy.engine import URL, make_url
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
@@ -14,8 +16,6 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import get_settings
 
-_settings = get_settings()
-
 _TRUTHY = {"1", "true", "yes", "on"}
 
 def _is_truthy(value: str | None) -> bool:
@@ -63,63 +63,69 @@ def _adapt_urls(raw_url: str) -> tuple[URL, URL, dict[str, Any], dict[str, Any]]
     # SQLite or anything else: just reuse as-is
     return url, url, {}, {}
 
-_async_url, _sync_url, _async_connect_args, _sync_connect_args = _adapt_urls(_settings.database_url)
-
 # Tweak these via settings if you want
-ECHO = _settings.environment == "development"
 POOL_PRE_PING = True
 # Connection pool settings - tune based on available RAM:
 # - 1GB RAM: pool_size=10, max_overflow=10 (~20 max connections)
 # - 2GB RAM: pool_size=20, max_overflow=20 (~40 max connections)
 # - 4GB+ RAM: pool_size=30, max_overflow=30 (~60 max connections)
-POOL_SIZE = getattr(_settings, "db_pool_size", 10)
-MAX_OVERFLOW = getattr(_settings, "db_max_overflow", 10)
-POOL_TIMEOUT = getattr(_settings, "db_pool_timeout", 30)
-POOL_RECYCLE = getattr(_settings, "db_pool_recycle", 1800)  # Recycle connections after 30 min
-
-# Engines
-_async_engine = create_async_engine(
-    _async_url,
-    echo=ECHO,
-    connect_args=_async_connect_args,
-    pool_pre_ping=POOL_PRE_PING,
-    pool_size=POOL_SIZE,
-    max_overflow=MAX_OVERFLOW,
-    pool_timeout=POOL_TIMEOUT,
-    pool_recycle=POOL_RECYCLE,
-    future=True,
-)
+POOL_SIZE = 10
+MAX_OVERFLOW = 10
+POOL_TIMEOUT = 30
+POOL_RECYCLE = 1800  # Recycle connections after 30 min
 
-_sync_engine = create_engine(
-    _sync_url,
-    echo=ECHO,
-    connect_args=_sync_connect_args,
-    pool_pre_ping=POOL_PRE_PING,
-    pool_size=POOL_SIZE,
-    max_overflow=MAX_OVERFLOW,
-    pool_timeout=POOL_TIMEOUT,
-    pool_recycle=POOL_RECYCLE,
-    future=True,
-)
 
-# Session factories
-_async_session_factory = async_sessionmaker(
-    bind=_async_engine,
-    expire_on_commit=False,
-    autoflush=False,
-)
+def _engine_options() -> dict[str, Any]:
+    settings = get_settings()
+    return {
+        "pool_pre_ping": POOL_PRE_PING,
+        "pool_size": getattr(settings, "db_pool_size", POOL_SIZE),
+        "max_overflow": getattr(settings, "db_max_overflow", MAX_OVERFLOW),
+        "pool_timeout": getattr(settings, "db_pool_timeout", POOL_TIMEOUT),
+        "pool_recycle": getattr(settings, "db_pool_recycle", POOL_RECYCLE),
+        "future": True,
+    }
 
-_session_factory = sessionmaker(
-    bind=_sync_engine,
-    expire_on_commit=False,
-    autoflush=False,
-)
+
+# Engines are built lazily on first use so importing this module stays cheap
+# (no URL parsing, driver imports or pool setup until a session is needed).
+
+@functools.lru_cache()
+def get_async_engine() -> AsyncEngine:
+    async_url, _, async_connect_args, _ = _adapt_urls(get_settings().database_url)
+    return create_async_engine(async_url, connect_args=async_connect_args, **_engine_options())
+
+
+@functools.lru_cache()
+def get_sync_engine() -> Engine:
+    _, sync_url, _, sync_connect_args = _adapt_urls(get_settings().database_url)
+    return create_engine(sync_url, connect_args=sync_connect_args, **_engine_options())
+
+
+# Session factories
+@functools.lru_cache()
+def _get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=get_async_engine(),
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+
+@functools.lru_cache()
+def _get_session_factory() -> sessionmaker[Session]:
+    return sessionmaker(
+        bind=get_sync_engine(),
+        expire_on_commit=False,
+        autoflush=False,
+    )
 
 # --- Plain "hand-me-a-session" dependencies (caller manages commit/rollback) ---
 
 @asynccontextmanager
 async def get_async_session() -> AsyncIterator[AsyncSession]:
-    async with _async_session_factory() as session:
+    factory = _get_async_session_factory()
+    async with factory() as session:
         try:
             yield session
         finally:
@@ -128,14 +134,21 @@ async def get_async_session() -> AsyncIterator[AsyncSession]:
 
 @contextmanager
 def get_session() -> Iterator[Session]:
-    with _session_factory() as session:
+    factory = _get_session_factory()
+    with factory() as session:
         yield session  # contextmanager closes it automatically
 
+async def db_dep() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency: request-scoped session via ``Depends(db_dep)``."""
+    async with get_async_session() as session:
+        yield session
+
 # --- Transactional helpers (auto-commit / rollback) ---
 
 @asynccontextmanager
 async def async_transaction() -> AsyncIterator[AsyncSession]:
-    async with _async_session_factory() as session:
+    factory = _get_async_session_factory()
+    async with factory() as session:
         try:
             yield session
             await session.commit()
@@ -147,7 +160,8 @@ async def async_transaction() -> AsyncIterator[AsyncSession]:
 
 @contextmanager
 def transaction() -> Iterator[Session]:
-    with _session_factory() as session:
+    factory = _get_session_factory()
+    with factory() as session:
         try:
             yield session
             session.commit()
@@ -159,15 +173,28 @@ def transaction() -> Iterator[Session]:
 
 async def dispose_engines() -> None:
     """Call on application shutdown to cleanly close pools."""
-    await _async_engine.dispose()
-    _sync_engine.dispose()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    if get_sync_engine.cache_info().currsize:
+        get_sync_engine().dispose()
+
+def __getattr__(name: str) -> Any:
+    # Backwards-compatible module attributes for the engines, built on first access
+    if name == "_async_engine":
+        return get_async_engine()
+    if name == "_sync_engine":
+        return get_sync_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "get_async_session",
     "get_session",
+    "db_dep",
     "async_transaction",
     "transaction",
     "dispose_engines",
+    "get_async_engine",
+    "get_sync_engine",
     "_async_engine",
     "_sync_engine",
 ]
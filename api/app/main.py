@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, AsyncIterator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -18,13 +19,24 @@ from app.middleware import (
     get_limiter,
 )
 from app.routes import alerts, auth, health, ingest, products, stores, user, worker
+from app.scrapers.api_auth_base import close_shared_browser
+from app.scrapers.base import close_shared_client
 
 configure_logging()
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-app = FastAPI(title=settings.app_name)
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Ingest jobs run scrapers in-process; release their shared client/browser.
+    await close_shared_client()
+    await close_shared_browser()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 # Rate limiting
 limiter = get_limiter()
@@ -24,7 +24,7 @@ def get_limiter() -> Limiter:
     # Use Redis in production for distributed rate limiting
     if settings.environment == "production":
         # Convert redis://host:port/db to redis://host:port format
-        redis_url = str(settings.redis_url)
+        redis_url = settings.redis_url
         storage_uri = redis_url
     else:
         # Development: use in-memory storage
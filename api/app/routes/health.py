@@ -8,12 +8,10 @@ from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
 
-from app.core.config import get_settings
 from app.db.session import async_transaction
 from app.services.cache import get_redis_client
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 router = APIRouter(tags=["health"])
 
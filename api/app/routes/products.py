@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import json
+import functools
 from typing import Optional
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import get_settings
-from app.db.session import async_transaction, get_async_session
+from app.core.config import Settings, get_settings
+from app.db.session import async_transaction, db_dep, get_async_session
 from app.schemas.products import ProductDetailSchema, ProductListResponse, ProductSchema
 from app.schemas.queries import ProductQueryParams
 from app.services.cache import cached_json
@@ -16,7 +18,16 @@ from app.services.search import fetch_autocomplete, fetch_popular, fetch_product
 from app.services.views import record_product_view
 
 router = APIRouter(prefix="/products", tags=["products"])
-settings = get_settings()
+
+
+@functools.lru_cache(maxsize=512)
+def _split_csv(value: str) -> tuple[str, ...]:
+    # Filter values (chains, categories, store ids) repeat across requests,
+    # so most calls are a cache hit rather than a split/strip pass.
+    if "," not in value:
+        value = value.strip()
+        return (value,) if value else ()
+    return tuple(candidate for part in value.split(",") if (candidate := part.strip()))
 
 
 def _split_csv_params(values: Optional[list[str]]) -> list[str]:
@@ -24,10 +35,7 @@ def _split_csv_params(values: Optional[list[str]]) -> list[str]:
         return []
     items: list[str] = []
     for value in values:
-        for part in value.split(","):
-            candidate = part.strip()
-            if candidate:
-                items.append(candidate)
+        items.extend(_split_csv(value))
     return items
 
 
@@ -86,7 +94,11 @@ async def _params(
 
 
 @router.get("", response_model=ProductListResponse)
-async def list_products(params: ProductQueryParams = Depends(_params)) -> ProductListResponse:
+async def list_products(
+    params: ProductQueryParams = Depends(_params),
+    session: AsyncSession = Depends(db_dep),
+    settings: Settings = Depends(get_settings),
+) -> ProductListResponse:
     # Allow location-optional queries for:
     # 1. Small promo queries (landing page top deals) — high cache hit rate
     # 2. Text searches (user searched from hero before enabling location)
@@ -119,15 +131,14 @@ async def list_products(params: ProductQueryParams = Depends(_params)) -> Produc
                 detail="Search radius cannot exceed 10km"
             )
 
-    async with get_async_session() as session:
-        cache_key = json.dumps(params.dict(), sort_keys=True)
+    cache_key = orjson.dumps(params.dict(), option=orjson.OPT_SORT_KEYS).decode()
 
-        async def producer() -> dict:
-            response = await fetch_products(session, params)
-            return json.loads(response.json())
+    async def producer() -> dict:
+        response = await fetch_products(session, params)
+        return orjson.loads(response.json())
 
-        payload = await cached_json(cache_key, settings.api_cache_ttl_seconds, producer)
-        return ProductListResponse.parse_obj(payload)
+    payload = await cached_json(cache_key, settings.api_cache_ttl_seconds, producer)
+    return ProductListResponse.parse_obj(payload)
 
 
 class AutocompleteItem(BaseModel):
@@ -144,6 +155,7 @@ class AutocompleteItem(BaseModel):
 async def autocomplete(
     q: str = Query(..., min_length=2, max_length=100),
     limit: int = Query(8, ge=1, le=20),
+    settings: Settings = Depends(get_settings),
 ) -> list[AutocompleteItem]:
     """Fast fuzzy autocomplete — no store/price joins, trigram-ranked."""
     cache_key = f"autocomplete:{q.lower().strip()}:{limit}"
@@ -195,6 +207,7 @@ async def product_detail(
     lat: Optional[float] = Query(None),
     lon: Optional[float] = Query(None),
     radius_km: Optional[float] = Query(None),
+    settings: Settings = Depends(get_settings),
 ) -> ProductDetailSchema:
     loc_suffix = ""
     if lat is not None and lon is not None and radius_km is not None:
@@ -209,7 +222,7 @@ async def product_detail(
                 )
             except ValueError as exc:
                 raise HTTPException(status_code=404, detail=str(exc)) from exc
-            return json.loads(product.json())
+            return orjson.loads(product.json())
 
     payload = await cached_json(cache_key, settings.api_cache_ttl_seconds, producer)
     return ProductDetailSchema.parse_obj(payload)
@@ -223,16 +236,18 @@ class BatchProductsRequest(BaseModel):
 
 
 @router.post("/batch", response_model=list[ProductSchema])
-async def batch_products(body: BatchProductsRequest) -> list[ProductSchema]:
+async def batch_products(
+    body: BatchProductsRequest,
+    session: AsyncSession = Depends(db_dep),
+) -> list[ProductSchema]:
     """Fetch multiple products by ID. Used for favourites/watchlists."""
     if not body.ids:
         return []
 
-    async with get_async_session() as session:
-        return await fetch_products_by_ids(
-            session,
-            body.ids,
-            lat=body.lat,
-            lon=body.lon,
-            radius_km=body.radius_km,
-        )
+    return await fetch_products_by_ids(
+        session,
+        body.ids,
+        lat=body.lat,
+        lon=body.lon,
+        radius_km=body.radius_km,
+    )
@@ -8,13 +8,12 @@ import httpx
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import text
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
 from app.core.user_auth import get_current_user
 from app.db.session import async_transaction, get_async_session
 from app.schemas.user import UserPreferencesResponse, UserPreferencesUpdate
 
 logger = logging.getLogger(__name__)
-settings = get_settings()
 
 router = APIRouter(prefix="/user", tags=["user"])
 
@@ -93,7 +92,10 @@ async def upsert_preferences(
 
 
 @router.delete("/account", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_account(user_id: UUID = Depends(get_current_user)):
+async def delete_account(
+    user_id: UUID = Depends(get_current_user),
+    settings: Settings = Depends(get_settings),
+):
     """Delete the current user's account and all associated data.
 
     Calls the Supabase Admin API to delete the auth user.
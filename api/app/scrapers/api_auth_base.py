@@ -7,10 +7,19 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import re
+import stat
+import time
+from pathlib import Path
 from typing import Optional
+from urllib.parse import urlparse
 
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, Playwright, Route, async_playwright
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from app.core.config import get_settings
 
 try:
     from undetected_playwright.tarnished import Malenia
@@ -20,6 +29,105 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Extra time for cookies to settle after the auth token has been seen
+TOKEN_SETTLE_SECONDS = 0.5
+
+# Auth only needs the document, scripts and XHR; skip the heavy static assets.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Saved cookies/storage from the last successful auth, reused to skip Cloudflare.
+# They hold session credentials, so the directory and files are owner-only.
+AUTH_STATE_DIR = Path(
+    get_settings().scraper_auth_state_dir
+    or Path.home() / ".cache" / "liquorfy" / "auth_state"
+).expanduser()
+AUTH_STATE_TTL_SECONDS = 6 * 60 * 60
+
+# How long a captured token/cookie set is reused before authenticating again
+AUTH_TOKEN_TTL_SECONDS = 30 * 60
+
+BROWSER_LAUNCH_ARGS = [
+    "--no-sandbox",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+]
+
+
+class _BrowserPool:
+    """
+    Process-wide Chromium shared by every browser auth.
+
+    Launching Playwright + Chromium costs seconds; a fresh BrowserContext on an
+    already running browser is cheap and just as isolated (own cookies/storage).
+    One browser is kept per headless mode, relaunched if it disconnects or if
+    the event loop it was started on is gone.
+    """
+
+    def __init__(self) -> None:
+        self._playwright: Optional[Playwright] = None
+        self._browsers: dict[bool, Browser] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _bind_loop(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Playwright objects can't cross event loops; forget the old ones.
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._playwright = None
+            self._browsers = {}
+        return self._lock
+
+    async def get_browser(self, headless: bool) -> Browser:
+        async with self._bind_loop():
+            browser = self._browsers.get(headless)
+            if browser is None or not browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                browser = await self._playwright.chromium.launch(
+                    headless=headless,
+                    args=BROWSER_LAUNCH_ARGS,
+                )
+                self._browsers[headless] = browser
+            return browser
+
+    async def close(self) -> None:
+        async with self._bind_loop():
+            for browser in self._browsers.values():
+                try:
+                    await browser.close()
+                except Exception as e:
+                    logger.debug(f"Error closing shared auth browser: {e}")
+            self._browsers = {}
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+
+_browser_pool = _BrowserPool()
+
+# Credentials outlive the scraper instance that captured them: the worker
+# builds a fresh scraper per run. Keyed by site_url.
+_auth_cache: dict[str, tuple[float, str, dict]] = {}
+_auth_locks: dict[str, asyncio.Lock] = {}
+
+
+async def close_shared_browser() -> None:
+    """Close the shared auth browser. Call once on worker shutdown."""
+    await _browser_pool.close()
+
+
+async def _block_static_assets(route: Route) -> None:
+    try:
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    except PlaywrightError as e:
+        if "Target page, context or browser has been closed" not in str(e):
+            raise
+
 
 class APIAuthBase:
     """
@@ -107,49 +215,135 @@ class APIAuthBase:
 
         return None, None
 
+    async def ensure_auth(self, ttl: float = AUTH_TOKEN_TTL_SECONDS, *, refresh: bool = False) -> Optional[str]:
+        """
+        Return a usable auth token, authenticating only when the cached one is
+        missing or older than ``ttl`` seconds.
+
+        Tokens and cookies are cached per site for the whole process. A lock
+        per site makes concurrent callers wait for one authentication instead
+        of each launching their own. Pass ``refresh=True`` when the cached
+        token has been rejected.
+        """
+        cached = _auth_cache.get(self.site_url)
+        if not refresh and cached and time.monotonic() < cached[0]:
+            _, self.auth_token, self.cookies = cached
+            return self.auth_token
+
+        async with _auth_locks.setdefault(self.site_url, asyncio.Lock()):
+            cached = _auth_cache.get(self.site_url)
+            if cached and time.monotonic() < cached[0] and not (refresh and cached[1] == self.auth_token):
+                # Someone else authenticated while we waited for the lock
+                _, self.auth_token, self.cookies = cached
+                return self.auth_token
+
+            _auth_cache.pop(self.site_url, None)
+            self.auth_token = await self._get_auth_token()
+            if self.auth_token:
+                _auth_cache[self.site_url] = (time.monotonic() + ttl, self.auth_token, dict(self.cookies))
+            return self.auth_token
+
+    async def _get_auth_token(self) -> Optional[str]:
+        """Obtain fresh credentials; subclasses with a cheaper path override this."""
+        return await self._get_auth_via_browser()
+
+    def _storage_state_path(self) -> Optional[Path]:
+        """Where this site's browser storage state is cached between auths.
+
+        None if AUTH_STATE_DIR can't be kept private to this user, in which
+        case storage state is neither saved nor reused.
+        """
+        try:
+            AUTH_STATE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+            st = AUTH_STATE_DIR.lstat()
+            if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid():
+                logger.warning(f"Not using auth state dir {AUTH_STATE_DIR}: not a directory we own")
+                return None
+            if stat.S_IMODE(st.st_mode) & 0o077:
+                AUTH_STATE_DIR.chmod(0o700)
+        except OSError as e:
+            logger.warning(f"Auth state dir {AUTH_STATE_DIR} unavailable: {e}")
+            return None
+        host = urlparse(self.site_url).hostname or "site"
+        return AUTH_STATE_DIR / f"auth_{host}.json"
+
+    @staticmethod
+    def _storage_state_is_fresh(path: Path) -> bool:
+        """A regular, owner-only file of ours written within AUTH_STATE_TTL_SECONDS."""
+        try:
+            st = path.lstat()
+        except OSError:
+            return False
+        if (
+            not stat.S_ISREG(st.st_mode)
+            or st.st_uid != os.getuid()
+            or stat.S_IMODE(st.st_mode) & 0o077
+        ):
+            logger.warning(f"Ignoring auth state {path}: not a private file owned by this user")
+            return False
+        return time.time() - st.st_mtime < AUTH_STATE_TTL_SECONDS
+
     async def _get_auth_via_browser(
         self,
         *,
         capture_token: bool = True,
         capture_cookies: bool = True,
-        headless: bool = False,
+        headless: bool = True,
         wait_time: float = 10.0
     ) -> Optional[str]:
         """
         Open browser to bypass bot detection and capture auth credentials.
 
+        The storage state of a successful auth is saved to disk and reused for
+        AUTH_STATE_TTL_SECONDS, so a still-valid Cloudflare clearance skips the
+        challenge. If the saved state no longer yields credentials it is
+        discarded and the full flow runs from a clean context.
+
         Args:
             capture_token: Whether to capture JWT token from network requests
             capture_cookies: Whether to capture session cookies
-            headless: Run browser in headless mode (False recommended for Cloudflare)
-            wait_time: Time to wait for API calls and cookies (seconds)
+            headless: Run browser in headless mode (pass False to watch it while debugging)
+            wait_time: Max time to wait for API calls and cookies (seconds); returns
+                early once the token is captured
 
         Returns:
             Auth token if capture_token=True, else None
         """
         logger.info(f"Obtaining auth credentials via browser for {self.site_url}...")
 
-        token = None
+        browser = await _browser_pool.get_browser(headless)
+        state_path = self._storage_state_path()
+        options = dict(capture_token=capture_token, capture_cookies=capture_cookies, wait_time=wait_time)
+
+        if state_path and self._storage_state_is_fresh(state_path):
+            token = await self._auth_in_new_context(browser, state_path, **options)
+            if token or (not capture_token and self.cookies):
+                return token
+            logger.info("Saved browser session yielded no credentials; running full auth")
+            state_path.unlink(missing_ok=True)
 
-        async with async_playwright() as p:
-            launch_args = [
-                "--no-sandbox",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-dev-shm-usage",
-            ]
-
-            browser = await p.chromium.launch(
-                headless=headless,
-                args=launch_args
-            )
-
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                viewport={"width": 1920, "height": 1080},
-                locale="en-NZ",
-                timezone_id="Pacific/Auckland",
-            )
+        return await self._auth_in_new_context(browser, None, **options)
 
+    async def _auth_in_new_context(
+        self,
+        browser: Browser,
+        storage_state: Optional[Path],
+        *,
+        capture_token: bool,
+        capture_cookies: bool,
+        wait_time: float,
+    ) -> Optional[str]:
+        """Run one auth attempt in a fresh context, optionally seeded with a saved storage state."""
+        token = None
+        context = await browser.new_context(
+            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+            viewport={"width": 1920, "height": 1080},
+            locale="en-NZ",
+            timezone_id="Pacific/Auckland",
+            storage_state=str(storage_state) if storage_state else None,
+        )
+
+        try:
             # Apply stealth if available
             if STEALTH_AVAILABLE:
                 try:
@@ -158,7 +352,10 @@ class APIAuthBase:
                 except Exception as e:
                     logger.warning(f"Failed to apply stealth: {e}")
 
+            await context.route("**/*", _block_static_assets)
+
             page = await context.new_page()
+            token_captured = asyncio.Event()
 
             # Capture token from network requests if requested
             if capture_token and self.api_domain:
@@ -171,6 +368,10 @@ class APIAuthBase:
                     if normalized:
                         token = normalized
                         logger.info(f"Captured auth token from {source}: {token[:50]}...")
+                        token_captured.set()
+                        # Stop receiving per-request events once we have what we need
+                        page.remove_listener("request", on_request)
+                        page.remove_listener("response", on_response)
 
                 def on_request(request) -> None:
                     if self.api_domain in request.url:
@@ -185,11 +386,12 @@ class APIAuthBase:
                 page.on("response", on_response)
 
             try:
-                # Navigate to site
+                # Navigate to site. Don't wait for the load event: the token is
+                # caught by the network listeners whenever its API call fires.
                 await page.goto(
                     self.site_url,
-                    wait_until="load",
-                    timeout=60000
+                    wait_until="domcontentloaded",
+                    timeout=30000
                 )
 
                 # Wait for potential Cloudflare challenge
@@ -197,15 +399,27 @@ class APIAuthBase:
                 challenge = await page.query_selector('text="Just a moment"')
                 if challenge:
                     logger.info("Waiting for Cloudflare challenge to resolve...")
-                    for i in range(30):
-                        await asyncio.sleep(1)
-                        challenge = await page.query_selector('text="Just a moment"')
-                        if not challenge:
-                            logger.info("Cloudflare challenge resolved")
-                            break
-
-                # Wait for page to fully load and API calls to trigger
-                await asyncio.sleep(wait_time)
+                    try:
+                        await page.wait_for_selector(
+                            'text="Just a moment"', state="detached", timeout=30000
+                        )
+                        logger.info("Cloudflare challenge resolved")
+                    except PlaywrightTimeoutError:
+                        logger.warning("Cloudflare challenge still present after 30s")
+
+                # Wait for API calls to trigger; wait_time is only an upper bound
+                # when we're listening for the token.
+                if capture_token and self.api_domain:
+                    try:
+                        await asyncio.wait_for(token_captured.wait(), timeout=wait_time)
+                    except asyncio.TimeoutError:
+                        pass
+                    else:
+                        if capture_cookies:
+                            # Let cookies set alongside the token's API call land
+                            await asyncio.sleep(TOKEN_SETTLE_SECONDS)
+                else:
+                    await asyncio.sleep(wait_time)
 
                 # Fallback: extract token from local/session storage
                 if capture_token and not token:
@@ -241,12 +455,17 @@ class APIAuthBase:
                             token = cookie_token
                             logger.info(f"Captured auth token from cookie '{cookie_key}'")
 
+                state_path = self._storage_state_path()
+                if state_path and (token or (not capture_token and self.cookies)):
+                    await context.storage_state(path=str(state_path))
+                    state_path.chmod(0o600)
+
             except Exception as e:
                 logger.error(f"Error during browser auth: {e}")
-            finally:
-                await browser.close()
+        finally:
+            await context.close()
 
         return token
 
 
-__all__ = ["APIAuthBase"]
+__all__ = ["APIAuthBase", "close_shared_browser"]
@@ -3,21 +3,151 @@ from __future__ import annotations
 import abc
 import asyncio
 import logging
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from typing import AsyncIterator, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from httpx import AsyncClient
-from sqlalchemy import select
+from httpx import AsyncClient, AsyncHTTPTransport, Limits, Response, TransportError
+from sqlalchemy import (
+    Boolean, DateTime, Float, String, bindparam, case, cast, column, literal, literal_column, or_, select,
+    true, update, values,
+)
 from sqlalchemy.dialects.postgresql import insert
 
 from app.core.config import get_settings
-from app.db.models import IngestionRun, Price, PriceHistory, Product, Store
+from app.db.bulk import copy_insert
+from app.db.models import UUID7_SQL, UUID_TYPE, IngestionRun, Price, PriceHistory, Product, Store
 from app.db.session import async_transaction
+from app.services.canonical import attach_canonical_id, compute_canonical_id
+from app.services.parser_utils import (
+    detect_sugar_free, extract_abv, infer_brand, infer_category, parse_volume,
+)
 
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
+PRODUCT_UPSERT_CHUNK_SIZE = 1000
 PRICE_UPSERT_CHUNK_SIZE = 2000
+EXISTING_PRICES_YIELD_PER = 1000
+PARSE_CONCURRENCY = 5
+HTTP_LIMITS = Limits(max_connections=100, max_keepalive_connections=20)
+HTTP_RETRIES = 2
+# Application-level retries (get_with_retry) for throttling and 5xx responses
+FETCH_RETRIES = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 30.0
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+STORES_CACHE_TTL_SECONDS = 600
+_WINE_CATS = frozenset({"wine", "red_wine", "white_wine", "rose", "sparkling", "champagne", "fortified_wine"})
+_SPIRIT_CATS = frozenset({"spirits", "vodka", "gin", "rum", "whisky", "bourbon", "scotch", "tequila", "brandy", "liqueur"})
+
+# Built once; every chain reuses the same statement (and its compiled form)
+_CHAIN_STORES_STMT = select(Store).where(Store.chain == bindparam("chain"))
+
+_shared_client: Optional[AsyncClient] = None
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_stores_cache: Dict[str, Tuple[float, List[Store]]] = {}
+
+
+def get_shared_client() -> AsyncClient:
+    """Return the process-wide HTTP/2 client shared by every Scraper.
+
+    Sharing one pool lets catalog requests reuse TLS connections across
+    scrapers and multiplex over HTTP/2. Callers must not mutate its headers;
+    pass per-request headers instead.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = AsyncClient(
+            timeout=20,
+            transport=AsyncHTTPTransport(
+                http2=True, limits=HTTP_LIMITS, retries=HTTP_RETRIES
+            ),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared scraper HTTP client, if one was ever created."""
+    global _shared_client
+    client, _shared_client = _shared_client, None
+    if client is not None:
+        await client.aclose()
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """Return the process-wide worker pool for CPU-bound page parsing.
+
+    Scrapers run one after another, so a single pool sized to the CPU count
+    serves every chain that parses off the event loop.
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _parse_pool
+
+
+def discard_parse_pool() -> None:
+    """Drop the parse pool (e.g. after a worker died); the next call starts afresh."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+def _retry_after_seconds(response: Response) -> Optional[float]:
+    """Numeric Retry-After header, capped at RETRY_MAX_DELAY; None if absent or a date."""
+    try:
+        return min(float(response.headers["retry-after"]), RETRY_MAX_DELAY)
+    except (KeyError, ValueError):
+        return None
+
+
+async def get_with_retry(client: AsyncClient, url: str, **kwargs: Any) -> Response:
+    """
+    GET with exponential backoff and full jitter on transport errors and
+    429/5xx responses, honouring a numeric Retry-After. The last attempt's
+    response is returned (or its error raised) as-is. ``kwargs`` are passed
+    to ``client.get``.
+    """
+    for attempt in range(FETCH_RETRIES):
+        backoff = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+        try:
+            response = await client.get(url, **kwargs)
+        except TransportError as e:
+            delay = backoff
+            logger.warning(f"{url}: {type(e).__name__}, retrying in {delay:.1f}s")
+        else:
+            if response.status_code not in RETRYABLE_STATUSES:
+                return response
+            delay = _retry_after_seconds(response)
+            if delay is None:
+                delay = backoff
+            logger.warning(f"{url}: HTTP {response.status_code}, retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+    return await client.get(url, **kwargs)
+
+
+async def get_chain_stores(session, chain: str) -> List[Store]:
+    """Return a chain's stores, cached per process for STORES_CACHE_TTL_SECONDS.
+
+    Store lists change over days, not between scrapes. Sessions use
+    expire_on_commit=False, so the cached Store objects stay readable after
+    their session closes; treat them as read-only.
+    """
+    cached = _stores_cache.get(chain)
+    if cached and time.monotonic() - cached[0] < STORES_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    result = await session.execute(_CHAIN_STORES_STMT, {"chain": chain})
+    stores = list(result.scalars().all())
+    # Don't cache an empty list: the chain's stores may be about to be seeded.
+    if stores:
+        _stores_cache[chain] = (time.monotonic(), stores)
+    return stores
 
 
 class Scraper(abc.ABC):
@@ -26,7 +156,7 @@ class Scraper(abc.ABC):
     _sweep_per_store: bool = False  # Override in per-store scrapers
 
     def __init__(self, use_fixtures: bool = True) -> None:
-        self.client = AsyncClient(timeout=20)
+        self.client = get_shared_client()
         self.use_fixtures = use_fixtures
         self._run_started_at: Optional[datetime] = None
 
@@ -41,67 +171,58 @@ class Scraper(abc.ABC):
             started_at=self._run_started_at,
         )
 
+        # The run row and the store lookup share one short transaction; the run
+        # must be committed before page writes so it is visible (and
+        # recoverable by the worker's zombie cleanup) while the scrape runs.
         async with async_transaction() as session:
             session.add(run)
             await session.flush()
 
+            # Get all stores for this chain
+            stores = await get_chain_stores(session, self.chain)
+
+        if not stores:
+            logger.warning(f"No stores found for chain {self.chain}")
+            stores = []
+
         try:
             total_items = 0
             changed_items = 0
             failed_items = 0
 
+            # Stream pages and parse them PARSE_CONCURRENCY at a time; each
+            # page is still persisted in its own transaction so long-running
+            # scrapers retain partial progress even if interrupted.
+            # changed_count is DB row-level (product/store upserts), while
+            # total_items is product-level; do not derive failures from
+            # changed_count or it can go negative.
+            async for window in self._stream_page_windows():
+                total, changed, failed = await self._parse_and_persist(window, stores)
+                total_items += total
+                changed_items += changed
+                failed_items += failed
+
             async with async_transaction() as session:
-                # Get all stores for this chain
-                result = await session.execute(
-                    select(Store).where(Store.chain == self.chain)
-                )
-                stores = result.scalars().all()
-
-                if not stores:
-                    logger.warning(f"No stores found for chain {self.chain}")
-                    stores = []
-
-            # Stream pages and persist each page in its own transaction so
-            # long-running scrapers retain partial progress even if interrupted.
-            async for page in self.stream_catalog_pages():
-                try:
-                    products = await self.parse_products(page)
-                    total_items += len(products)
-
-                    async with async_transaction() as session:
-                        changed_count = await self._upsert_products_batch(
-                            session, products, stores
-                        )
-                    changed_items += changed_count
-                    # changed_count is DB row-level (product/store upserts),
-                    # while total_items is product-level; do not derive failures
-                    # from changed_count or it can go negative.
-
-                except Exception as e:
-                    logger.error(f"Failed to parse page: {e}")
-                    failed_items += 1
-
-            # Update ingestion run with results
-            async with async_transaction() as session:
-                result = await session.execute(
-                    select(IngestionRun).where(IngestionRun.id == run.id)
+                # Update ingestion run with results
+                await self._finish_run(
+                    session,
+                    run,
+                    status="completed",
+                    items_total=total_items,
+                    items_changed=changed_items,
+                    items_failed=failed_items,
                 )
-                run = result.scalar_one()
-                run.status = "completed"
-                run.finished_at = datetime.now(timezone.utc)
-                run.items_total = total_items
-                run.items_changed = changed_items
-                run.items_failed = failed_items
-
-            # Sweep stale promos (chain-wide scrapers only)
-            if not self._sweep_per_store and self._run_started_at:
-                try:
-                    from app.services.freshness import sweep_chain_promos
-
-                    async with async_transaction() as session:
-                        await sweep_chain_promos(session, self.chain, self._run_started_at)
-                except Exception as e:
-                    logger.warning(f"Promo sweep failed for chain={self.chain}: {e}")
+
+                # Sweep stale promos (chain-wide scrapers only). The SAVEPOINT
+                # lets a failed sweep roll back without losing the run update.
+                if not self._sweep_per_store and self._run_started_at:
+                    try:
+                        from app.services.freshness import sweep_chain_promos
+
+                        async with session.begin_nested():
+                            await sweep_chain_promos(session, self.chain, self._run_started_at)
+                    except Exception as e:
+                        logger.warning(f"Promo sweep failed for chain={self.chain}: {e}")
 
             logger.info(
                 f"Scraper completed: {total_items} items, "
@@ -113,28 +234,71 @@ class Scraper(abc.ABC):
             logger.error(f"Scraper cancelled: {self.chain}")
             # Update run status to failed so timed-out runs are not left "running"
             async with async_transaction() as session:
-                result = await session.execute(
-                    select(IngestionRun).where(IngestionRun.id == run.id)
+                await self._finish_run(
+                    session, run, status="failed", error_message="Cancelled (timeout)"
                 )
-                run = result.scalar_one()
-                run.status = "failed"
-                run.finished_at = datetime.now(timezone.utc)
-                run.error_message = "Cancelled (timeout)"
             raise
 
         except Exception as e:
             logger.error(f"Scraper failed: {e}")
             # Update run status to failed
             async with async_transaction() as session:
-                result = await session.execute(
-                    select(IngestionRun).where(IngestionRun.id == run.id)
+                await self._finish_run(
+                    session,
+                    run,
+                    status="failed",
+                    error_message=f"{type(e).__name__}: {e}"[:1000],
                 )
-                run = result.scalar_one()
-                run.status = "failed"
-                run.finished_at = datetime.now(timezone.utc)
-                run.error_message = f"{type(e).__name__}: {e}"[:1000]
             raise
 
+    async def _finish_run(self, session, run: IngestionRun, **values) -> None:
+        """Write the final state of an ingestion run with a single UPDATE by id."""
+        values["finished_at"] = datetime.now(timezone.utc)
+        await session.execute(
+            update(IngestionRun).where(IngestionRun.id == run.id).values(**values)
+        )
+        # Mirror the written values on the (detached) instance returned to callers
+        for key, value in values.items():
+            setattr(run, key, value)
+
+    async def _parse_and_persist(
+        self, pages: List[str], stores: List[Store]
+    ) -> Tuple[int, int, int]:
+        """Parse a window of pages concurrently, then persist them in order.
+
+        Returns (total_items, changed_items, failed_pages) for the window.
+        """
+        results = await self.parse_all(pages)
+        total = changed = failed = 0
+        for products in results:
+            if isinstance(products, asyncio.CancelledError):
+                raise products
+            if isinstance(products, Exception):
+                logger.error(f"Failed to parse page: {products}")
+                failed += 1
+                continue
+            total += len(products)
+            try:
+                async with async_transaction() as session:
+                    changed += await self._upsert_products_batch(
+                        session, products, stores
+                    )
+            except Exception as e:
+                logger.error(f"Failed to persist page: {e}")
+                failed += 1
+        return total, changed, failed
+
+    async def parse_all(self, pages: List[Any]) -> List[Any]:
+        """Parse a window of pages, one result per page in order.
+
+        A page that fails to parse yields its exception instead of a product
+        list. Scrapers that can batch the work override this.
+        """
+        return await asyncio.gather(
+            *(self.parse_products(page) for page in pages),
+            return_exceptions=True,
+        )
+
     def build_product_dict(
         self,
         *,
@@ -174,12 +338,6 @@ class Scraper(abc.ABC):
         Returns:
             Standardized product dictionary
         """
-        from app.services.parser_utils import (
-            parse_volume, extract_abv, infer_brand, infer_category,
-            detect_sugar_free,
-        )
-        from app.services.canonical import compute_canonical_id
-
         # Parse volume from name
         volume = parse_volume(name)
         resolved_brand = brand or infer_brand(name)
@@ -193,8 +351,6 @@ class Scraper(abc.ABC):
         unit_ml = volume.unit_volume_ml
         pack = volume.pack_count
         if vol_ml is None and resolved_category:
-            _WINE_CATS = {"wine", "red_wine", "white_wine", "rose", "sparkling", "champagne", "fortified_wine"}
-            _SPIRIT_CATS = {"spirits", "vodka", "gin", "rum", "whisky", "bourbon", "scotch", "tequila", "brandy", "liqueur"}
             cat_lower = resolved_category.lower()
             if cat_lower in _WINE_CATS:
                 vol_ml = 750.0
@@ -245,10 +401,15 @@ class Scraper(abc.ABC):
         if not products_data:
             return 0
 
-        from app.services.canonical import attach_canonical_id
-
         now = datetime.now(timezone.utc)
-        changed_count = 0
+
+        # Catalogs can list the same product twice (variants, multipacks,
+        # specials pages). One INSERT ... ON CONFLICT cannot update a row
+        # twice, so keep the last occurrence of each product.
+        products_data = list({
+            (product_data["chain"], product_data["source_id"]): product_data
+            for product_data in products_data
+        }.values())
 
         # Step 1: Bulk upsert all products
         product_values = []
@@ -273,130 +434,64 @@ class Scraper(abc.ABC):
                 "canonical_product_id": product_data.get("canonical_product_id"),
             })
 
-        stmt = insert(Product).values(product_values)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["chain", "source_product_id"],
-            set_={
-                "name": stmt.excluded.name,
-                "brand": stmt.excluded.brand,
-                "category": stmt.excluded.category,
-                "abv_percent": stmt.excluded.abv_percent,
-                "pack_count": stmt.excluded.pack_count,
-                "unit_volume_ml": stmt.excluded.unit_volume_ml,
-                "total_volume_ml": stmt.excluded.total_volume_ml,
-                "image_url": stmt.excluded.image_url,
-                "product_url": stmt.excluded.product_url,
-                "is_sugar_free": stmt.excluded.is_sugar_free,
-                "canonical_product_id": stmt.excluded.canonical_product_id,
-                "updated_at": now,
-            },
-        )
-        await session.execute(stmt)
-        await session.flush()
-
-        # Step 2: Get product IDs for all upserted products
-        source_ids = [p["source_id"] for p in products_data]
-        result = await session.execute(
-            select(Product.id, Product.source_product_id).where(
-                Product.chain == self.chain,
-                Product.source_product_id.in_(source_ids)
+        # Step 2: Upsert in chunks (bounded statement size and bind count) and
+        # map source IDs to the product IDs each chunk returns
+        product_id_map = {}
+        all_products_new = True
+        for idx in range(0, len(product_values), PRODUCT_UPSERT_CHUNK_SIZE):
+            chunk = product_values[idx: idx + PRODUCT_UPSERT_CHUNK_SIZE]
+            stmt = insert(Product).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["chain", "source_product_id"],
+                set_={
+                    "name": stmt.excluded.name,
+                    "brand": stmt.excluded.brand,
+                    "category": stmt.excluded.category,
+                    "abv_percent": stmt.excluded.abv_percent,
+                    "pack_count": stmt.excluded.pack_count,
+                    "unit_volume_ml": stmt.excluded.unit_volume_ml,
+                    "total_volume_ml": stmt.excluded.total_volume_ml,
+                    "image_url": stmt.excluded.image_url,
+                    "product_url": stmt.excluded.product_url,
+                    "is_sugar_free": stmt.excluded.is_sugar_free,
+                    "canonical_product_id": stmt.excluded.canonical_product_id,
+                    "updated_at": now,
+                },
             )
-        )
-        product_id_map = {row.source_product_id: row.id for row in result}
-
-        # Step 3: Get all existing prices in one query
-        product_ids = list(product_id_map.values())
-        store_ids = [store.id for store in stores]
-
-        existing_prices_result = await session.execute(
-            select(Price).where(
-                Price.product_id.in_(product_ids),
-                Price.store_id.in_(store_ids)
+            stmt = stmt.returning(
+                Product.id,
+                Product.source_product_id,
+                # xmax is 0 only for rows this statement inserted (not updated)
+                (literal_column("xmax") == 0).label("inserted"),
             )
-        )
-        existing_prices = existing_prices_result.scalars().all()
-
-        # Create lookup map: (product_id, store_id) -> Price
-        existing_prices_map = {
-            (price.product_id, price.store_id): price
-            for price in existing_prices
-        }
-
-        # Step 4: Bulk upsert prices
-        price_values = []
-        history_values = []
+            result = await session.execute(stmt)
+            for row in result:
+                product_id_map[row.source_product_id] = row.id
+                all_products_new = all_products_new and row.inserted
+
+        # Step 3: Bulk upsert prices. Every store of the chain gets the same
+        # price, so only one row per product is built here; the per-store
+        # fan-out happens in the database. Change detection happens
+        # server-side in the ON CONFLICT clause, so existing prices are never
+        # loaded.
+        product_prices_map: Dict[Any, dict] = {}
         for product_data in products_data:
             product_id = product_id_map.get(product_data["source_id"])
             if not product_id:
                 continue
-
-            for store in stores:
-                existing_price = existing_prices_map.get((product_id, store.id))
-
-                # Check if price changed
-                price_changed = False
-                if existing_price:
-                    if (
-                        existing_price.price_nzd != product_data["price_nzd"]
-                        or existing_price.promo_price_nzd != product_data.get("promo_price_nzd")
-                        or existing_price.is_member_only != product_data.get("is_member_only", False)
-                    ):
-                        price_changed = True
-                        changed_count += 1
-
-                # Always include in bulk upsert (will update last_seen_at)
-                price_values.append({
-                    "product_id": product_id,
-                    "store_id": store.id,
-                    "price_nzd": product_data["price_nzd"],
-                    "promo_price_nzd": product_data.get("promo_price_nzd"),
-                    "promo_text": product_data.get("promo_text"),
-                    "promo_ends_at": product_data.get("promo_ends_at"),
-                    "is_member_only": product_data.get("is_member_only", False),
-                    "last_seen_at": now,
-                    "price_last_changed_at": now if (price_changed or not existing_price) else (existing_price.price_last_changed_at if existing_price else now),
-                })
-
-                if not existing_price:
-                    changed_count += 1
-
-                # Record price history on change or new product-store pair
-                if price_changed or not existing_price:
-                    history_values.append({
-                        "product_id": product_id,
-                        "store_id": store.id,
-                        "price_nzd": product_data["price_nzd"],
-                        "promo_price_nzd": product_data.get("promo_price_nzd"),
-                        "is_member_only": product_data.get("is_member_only", False),
-                        "recorded_at": now,
-                    })
-
-        # Bulk insert with ON CONFLICT in chunks to avoid Postgres bind limits
-        if price_values:
-            for idx in range(0, len(price_values), PRICE_UPSERT_CHUNK_SIZE):
-                chunk = price_values[idx: idx + PRICE_UPSERT_CHUNK_SIZE]
-                stmt = insert(Price).values(chunk)
-                stmt = stmt.on_conflict_do_update(
-                    constraint="uq_price_product_store",
-                    set_={
-                        "price_nzd": stmt.excluded.price_nzd,
-                        "promo_price_nzd": stmt.excluded.promo_price_nzd,
-                        "promo_text": stmt.excluded.promo_text,
-                        "promo_ends_at": stmt.excluded.promo_ends_at,
-                        "is_member_only": stmt.excluded.is_member_only,
-                        "last_seen_at": stmt.excluded.last_seen_at,
-                        "price_last_changed_at": stmt.excluded.price_last_changed_at,
-                    },
-                )
-                await session.execute(stmt)
-
-        # Bulk insert price history records
-        if history_values:
-            for idx in range(0, len(history_values), PRICE_UPSERT_CHUNK_SIZE):
-                chunk = history_values[idx: idx + PRICE_UPSERT_CHUNK_SIZE]
-                await session.execute(insert(PriceHistory).values(chunk))
-
-        return changed_count
+            product_prices_map[product_id] = self._product_price_values(product_id, product_data)
+        product_prices = list(product_prices_map.values())
+
+        if all_products_new:
+            # Prices reference their product, so brand-new products cannot
+            # have price rows yet: skip ON CONFLICT and COPY them in.
+            price_values = [
+                {**price, "store_id": store.id, "last_seen_at": now, "price_last_changed_at": now}
+                for price in product_prices
+                for store in stores
+            ]
+            return await self._copy_new_price_rows(session, price_values, now)
+        return await self._upsert_price_rows(session, product_prices, stores, now)
 
     async def _upsert_product_and_prices(
         self, session, product_data: dict, stores: List[Store]
@@ -405,10 +500,7 @@ class Scraper(abc.ABC):
         Upsert product and its prices.
         Returns True if any changes were made, False otherwise.
         """
-        from app.services.canonical import attach_canonical_id
-
         now = datetime.now(timezone.utc)
-        changed = False
 
         # Ensure the cross-chain matcher runs on every product write.
         attach_canonical_id(product_data)
@@ -453,66 +545,160 @@ class Scraper(abc.ABC):
 
         # For MVP: Create/update prices for all stores of this chain
         # In the future, this could be store-specific pricing
-        for store in stores:
-            # Check if price exists and has changed
-            existing_price = await session.execute(
-                select(Price).where(
-                    Price.product_id == product_id, Price.store_id == store.id
+        product_prices = [self._product_price_values(product_id, product_data)]
+        changed = await self._upsert_price_rows(session, product_prices, stores, now) > 0
+
+        return changed
+
+    async def _copy_new_price_rows(
+        self, session, price_values: List[dict], now: datetime
+    ) -> int:
+        """
+        Bulk-load price rows known not to exist yet, with their history.
+        Every row is new, so every row counts as changed.
+        """
+        await copy_insert(session, Price, price_values)
+        await copy_insert(session, PriceHistory, [
+            {
+                "product_id": row["product_id"],
+                "store_id": row["store_id"],
+                "price_nzd": row["price_nzd"],
+                "promo_price_nzd": row["promo_price_nzd"],
+                "is_member_only": row["is_member_only"],
+                "recorded_at": now,
+            }
+            for row in price_values
+        ])
+        return len(price_values)
+
+    @staticmethod
+    def _product_price_values(product_id, product_data: dict) -> dict:
+        """The store-independent price columns for one product."""
+        return {
+            "product_id": product_id,
+            "price_nzd": product_data["price_nzd"],
+            "promo_price_nzd": product_data.get("promo_price_nzd"),
+            "promo_text": product_data.get("promo_text"),
+            "promo_ends_at": product_data.get("promo_ends_at"),
+            "is_member_only": product_data.get("is_member_only", False),
+        }
+
+    async def _upsert_price_rows(
+        self, session, product_prices: List[dict], stores: List[Store], now: datetime
+    ) -> int:
+        """
+        Upsert one price row per (product, store) and record history for the
+        ones that changed.
+
+        Only the per-product prices are sent; ``INSERT ... SELECT`` cross joins
+        them with the store ids in the database, so the payload does not grow
+        with the number of stores.
+
+        A row counts as changed when it is new, or when its price, promo price
+        or member flag differs from the stored row. Only then is
+        price_last_changed_at bumped to ``now``; RETURNING reports which rows
+        that happened to, so no existing prices need to be loaded.
+        Returns count of changed rows.
+        """
+        if not product_prices or not stores:
+            return 0
+
+        store_ids = values(
+            column("store_id", UUID_TYPE), name="chain_stores"
+        ).data([(store.id,) for store in stores])
+        # Keep each statement at roughly PRICE_UPSERT_CHUNK_SIZE price rows
+        chunk_size = max(1, PRICE_UPSERT_CHUNK_SIZE // len(stores))
+
+        changed_count = 0
+        for idx in range(0, len(product_prices), chunk_size):
+            chunk = product_prices[idx: idx + chunk_size]
+            page_prices = values(
+                column("product_id", UUID_TYPE),
+                column("price_nzd", Float),
+                column("promo_price_nzd", Float),
+                column("promo_text", String),
+                column("promo_ends_at", DateTime(timezone=True)),
+                column("is_member_only", Boolean),
+                name="page_prices",
+            ).data([
+                (
+                    price["product_id"],
+                    price["price_nzd"],
+                    price["promo_price_nzd"],
+                    price["promo_text"],
+                    price["promo_ends_at"],
+                    price["is_member_only"],
                 )
+                for price in chunk
+            ])
+            fan_out = select(
+                UUID7_SQL,
+                page_prices.c.product_id,
+                store_ids.c.store_id,
+                page_prices.c.price_nzd,
+                # A VALUES column that is NULL in every row is typed text
+                cast(page_prices.c.promo_price_nzd, Float),
+                cast(page_prices.c.promo_text, String),
+                cast(page_prices.c.promo_ends_at, DateTime(timezone=True)),
+                page_prices.c.is_member_only,
+                literal(now, DateTime(timezone=True)),
+                literal(now, DateTime(timezone=True)),
+            ).select_from(page_prices.join(store_ids, true()))
+            stmt = insert(Price).from_select(
+                [
+                    "id", "product_id", "store_id", "price_nzd", "promo_price_nzd",
+                    "promo_text", "promo_ends_at", "is_member_only",
+                    "last_seen_at", "price_last_changed_at",
+                ],
+                fan_out,
             )
-            existing = existing_price.scalar_one_or_none()
-
-            price_changed = False
-            if existing:
-                # Check if price has changed
-                if (
-                    existing.price_nzd != product_data["price_nzd"]
-                    or existing.promo_price_nzd != product_data.get("promo_price_nzd")
-                    or existing.is_member_only != product_data.get("is_member_only", False)
-                ):
-                    price_changed = True
-                    changed = True
-
-                # Update existing price
-                existing.price_nzd = product_data["price_nzd"]
-                existing.promo_price_nzd = product_data.get("promo_price_nzd")
-                existing.promo_text = product_data.get("promo_text")
-                existing.promo_ends_at = product_data.get("promo_ends_at")
-                existing.is_member_only = product_data.get("is_member_only", False)
-                existing.last_seen_at = now
-                if price_changed:
-                    existing.price_last_changed_at = now
-                    session.add(PriceHistory(
-                        product_id=product_id, store_id=store.id,
-                        price_nzd=product_data["price_nzd"],
-                        promo_price_nzd=product_data.get("promo_price_nzd"),
-                        is_member_only=product_data.get("is_member_only", False),
-                        recorded_at=now,
-                    ))
-            else:
-                # Create new price
-                changed = True
-                price = Price(
-                    product_id=product_id,
-                    store_id=store.id,
-                    price_nzd=product_data["price_nzd"],
-                    promo_price_nzd=product_data.get("promo_price_nzd"),
-                    promo_text=product_data.get("promo_text"),
-                    promo_ends_at=product_data.get("promo_ends_at"),
-                    is_member_only=product_data.get("is_member_only", False),
-                    last_seen_at=now,
-                    price_last_changed_at=now,
-                )
-                session.add(price)
-                session.add(PriceHistory(
-                    product_id=product_id, store_id=store.id,
-                    price_nzd=product_data["price_nzd"],
-                    promo_price_nzd=product_data.get("promo_price_nzd"),
-                    is_member_only=product_data.get("is_member_only", False),
-                    recorded_at=now,
-                ))
+            price_changed = or_(
+                Price.price_nzd.is_distinct_from(stmt.excluded.price_nzd),
+                Price.promo_price_nzd.is_distinct_from(stmt.excluded.promo_price_nzd),
+                Price.is_member_only.is_distinct_from(stmt.excluded.is_member_only),
+            )
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_price_product_store",
+                set_={
+                    "price_nzd": stmt.excluded.price_nzd,
+                    "promo_price_nzd": stmt.excluded.promo_price_nzd,
+                    "promo_text": stmt.excluded.promo_text,
+                    "promo_ends_at": stmt.excluded.promo_ends_at,
+                    "is_member_only": stmt.excluded.is_member_only,
+                    "last_seen_at": stmt.excluded.last_seen_at,
+                    "price_last_changed_at": case(
+                        (price_changed, stmt.excluded.last_seen_at),
+                        else_=Price.price_last_changed_at,
+                    ),
+                },
+            ).returning(
+                Price.product_id,
+                Price.store_id,
+                Price.price_nzd,
+                Price.promo_price_nzd,
+                Price.is_member_only,
+                (Price.price_last_changed_at == now).label("changed"),
+            )
+            result = await session.execute(stmt)
+
+            # Record price history on change or new product-store pair
+            history_values = [
+                {
+                    "product_id": row.product_id,
+                    "store_id": row.store_id,
+                    "price_nzd": row.price_nzd,
+                    "promo_price_nzd": row.promo_price_nzd,
+                    "is_member_only": row.is_member_only,
+                    "recorded_at": now,
+                }
+                for row in result
+                if row.changed
+            ]
+            if history_values:
+                await session.execute(insert(PriceHistory).values(history_values))
+                changed_count += len(history_values)
 
-        return changed
+        return changed_count
 
     @abc.abstractmethod
     async def fetch_catalog_pages(self) -> List[str]:
@@ -532,5 +718,24 @@ class Scraper(abc.ABC):
         for page in pages:
             yield page
 
-
-__all__ = ["Scraper"]
+    async def _stream_page_windows(self) -> AsyncIterator[List[str]]:
+        """Group stream_catalog_pages() into windows of PARSE_CONCURRENCY pages."""
+        window: List[str] = []
+        async for page in self.stream_catalog_pages():
+            window.append(page)
+            if len(window) == PARSE_CONCURRENCY:
+                yield window
+                window = []
+        if window:
+            yield window
+
+
+__all__ = [
+    "Scraper",
+    "close_shared_client",
+    "discard_parse_pool",
+    "get_chain_stores",
+    "get_parse_pool",
+    "get_shared_client",
+    "get_with_retry",
+]
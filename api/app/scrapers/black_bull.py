@@ -11,22 +11,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import re
-from typing import List
+import sys
+from collections import defaultdict
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 from urllib.parse import urlparse
 
 import httpx
-from sqlalchemy import select
+import orjson
 
-from app.db.models import Store
 from app.db.session import get_async_session
-from app.scrapers.base import Scraper
-from app.services.parser_utils import (
-    parse_volume,
-    extract_abv,
-    infer_brand,
-    infer_category,
+from app.scrapers.base import (
+    Scraper, discard_parse_pool, get_chain_stores, get_parse_pool, get_with_retry,
 )
+from app.services.parser_utils import parse_title_attrs
 
 logger = logging.getLogger(__name__)
 
@@ -49,12 +51,177 @@ DEFAULT_STORES = [
     },
 ]
 
+# In-flight requests per store domain. Politeness comes from this cap rather
+# than fixed sleeps between pages.
+HOST_CONCURRENCY = 4
+SHOPIFY_PAGE_SIZE = 250  # products.json maximum
+PAGE_QUEUE_SIZE = 32  # fetched pages waiting to be parsed
+PROCESS_PARSE_MIN_PRODUCTS = 64  # larger pages are parsed in a worker process
+
+_INTERNED_FIELDS = ("name", "brand", "category", "store_name")
+_SALE_TAGS = frozenset({"sale", "special", "on-sale", "promotion", "clearance", "reduced"})
+_SCHEME_PREFIXES = ("http://", "https://")
+_SLUG_RE = re.compile(r"[^a-z0-9_-]")
+
 NON_ECOMMERCE_HOSTS = {
     "blackbullliquor.co.nz",
     "www.blackbullliquor.co.nz",
 }
 
 
+@dataclass(slots=True)
+class ParsedProduct:
+    """One parsed Shopify product; keys match the scraper product dict."""
+
+    chain: str
+    source_id: str
+    name: str
+    brand: Optional[str]
+    category: Optional[str]
+    price_nzd: float
+    promo_price_nzd: Optional[float]
+    promo_text: Optional[str]
+    promo_ends_at: Optional[datetime]
+    is_member_only: bool
+    pack_count: Optional[int]
+    unit_volume_ml: Optional[float]
+    total_volume_ml: Optional[float]
+    abv_percent: Optional[float]
+    url: Optional[str]
+    image_url: Optional[str]
+    store_id: Optional[str]
+    store_name: Optional[str]
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+def _parse_shopify_product(
+    product: dict,
+    chain: str,
+    base_url: Optional[str],
+    store_id: Optional[str] = None,
+    store_name: Optional[str] = None,
+) -> Optional[ParsedProduct]:
+    """
+    Parse a single Shopify product into our standard format.
+
+    Module-level and free of scraper state so it can run in a worker process.
+
+    Args:
+        product: Shopify product dict
+        chain: Chain the product belongs to
+        base_url: Store domain used to build the product URL
+        store_id: Store identifier (e.g., "porirua")
+        store_name: Store display name (e.g., "Porirua")
+
+    Returns:
+        Standardized product, or None for unavailable products
+    """
+    # Get the default variant (or first variant). Missing and out-of-stock
+    # products are rejected before any other field is read.
+    variants = product.get("variants")
+    if not variants:
+        return None
+
+    variant = variants[0]  # Use first variant
+    if not variant.get("available"):
+        return None
+
+    # Basic product info
+    product_id = str(product.get("id", ""))
+    title = product.get("title", "")
+    vendor = product.get("vendor", "")
+    handle = product.get("handle", "")
+
+    # Price (Shopify stores price as string like "21.99"); compare_at_price
+    # is set for sale items
+    price = float(variant.get("price") or 0)
+    compare_at = variant.get("compare_at_price")
+    promo_price = None
+    promo_text = None
+    if compare_at:
+        compare_price = float(compare_at)
+        if compare_price > price:
+            # This is a sale - compare_at_price is the original price
+            promo_price = price
+            price = compare_price  # Use original price as base price
+            promo_text = "Sale"
+
+    # Enrich promo info from product tags (comma-separated string or list);
+    # the first sale tag wins
+    if not promo_text:
+        tags_raw = product.get("tags") or ()
+        if isinstance(tags_raw, str):
+            tags_raw = tags_raw.split(",")
+        for tag in tags_raw:
+            tag = tag.strip().lower()
+            if tag in _SALE_TAGS:
+                promo_text = tag.title()
+                if not promo_price:
+                    promo_price = price  # Flag as promotional even without compare_at
+                break
+
+    # Image URL
+    images = product.get("images")
+    image_url = images[0].get("src") if images else None
+
+    # Product URL - use store-specific URL if available
+    url = f"{base_url}/products/{handle}" if base_url else None
+
+    # Parse volume and attributes from title
+    attrs = parse_title_attrs(title)
+    volume = attrs.volume
+
+    # Create source_id with store context
+    source_id = f"{store_id}_{product_id}" if store_id else product_id
+
+    return ParsedProduct(
+        chain=chain,
+        source_id=source_id,
+        name=title,
+        brand=attrs.brand or vendor,
+        category=attrs.category,
+        price_nzd=price,
+        promo_price_nzd=promo_price,
+        promo_text=promo_text,
+        promo_ends_at=None,  # Shopify doesn't provide end dates
+        is_member_only=False,
+        pack_count=volume.pack_count,
+        unit_volume_ml=volume.unit_volume_ml,
+        total_volume_ml=volume.total_volume_ml,
+        abv_percent=attrs.abv,
+        url=url,
+        image_url=image_url,
+        store_id=store_id,  # Include store context
+        store_name=store_name,
+    )
+
+
+def _parse_page(
+    products: List[dict],
+    chain: str,
+    base_url: Optional[str],
+    store_id: Optional[str],
+    store_name: Optional[str],
+) -> List[ParsedProduct]:
+    """Parse one page of Shopify products, skipping any that fail."""
+    parsed_products = []
+    for product in products:
+        try:
+            parsed = _parse_shopify_product(product, chain, base_url, store_id, store_name)
+            if parsed:
+                parsed_products.append(parsed)
+        except Exception as e:
+            logger.error(f"Error parsing product {product.get('id')}: {e}")
+    return parsed_products
+
+
+def _parse_pages(batch: List[tuple]) -> List[List[ParsedProduct]]:
+    """Parse several pages in one worker call; each item is ``_parse_page`` args."""
+    return [_parse_page(*args) for args in batch]
+
+
 class BlackBullScraper(Scraper):
     """
     Scraper for Black Bull stores using Shopify API.
@@ -89,6 +256,16 @@ class BlackBullScraper(Scraper):
         self._scrape_all_stores = scrape_all_stores
         self.stores = [dict(s) for s in (stores or DEFAULT_STORES)]
 
+    @property
+    def stores(self) -> List[dict]:
+        return self._stores
+
+    @stores.setter
+    def stores(self, stores: List[dict]) -> None:
+        self._stores = stores
+        # _parse_product looks up every product's store URL; keep it O(1)
+        self._store_url_by_id = {store["store_id"]: store["url"] for store in stores}
+
     @staticmethod
     def _normalize_url(url: str | None) -> str | None:
         if not url:
@@ -98,7 +275,7 @@ class BlackBullScraper(Scraper):
         if not candidate:
             return None
 
-        if not candidate.startswith(("http://", "https://")):
+        if not candidate.startswith(_SCHEME_PREFIXES):
             candidate = f"https://{candidate}"
 
         parsed = urlparse(candidate)
@@ -109,59 +286,56 @@ class BlackBullScraper(Scraper):
 
     @staticmethod
     def _is_ecommerce_host(host: str) -> bool:
-        host_l = host.strip().lower()
-        if not host_l or host_l in NON_ECOMMERCE_HOSTS:
-            return False
-        return host_l.endswith(".co.nz") and "blackbull" in host_l
+        """Whether a netloc is a store's Shopify site; expects a lowercased host."""
+        return (
+            bool(host)
+            and host not in NON_ECOMMERCE_HOSTS
+            and host.endswith(".co.nz")
+            and "blackbull" in host
+        )
 
     @staticmethod
     def _store_id_from_row(api_id: str | None, host: str) -> str:
         if api_id:
-            candidate = re.sub(r"[^a-z0-9_-]", "_", str(api_id).strip().lower())
+            candidate = _SLUG_RE.sub("_", str(api_id).strip().lower())
             if candidate:
                 return candidate
 
         slug = host.split(".", 1)[0].strip().lower()
-        slug = re.sub(r"[^a-z0-9_-]", "_", slug)
+        slug = _SLUG_RE.sub("_", slug)
         return slug or "black_bull_store"
 
     async def _load_stores_from_db(self) -> List[dict]:
         stores: dict[str, dict] = {}
 
         try:
+            # Shares the per-process TTL cache that run() already filled
             async with get_async_session() as session:
-                result = await session.execute(
-                    select(Store.api_id, Store.name, Store.url).where(Store.chain == self.chain)
-                )
-
-                for api_id, name, url in result.all():
-                    normalized_url = self._normalize_url(url)
-                    if not normalized_url:
-                        continue
-
-                    host = urlparse(normalized_url).netloc.lower()
-                    if not self._is_ecommerce_host(host):
-                        continue
-
-                    store_id = self._store_id_from_row(api_id, host)
-                    stores[normalized_url] = {
-                        "name": (name or host).strip(),
-                        "url": normalized_url,
-                        "store_id": store_id,
-                    }
+                db_stores = await get_chain_stores(session, self.chain)
+
+            for store in db_stores:
+                api_id, name, url = store.api_id, store.name, store.url
+                normalized_url = self._normalize_url(url)
+                if not normalized_url:
+                    continue
+
+                host = urlparse(normalized_url).netloc.lower()
+                if not self._is_ecommerce_host(host):
+                    continue
+
+                store_id = self._store_id_from_row(api_id, host)
+                stores[normalized_url] = {
+                    "name": (name or host).strip(),
+                    "url": normalized_url,
+                    "store_id": store_id,
+                }
         except Exception as e:
             logger.warning(f"Failed loading {self.chain} stores from DB, using fallback list: {e}")
             return []
 
         return list(stores.values())
 
-    async def fetch_catalog_pages(self) -> List[str]:
-        """
-        Fetch all products from Black Bull Shopify stores.
-        Returns JSON responses as strings for parsing.
-        """
-        pages = []
-
+    async def _resolve_stores(self) -> None:
         if not self._stores_explicit and self._scrape_all_stores:
             db_stores = await self._load_stores_from_db()
             if db_stores:
@@ -172,79 +346,216 @@ class BlackBullScraper(Scraper):
                     f"Using fallback Black Bull store list ({len(self.stores)} stores)"
                 )
 
-        # Semaphore limits concurrent requests per store to 3 — enough to
-        # fetch all collections in parallel without hammering a single Shopify instance.
-        sem = asyncio.Semaphore(3)
-
-        async def fetch_collection(client: httpx.AsyncClient, store: dict, collection: str) -> list:
-            """Fetch all pages for one collection, returning enriched page dicts."""
-            results = []
-            page_num = 1
-            async with sem:
-                while True:
-                    url = f"{store['url']}/collections/{collection}/products.json"
-                    params = {"limit": 250, "page": page_num}
-                    try:
-                        response = await client.get(url, params=params)
-                        response.raise_for_status()
-                        data = response.json()
-                        products = data.get("products", [])
-                        if not products:
-                            break
-                        logger.info(
-                            f"  {store['name']} - {collection} page {page_num}: {len(products)} products"
-                        )
-                        results.append({
-                            "products": products,
-                            "store_id": store["store_id"],
-                            "store_name": store["name"],
-                        })
-                        if len(products) < 250:
-                            break
-                        page_num += 1
-                        await asyncio.sleep(0.5)  # Rate limiting between pagination pages
-                    except httpx.HTTPError as e:
-                        logger.error(f"Error fetching {store['name']} {collection} page {page_num}: {e}")
-                        break
-            return results
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for store in self.stores:
-                logger.info(f"Fetching store: {store['name']}")
-
-                # Fetch all collections for this store concurrently (each goes to
-                # the same domain, capped at 3 simultaneous by the semaphore).
-                collection_results = await asyncio.gather(
-                    *[fetch_collection(client, store, c) for c in self.collections],
-                    return_exceptions=True,
-                )
-                for result in collection_results:
-                    if isinstance(result, BaseException):
-                        logger.error(f"Collection fetch failed for {store['name']}: {result}")
-                    elif isinstance(result, list):
-                        pages.extend(result)
+    async def fetch_catalog_pages(self) -> List[dict]:
+        """
+        Fetch all products from Black Bull Shopify stores.
+        Returns page dicts (Shopify products plus store context) for parsing.
+        """
+        return [page async for page in self.stream_catalog_pages()]
+
+    async def stream_catalog_pages(self) -> AsyncIterator[dict]:
+        """
+        Yield catalog pages as they arrive, so parsing and persistence overlap
+        with the remaining fetches.
+
+        Every (store, collection) pair is fetched concurrently by its own
+        producer task. Stores are separate Shopify domains, so each host gets
+        its own semaphore capping it at HOST_CONCURRENCY in-flight requests;
+        one slow store doesn't hold up the others. The bounded queue applies
+        backpressure: producers pause once PAGE_QUEUE_SIZE pages are waiting.
+        """
+        await self._resolve_stores()
+
+        host_sems: dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(HOST_CONCURRENCY))
+        queue: asyncio.Queue[Optional[dict]] = asyncio.Queue(maxsize=PAGE_QUEUE_SIZE)
+
+        async def produce(store: dict, collection: str) -> None:
+            try:
+                # The shared HTTP/2 client keeps one multiplexed connection per
+                # store domain across collections, pages and runs.
+                async for page in self._fetch_collection(
+                    self.client, store, collection, host_sems[urlparse(store["url"]).netloc]
+                ):
+                    await queue.put(page)
+            except Exception as e:
+                logger.error(f"Collection fetch failed for {store['name']} {collection}: {e}")
+
+        producers = [
+            asyncio.create_task(produce(store, collection))
+            for store in self.stores
+            for collection in self.collections
+        ]
 
-                # Delay between stores (each is a separate Shopify domain)
-                await asyncio.sleep(0.5)
+        async def close_queue() -> None:
+            await asyncio.gather(*producers)
+            await queue.put(None)
 
-        logger.info(f"Fetched {len(pages)} pages total")
-        return pages
+        closer = asyncio.create_task(close_queue())
+        page_count = 0
+        try:
+            while (page := await queue.get()) is not None:
+                page_count += 1
+                yield page
+        finally:
+            # Stop fetching if the consumer bails out early
+            for task in (*producers, closer):
+                task.cancel()
+
+        logger.info(f"Fetched {page_count} pages total")
+
+    async def _fetch_collection(
+        self,
+        client: httpx.AsyncClient,
+        store: dict,
+        collection: str,
+        sem: asyncio.Semaphore,
+    ) -> AsyncIterator[dict]:
+        """
+        Yield each page of one collection as an enriched page dict.
 
-    async def parse_products(self, payload: dict | str) -> List[dict]:
+        Walks the collection with a ``since_id`` cursor rather than ``page=``
+        numbers, so deep pages don't pay Shopify's offset penalty. A short
+        page ends the walk without probing for an empty one.
+
+        A storefront that ignores ``since_id`` is caught before its page is
+        yielded: the walk restarts with ``page=`` numbers and skips products
+        it has already yielded, so nothing is duplicated or dropped.
+        """
+        page_num = 1
+        since_id = 0
+        use_cursor = True
+        seen_ids: set[int] = set()
+        previous_ids = None
+        url = f"{store['url']}/collections/{collection}/products.json"
+        while True:
+            if use_cursor:
+                params = {"limit": SHOPIFY_PAGE_SIZE, "since_id": since_id}
+            else:
+                params = {"limit": SHOPIFY_PAGE_SIZE, "page": page_num}
+            try:
+                # Only the request holds the host slot, not parsing or the consumer
+                async with sem:
+                    response = await get_with_retry(client, url, params=params)
+                if response.status_code == 404:
+                    logger.debug(f"{store['name']} has no {collection} collection")
+                    break
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+                products = data.get("products", [])
+                if not products:
+                    break
+                ids = [product["id"] for product in products]
+
+                if use_cursor and min(ids) <= since_id:
+                    # The cursor was ignored; this page repeats earlier products
+                    logger.warning(
+                        f"{store['name']} {collection}: since_id ignored, "
+                        f"falling back to page numbers"
+                    )
+                    use_cursor = False
+                    page_num = 1
+                    previous_ids = None
+                    continue
+                if not use_cursor and ids == previous_ids:
+                    # page= ignored too; stop rather than refetch the same page
+                    logger.warning(f"{store['name']} {collection}: page {page_num} repeated")
+                    break
+                previous_ids = ids
+
+                new_products = [p for p in products if p["id"] not in seen_ids]
+                seen_ids.update(ids)
+                if new_products:
+                    logger.info(
+                        f"  {store['name']} - {collection} page {page_num}: "
+                        f"{len(new_products)} products"
+                    )
+                    yield {
+                        "products": new_products,
+                        "store_id": store["store_id"],
+                        "store_name": store["name"],
+                    }
+                if len(products) < SHOPIFY_PAGE_SIZE:
+                    break
+                since_id = max(ids)
+                page_num += 1
+            except httpx.HTTPError as e:
+                logger.error(f"Error fetching {store['name']} {collection} page {page_num}: {e}")
+                break
+
+    async def parse_products(self, payload: dict | str | bytes) -> List[dict]:
         """
         Parse products from Shopify JSON response.
 
         Args:
-            payload: Either a dict with store context or JSON string from Shopify API
+            payload: Either a dict with store context or raw JSON from Shopify API
 
         Returns:
             List of standardized product dictionaries
         """
-        import json
+        (result,) = await self.parse_all([payload])
+        if isinstance(result, Exception):
+            raise result
+        return result
 
+    async def parse_all(self, pages: List[dict | str | bytes]) -> List[List[dict] | Exception]:
+        """
+        Parse a window of Shopify pages, one product list per page in order.
+
+        Big pages are split across the worker pool in one dispatch per worker
+        rather than one per page; a page that can't be decoded yields its
+        exception in place of a product list.
+        """
+        results: List[List[dict] | Exception | None] = [None] * len(pages)
+        page_args = {}
+        for i, payload in enumerate(pages):
+            try:
+                page_args[i] = self._page_args(payload)
+            except Exception as e:
+                results[i] = e
+
+        # Big pages are parsed in worker processes so the event loop keeps
+        # servicing the concurrent fetches; small ones aren't worth the pickling.
+        big = [i for i, args in page_args.items() if len(args[0]) > PROCESS_PARSE_MIN_PRODUCTS]
+        if big:
+            workers = min(len(big), os.cpu_count() or 1)
+            batches = [big[w::workers] for w in range(workers)]
+            loop = asyncio.get_running_loop()
+            try:
+                pool = get_parse_pool()
+                parsed_batches = await asyncio.gather(*(
+                    loop.run_in_executor(pool, _parse_pages, [page_args[i] for i in batch])
+                    for batch in batches
+                ))
+            except BrokenProcessPool as e:
+                logger.warning(f"Parse worker pool broke, parsing in-process: {e}")
+                discard_parse_pool()
+            else:
+                for batch, parsed_pages in zip(batches, parsed_batches):
+                    for i, parsed in zip(batch, parsed_pages):
+                        results[i] = parsed
+        for i, args in page_args.items():
+            if results[i] is None:
+                results[i] = _parse_page(*args)
+
+        # Every store lists the same SKUs: share one copy of each repeated
+        # string across stores instead of holding one per store. Products
+        # become dicts only here, where persistence takes over.
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                continue
+            for parsed in result:
+                for field in _INTERNED_FIELDS:
+                    value = getattr(parsed, field)
+                    if value:
+                        setattr(parsed, field, sys.intern(value))
+            results[i] = [parsed.to_dict() for parsed in result]
+        return results
+
+    def _page_args(self, payload: dict | str | bytes) -> tuple:
+        """Decode one page into ``_parse_page`` arguments."""
         # Handle both dict (with store context) and string (JSON) payloads
-        if isinstance(payload, str):
-            data = json.loads(payload)
+        if isinstance(payload, (str, bytes)):
+            data = orjson.loads(payload)
             store_id = None
             store_name = None
         else:
@@ -253,125 +564,16 @@ class BlackBullScraper(Scraper):
             store_name = data.get("store_name")
 
         products = data.get("products", [])
-        parsed_products = []
-
-        for product in products:
-            try:
-                parsed = self._parse_product(product, store_id, store_name)
-                if parsed:
-                    parsed_products.append(parsed)
-            except Exception as e:
-                logger.error(f"Error parsing product {product.get('id')}: {e}")
-
-        return parsed_products
+        return (products, self.chain, self._store_url_by_id.get(store_id), store_id, store_name)
 
     def _parse_product(
         self, product: dict, store_id: str = None, store_name: str = None
     ) -> dict:
-        """
-        Parse a single Shopify product into our standard format.
-
-        Args:
-            product: Shopify product dict
-            store_id: Store identifier (e.g., "porirua")
-            store_name: Store display name (e.g., "Porirua")
-
-        Returns:
-            Standardized product dict
-        """
-        # Basic product info
-        product_id = str(product.get("id", ""))
-        title = product.get("title", "")
-        vendor = product.get("vendor", "")
-        handle = product.get("handle", "")
-
-        # Get the default variant (or first variant)
-        variants = product.get("variants", [])
-        if not variants:
-            return None
-
-        variant = variants[0]  # Use first variant
-
-        # Price (Shopify stores price as string like "21.99")
-        price_str = variant.get("price", "0")
-        price = float(price_str)
-
-        # Check if product is available
-        available = variant.get("available", False)
-        if not available:
-            # Skip out-of-stock products
-            return None
-
-        # Compare price - Shopify stores compare_at_price for sale items
-        compare_price_str = variant.get("compare_at_price")
-        promo_price = None
-        promo_text = None
-        if compare_price_str:
-            compare_price = float(compare_price_str)
-            if compare_price > price:
-                # This is a sale - compare_at_price is the original price
-                promo_price = price
-                price = compare_price  # Use original price as base price
-                promo_text = "Sale"
-
-        # Enrich promo info from product tags (comma-separated string)
-        tags_raw = product.get("tags", "")
-        if isinstance(tags_raw, list):
-            tags = [t.strip().lower() for t in tags_raw]
-        else:
-            tags = [t.strip().lower() for t in str(tags_raw).split(",") if t.strip()]
-
-        _SALE_TAGS = {"sale", "special", "on-sale", "promotion", "clearance", "reduced"}
-        matched_tags = _SALE_TAGS & set(tags)
-        if matched_tags and not promo_text:
-            promo_text = matched_tags.pop().title()
-            if not promo_price:
-                promo_price = price  # Flag as promotional even without compare_at
-
-        # Image URL
-        image_url = None
-        images = product.get("images", [])
-        if images:
-            image_url = images[0].get("src")
-
-        # Product URL - use store-specific URL if available
-        base_url = None
-        for store in self.stores:
-            if store["store_id"] == store_id:
-                base_url = store["url"]
-                break
-
-        url = f"{base_url}/products/{handle}" if base_url else None
-
-        # Parse volume and attributes from title
-        volume = parse_volume(title)
-        abv = extract_abv(title)
-        inferred_brand = infer_brand(title)
-        category = infer_category(title)
-
-        # Create source_id with store context
-        source_id = f"{store_id}_{product_id}" if store_id else product_id
-
-        return {
-            "chain": self.chain,
-            "source_id": source_id,
-            "name": title,
-            "brand": inferred_brand or vendor,
-            "category": category,
-            "price_nzd": price,
-            "promo_price_nzd": promo_price,
-            "promo_text": promo_text,
-            "promo_ends_at": None,  # Shopify doesn't provide end dates
-            "is_member_only": False,
-            "pack_count": volume.pack_count,
-            "unit_volume_ml": volume.unit_volume_ml,
-            "total_volume_ml": volume.total_volume_ml,
-            "abv_percent": abv,
-            "url": url,
-            "image_url": image_url,
-            "store_id": store_id,  # Include store context
-            "store_name": store_name,
-        }
+        """Parse a single Shopify product into our standard format."""
+        parsed = _parse_shopify_product(
+            product, self.chain, self._store_url_by_id.get(store_id), store_id, store_name
+        )
+        return parsed.to_dict() if parsed else None
 
 
 __all__ = ["BlackBullScraper"]
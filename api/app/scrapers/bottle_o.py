@@ -12,21 +12,33 @@ elements, making browser automation unnecessary.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import os
 import re
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
 
 import httpx
-from selectolax.parser import HTMLParser
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
 
-from app.scrapers.base import Scraper
+from app.scrapers.base import (
+    EXISTING_PRICES_YIELD_PER,
+    Scraper,
+    discard_parse_pool,
+    get_chain_stores,
+    get_parse_pool,
+    get_with_retry,
+)
 from app.db.models import Price, Product, Store
 from app.db.session import get_async_session
 from app.services.parser_utils import (
+    PARSE_CACHE_SIZE,
     parse_volume,
     extract_abv,
     expand_cityhive_size_codes,
@@ -46,9 +58,28 @@ STORE_SLUG_PATTERN = re.compile(
     r"https?://([a-z0-9-]+)\.shop\.thebottleo\.co\.nz", re.IGNORECASE
 )
 
+# Name normalisation for matching franchise GTM items to their HTML images
+_RE_VOLUME_X = re.compile(r"(\d+)\s*x\s*(\d+)")
+# "6x330ml", "330ml", "3l" and "6pk" tokens, stripped in a single pass
+_RE_VOLUME_TOKENS = re.compile(r"\b\d+(?:x\d+)?ml\b|\b\d+(?:l|pk)\b")
+
+_PRICE_STRIP = str.maketrans("", "", "$,")
+
 # Rate limiting
 DELAY_BETWEEN_CATEGORIES = 1.5
 DELAY_BETWEEN_REQUESTS = 1.0
+STORE_CONCURRENCY = 4  # stores fetched at once; requests within a store stay sequential
+PAGE_QUEUE_SIZE = 32  # fetched pages waiting to be parsed before store fetches pause
+PROCESS_PARSE_MIN_CHARS = 32_000  # larger pages are parsed in a worker process
+
+REQUEST_TIMEOUT = 30
+# Pjax headers make CityHive return the pre-rendered shopfront fragment
+PJAX_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "X-PJAX": "true",
+    "X-PJAX-Container": "[data-pjax=shopfront]",
+    "Accept": "text/html",
+}
 
 # Categories available on CityHive store sites
 CATEGORIES = ["beer", "wine", "spirits", "cider", "rtds", "specials"]
@@ -61,6 +92,12 @@ FRANCHISE_CATALOG_URLS = [
     "https://thebottleo.co.nz/search?q[]=category:rtd&sort_by=top_products",
     "https://thebottleo.co.nz/search?q[]=category:cider&sort_by=top_products",
 ]
+FRANCHISE_PRODUCT_URL_PREFIX = "https://thebottleo.co.nz/products/"
+
+PROMO_BADGE_MARKERS = ("promo", "deal", "save", "offer")
+PROMO_BADGE_SELECTOR = ", ".join(f'[class*="{marker}"]' for marker in PROMO_BADGE_MARKERS)
+SPECIAL_TALKER_CLASSES = frozenset({"talker--Special", "talker--Discount"})
+
 
 def _source_id_from_href(href: str) -> Optional[str]:
     """Extract a chain-wide product slug from a CityHive product href.
@@ -78,6 +115,236 @@ def _source_id_from_href(href: str) -> Optional[str]:
     return tail or None
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _normalize_name(name: str) -> str:
+    """Lowercase a product name, collapse whitespace and tighten "12 x 330ml"."""
+    normalized = " ".join(name.replace("\n", " ").split()).lower()
+    return _RE_VOLUME_X.sub(r"\1x\2", normalized)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _normalize_name_without_volume(name: str) -> str:
+    """``_normalize_name`` with volume and pack-size tokens removed."""
+    return " ".join(_RE_VOLUME_TOKENS.sub("", _normalize_name(name)).split())
+
+
+def _coerce_price(value) -> float:
+    """Price as a float; strings like "$1,299.99" are stripped in one pass."""
+    if isinstance(value, str):
+        return float(value.translate(_PRICE_STRIP))
+    return float(value)
+
+
+def _find_promo_badge(talker):
+    """First promo/deal/save/offer badge in a card, in that order of preference.
+
+    One combined selector walks the card once; the preference order the four
+    separate lookups used to give is then applied to the few matches.
+    """
+    badges = talker.css(PROMO_BADGE_SELECTOR)
+    for marker in PROMO_BADGE_MARKERS:
+        for badge in badges:
+            if marker in (badge.attrs.get("class") or ""):
+                return badge
+    return None
+
+
+@dataclass(slots=True, frozen=True)
+class TaggedPage:
+    """One fetched CityHive page with its store/category/page kept beside the HTML."""
+
+    store: str
+    category: str
+    page: int
+    html: str
+
+
+def _parse_cityhive_page(page: TaggedPage, chain: str) -> List[dict]:
+    """Parse products from CityHive .talker HTML (per-store pages)."""
+    store_slug = page.store
+
+    tree = LexborHTMLParser(page.html)
+    products = []
+
+    for talker in tree.css(".talker"):
+        try:
+            product = _parse_talker(talker, chain, store_slug)
+            if product:
+                products.append(product)
+        except Exception as e:
+            logger.error(f"Error parsing talker element: {e}", exc_info=True)
+
+    logger.info(f"Parsed {len(products)} products from store {store_slug}")
+    return products
+
+
+def _parse_talker(talker, chain: str, store_slug: str) -> Optional[dict]:
+    """Parse a single product from a CityHive .talker element."""
+
+    # Product URL — the chain-wide product slug lives in the <a href>.
+    # The element's id="line_<hex>" is a per-store inventory line ID and
+    # MUST NOT be used as source_product_id (it caused the duplicate-product
+    # bug where the same SKU was inserted once per store).
+    link_elem = talker.css_first("a[href]")
+    href = link_elem.attrs.get("href", "") if link_elem else ""
+
+    source_id = _source_id_from_href(href)
+    if not source_id:
+        # Without a stable chain-level identifier we cannot safely upsert.
+        logger.warning(
+            "Skipping talker element with no usable href at store=%s (id=%s)",
+            store_slug,
+            talker.attrs.get("id", ""),
+        )
+        return None
+
+    # Product name
+    name_elem = talker.css_first(".talker__name")
+    if not name_elem:
+        return None
+
+    name_spans = name_elem.css("span")
+    if not name_spans:
+        return None
+
+    product_name = name_spans[0].text(strip=True)
+    if not product_name:
+        return None
+
+    # Size from .talker__name__size
+    size_text = ""
+    size_elem = name_elem.css_first(".talker__name__size")
+    if size_elem:
+        size_text = size_elem.text(strip=True)
+        full_name = f"{product_name} {size_text}".strip()
+    else:
+        full_name = product_name
+
+    # Price
+    price_elem = talker.css_first(".price__sell")
+    if not price_elem:
+        return None
+
+    try:
+        price_nzd = _coerce_price(price_elem.text(strip=True))
+    except (ValueError, TypeError):
+        return None
+
+    # Product URL (absolute)
+    url = None
+    if href:
+        if not href.startswith("http"):
+            url = f"https://{store_slug}.shop.thebottleo.co.nz{href}"
+        else:
+            url = href
+
+    # Image URL
+    image_url = None
+    source_elem = talker.css_first("source[type='image/webp']")
+    if source_elem:
+        srcset = source_elem.attrs.get("srcset")
+        if srcset:
+            image_url = srcset.split()[0]
+    if not image_url:
+        img_elem = talker.css_first("img")
+        if img_elem:
+            image_url = img_elem.attrs.get("src") or img_elem.attrs.get("data-src")
+
+    if image_url and "no_image" in image_url:
+        image_url = None
+
+    # Volume / ABV / brand / category
+    # CityHive truncates volume suffixes ("330c" / "330b" / "700m"),
+    # so expand them before parsing.
+    volume_info = (
+        parse_volume(expand_cityhive_size_codes(size_text))
+        or parse_volume(expand_cityhive_size_codes(full_name))
+    )
+    pack_count = volume_info.pack_count if volume_info else None
+    unit_volume_ml = volume_info.unit_volume_ml if volume_info else None
+    total_volume_ml = volume_info.total_volume_ml if volume_info else None
+
+    abv_percent = extract_abv(full_name) or extract_abv(size_text)
+    brand = infer_brand(full_name)
+    category = infer_category(full_name)
+
+    # Promotions
+    promo_price = None
+    promo_text = None
+    promo_ends_at = None
+    is_member_only = False
+
+    talker_classes = (talker.attrs.get("class") or "").split()
+    is_special = not SPECIAL_TALKER_CLASSES.isdisjoint(talker_classes)
+
+    if is_special:
+        sticker_label = talker.css_first(".talker__sticker__label")
+        if sticker_label:
+            badge_text = sticker_label.text(strip=True)
+            if badge_text:
+                promo_text = badge_text[:255]
+
+                multi_buy = parse_multi_buy_deal(badge_text)
+                if multi_buy:
+                    if multi_buy.get("unit_price"):
+                        promo_price = multi_buy["unit_price"]
+                    promo_text = multi_buy["deal_text"][:255]
+                else:
+                    promo_price = price_nzd
+
+                promo_ends_at = parse_promo_end_date(badge_text)
+                is_member_only = detect_member_only(badge_text)
+        else:
+            promo_price = price_nzd
+            promo_text = "Special"
+
+    # Secondary promo badge check
+    if not promo_text:
+        promo_badge = _find_promo_badge(talker)
+        if promo_badge:
+            badge_text = promo_badge.text(strip=True)
+            if badge_text:
+                promo_text = badge_text[:255]
+
+                extracted_price = parse_promo_price(badge_text)
+                if extracted_price and extracted_price < price_nzd:
+                    promo_price = extracted_price
+
+                multi_buy = parse_multi_buy_deal(badge_text)
+                if multi_buy:
+                    if multi_buy.get("unit_price"):
+                        promo_price = multi_buy["unit_price"]
+                    promo_text = multi_buy["deal_text"][:255]
+
+                promo_ends_at = parse_promo_end_date(badge_text)
+                is_member_only = detect_member_only(badge_text)
+
+    return {
+        "chain": chain,
+        "source_id": source_id,
+        "name": full_name,
+        "brand": brand,
+        "category": category,
+        "price_nzd": price_nzd,
+        "promo_price_nzd": promo_price,
+        "promo_text": promo_text,
+        "promo_ends_at": promo_ends_at,
+        "is_member_only": is_member_only,
+        "pack_count": pack_count,
+        "unit_volume_ml": unit_volume_ml,
+        "total_volume_ml": total_volume_ml,
+        "abv_percent": abv_percent,
+        "url": url,
+        "image_url": image_url,
+        "store_identifier": store_slug,
+    }
+
+
+def _parse_pages(batch: List[tuple]) -> List[List[dict]]:
+    """Parse several pages in one worker call; each item is ``_parse_cityhive_page`` args."""
+    return [_parse_cityhive_page(*args) for args in batch]
+
+
 # Hardcoded fallback store slugs (representative subset)
 DEFAULT_STORES = [
     "albany",
@@ -132,15 +399,14 @@ class BottleOScraper(Scraper):
         """Load Bottle O store slugs from DB Store.url field."""
         slugs: set[str] = set()
         try:
+            # Shares the per-process TTL cache that run() already filled
             async with get_async_session() as session:
-                result = await session.execute(
-                    select(Store.url).where(Store.chain == self.chain)
-                )
-                for (url,) in result.all():
-                    if url:
-                        match = STORE_SLUG_PATTERN.search(url)
-                        if match:
-                            slugs.add(match.group(1).lower())
+                db_stores = await get_chain_stores(session, self.chain)
+            for store in db_stores:
+                if store.url:
+                    match = STORE_SLUG_PATTERN.search(store.url)
+                    if match:
+                        slugs.add(match.group(1).lower())
         except Exception as e:
             logger.warning(f"Failed loading {self.chain} stores from DB: {e}")
             return []
@@ -153,13 +419,27 @@ class BottleOScraper(Scraper):
 
     async def fetch_catalog_pages(self) -> List[str]:
         """
-        Fetch product pages from per-store CityHive sites and the franchise
-        catalog using plain HTTP with Pjax headers (no browser needed).
+        Materialize streamed Bottle O pages into a list.
 
-        Returns tagged HTML strings (per-store and franchise).
+        Returns TaggedPage objects (per-store and franchise).
+        """
+        return [page async for page in self.stream_catalog_pages()]
+
+    async def stream_catalog_pages(self) -> AsyncIterator[TaggedPage]:
+        """
+        Yield product pages from per-store CityHive sites and the franchise
+        catalog as they arrive, using plain HTTP with Pjax headers (no
+        browser needed).
+
+        Pages are persisted while later stores are still being fetched, so
+        the whole chain's HTML is never held at once. The bounded queue
+        applies backpressure: store fetches pause once PAGE_QUEUE_SIZE pages
+        are waiting.
         """
         if self.use_fixtures:
-            return await self._fetch_from_fixtures()
+            for page in await self._fetch_from_fixtures():
+                yield page
+            return
 
         # Resolve store list from DB when not explicitly provided
         if not self._stores_explicit and self._scrape_all_stores:
@@ -170,89 +450,118 @@ class BottleOScraper(Scraper):
             else:
                 logger.info(f"Using fallback Bottle O store list ({len(self.stores)} stores)")
 
-        pages: List[str] = []
-        shoppable_slugs: set[str] = set()
-
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "X-PJAX": "true",
-            "X-PJAX-Container": "[data-pjax=shopfront]",
-            "Accept": "text/html",
-        }
-
-        async with httpx.AsyncClient(headers=headers, timeout=30, follow_redirects=True) as client:
-            # --- Per-store scraping ---
-            for store_slug in self.stores:
-                logger.info(f"Scraping store: {store_slug}")
-                consecutive_failures = 0
-                max_failures = 3
-                store_had_products = False
+        # One long-lived pooled client for every store and category, so
+        # connections and TLS sessions are reused across runs
+        client = self.client
 
-                for category in CATEGORIES:
-                    if consecutive_failures >= max_failures:
-                        logger.warning(f"  Skipping remaining categories for {store_slug}")
-                        break
+        # --- Per-store scraping ---
+        # Each store is its own CityHive subdomain and is still walked one
+        # request at a time; only separate stores overlap.
+        sem = asyncio.Semaphore(STORE_CONCURRENCY)
+        queue: asyncio.Queue[Optional[TaggedPage]] = asyncio.Queue(maxsize=PAGE_QUEUE_SIZE)
+        shoppable_slugs: set[str] = set()
 
-                    logger.info(f"  Category: {category}")
-                    category_success = False
-                    page_num = 1
+        async def produce(store_slug: str) -> None:
+            async with sem:
+                try:
+                    async for page in self._stream_store_pages(client, store_slug):
+                        shoppable_slugs.add(store_slug)
+                        await queue.put(page)
+                except Exception as e:
+                    logger.error(f"Store fetch failed for {store_slug}: {e}")
 
-                    while True:
-                        url = self._build_url(store_slug, category, page_num)
+        producers = [asyncio.create_task(produce(slug)) for slug in self.stores]
 
-                        try:
-                            resp = await client.get(url)
-                            resp.raise_for_status()
-                            html = resp.text
+        async def close_queue() -> None:
+            await asyncio.gather(*producers)
+            await queue.put(None)
 
-                            tagged_html = self._tag_html(html, store_slug, category, page_num)
-                            pages.append(tagged_html)
-                            category_success = True
-                            store_had_products = True
+        closer = asyncio.create_task(close_queue())
+        page_count = 0
+        try:
+            while (page := await queue.get()) is not None:
+                page_count += 1
+                yield page
+        finally:
+            # Stop fetching if the consumer bails out early
+            for task in (*producers, closer):
+                task.cancel()
+
+        # --- Franchise fallback for non-shoppable stores ---
+        for page in await self._fetch_franchise_pages(client):
+            page_count += 1
+            yield page
 
-                            has_next = self._has_next_page_html(html)
-                            if not has_next:
-                                logger.info(f"    Scraped {page_num} page(s)")
-                                break
+        logger.info(
+            f"Fetched {page_count} total pages "
+            f"({len(shoppable_slugs)} shoppable stores)"
+        )
 
-                            page_num += 1
-                            if page_num > 50:
-                                logger.warning(f"    Hit page limit at page {page_num}")
-                                break
+    async def _stream_store_pages(
+        self, client: httpx.AsyncClient, store_slug: str
+    ) -> AsyncIterator[TaggedPage]:
+        """Fetch every category of one CityHive store, yielding tagged pages."""
+        logger.info(f"Scraping store: {store_slug}")
+        consecutive_failures = 0
+        max_failures = 3
+
+        for category_idx, category in enumerate(CATEGORIES):
+            if consecutive_failures >= max_failures:
+                logger.warning(f"  Skipping remaining categories for {store_slug}")
+                break
 
-                            await asyncio.sleep(DELAY_BETWEEN_REQUESTS)
+            # Pause between categories only; nothing follows the last one
+            if category_idx:
+                await asyncio.sleep(DELAY_BETWEEN_CATEGORIES)
+
+            logger.info(f"  Category: {category}")
+            category_success = False
+            page_num = 1
+
+            while True:
+                url = self._build_url(store_slug, category, page_num)
+
+                try:
+                    resp = await get_with_retry(
+                        client,
+                        url,
+                        headers=PJAX_HEADERS,
+                        timeout=REQUEST_TIMEOUT,
+                        follow_redirects=True,
+                    )
+                    resp.raise_for_status()
+                    html = resp.text
 
-                        except httpx.TimeoutException:
-                            logger.error(f"    Timeout loading {url}")
-                            break
-                        except Exception as e:
-                            logger.error(f"    Error loading {url}: {e}")
-                            break
+                    yield self._tag_html(html, store_slug, category, page_num)
+                    category_success = True
 
-                    if category_success:
-                        consecutive_failures = 0
-                    else:
-                        consecutive_failures += 1
+                    has_next = self._has_next_page_html(html)
+                    if not has_next:
+                        logger.info(f"    Scraped {page_num} page(s)")
+                        break
 
-                    await asyncio.sleep(DELAY_BETWEEN_CATEGORIES)
+                    page_num += 1
+                    if page_num > 50:
+                        logger.warning(f"    Hit page limit at page {page_num}")
+                        break
 
-                if store_had_products:
-                    shoppable_slugs.add(store_slug)
+                    await asyncio.sleep(DELAY_BETWEEN_REQUESTS)
 
-            # --- Franchise fallback for non-shoppable stores ---
-            franchise_pages = await self._fetch_franchise_pages(client)
-            if franchise_pages:
-                pages.extend(franchise_pages)
+                except httpx.TimeoutException:
+                    logger.error(f"    Timeout loading {url}")
+                    break
+                except Exception as e:
+                    logger.error(f"    Error loading {url}: {e}")
+                    break
 
-        logger.info(
-            f"Fetched {len(pages)} total pages "
-            f"({len(shoppable_slugs)} shoppable stores)"
-        )
-        return pages
+            if category_success:
+                consecutive_failures = 0
+            else:
+                consecutive_failures += 1
 
-    async def _fetch_franchise_pages(self, client: httpx.AsyncClient) -> List[str]:
+    async def _fetch_franchise_pages(self, client: httpx.AsyncClient) -> List[TaggedPage]:
         """Fetch franchise catalog pages via Pjax (same .talker HTML)."""
-        franchise_pages: List[str] = []
+        franchise_pages: List[TaggedPage] = []
 
         for cat_url in FRANCHISE_CATALOG_URLS:
             try:
@@ -262,7 +571,13 @@ class BottleOScraper(Scraper):
                 while True:
                     url = cat_url if page_num == 1 else f"{cat_url}&page={page_num}"
 
-                    resp = await client.get(url)
+                    resp = await get_with_retry(
+                        client,
+                        url,
+                        headers=PJAX_HEADERS,
+                        timeout=REQUEST_TIMEOUT,
+                        follow_redirects=True,
+                    )
                     resp.raise_for_status()
                     html = resp.text
 
@@ -293,217 +608,75 @@ class BottleOScraper(Scraper):
     # Parsing
     # ------------------------------------------------------------------
 
-    async def parse_products(self, payload: str) -> List[dict]:
-        """
-        Parse products from tagged CityHive HTML or franchise GTM JSON.
+    async def parse_products(self, payload: TaggedPage | dict | str) -> List[dict]:
         """
-        stripped = payload.lstrip()
-        if stripped.startswith("{"):
-            return self._parse_franchise_products(payload)
-        return self._parse_cityhive_products(payload)
+        Parse products from a tagged CityHive page or franchise GTM data.
 
-    def _parse_cityhive_products(self, tagged_html: str) -> List[dict]:
-        """Parse products from CityHive .talker HTML (per-store pages)."""
-        metadata, html = self._untag_html(tagged_html)
-        store_slug = metadata.get("store", "unknown")
+        Franchise data may arrive already decoded as a dict, or as JSON text.
+        """
+        if isinstance(payload, TaggedPage):
+            return _parse_cityhive_page(payload, self.chain)
+        return self._parse_franchise_products(payload)
 
-        tree = HTMLParser(html)
-        products = []
+    async def parse_all(self, pages: List[TaggedPage | dict | str]) -> List[List[dict] | Exception]:
+        """
+        Parse a window of pages, one product list per page in order.
 
-        for talker in tree.css(".talker"):
+        Big CityHive pages are split across the worker pool in one dispatch
+        per worker; franchise GTM payloads and small pages parse in-process.
+        """
+        results: List[List[dict] | Exception | None] = [None] * len(pages)
+
+        # Parsing holds the GIL, so big pages go to worker processes and the
+        # event loop keeps servicing the concurrent store fetches.
+        big = [
+            i for i, page in enumerate(pages)
+            if isinstance(page, TaggedPage) and len(page.html) > PROCESS_PARSE_MIN_CHARS
+        ]
+        if big:
+            workers = min(len(big), os.cpu_count() or 1)
+            batches = [big[w::workers] for w in range(workers)]
+            loop = asyncio.get_running_loop()
             try:
-                product = self._parse_talker_element(talker, store_slug)
-                if product:
-                    products.append(product)
-            except Exception as e:
-                logger.error(f"Error parsing talker element: {e}", exc_info=True)
-
-        logger.info(f"Parsed {len(products)} products from store {store_slug}")
-        return products
-
-    def _parse_talker_element(self, talker, store_slug: str) -> Optional[dict]:
-        """Parse a single product from a CityHive .talker element."""
-
-        # Product URL — the chain-wide product slug lives in the <a href>.
-        # The element's id="line_<hex>" is a per-store inventory line ID and
-        # MUST NOT be used as source_product_id (it caused the duplicate-product
-        # bug where the same SKU was inserted once per store).
-        link_elem = talker.css_first("a[href]")
-        href = link_elem.attributes.get("href", "") if link_elem else ""
-
-        source_id = _source_id_from_href(href)
-        if not source_id:
-            # Without a stable chain-level identifier we cannot safely upsert.
-            logger.warning(
-                "Skipping talker element with no usable href at store=%s (id=%s)",
-                store_slug,
-                talker.attributes.get("id", ""),
-            )
-            return None
-
-        # Product name
-        name_elem = talker.css_first(".talker__name")
-        if not name_elem:
-            return None
-
-        name_spans = name_elem.css("span")
-        if not name_spans:
-            return None
-
-        product_name = name_spans[0].text(strip=True)
-        if not product_name:
-            return None
-
-        # Size from .talker__name__size
-        size_text = ""
-        size_elem = name_elem.css_first(".talker__name__size")
-        if size_elem:
-            size_text = size_elem.text(strip=True)
-            full_name = f"{product_name} {size_text}".strip()
-        else:
-            full_name = product_name
-
-        # Price
-        price_elem = talker.css_first(".price__sell")
-        if not price_elem:
-            return None
-
-        price_text = price_elem.text(strip=True).replace("$", "").replace(",", "")
-        try:
-            price_nzd = float(price_text)
-        except (ValueError, TypeError):
-            return None
-
-        # Product URL (absolute)
-        url = None
-        if href:
-            if not href.startswith("http"):
-                url = f"https://{store_slug}.shop.thebottleo.co.nz{href}"
-            else:
-                url = href
-
-        # Image URL
-        image_url = None
-        source_elem = talker.css_first("source[type='image/webp']")
-        if source_elem:
-            srcset = source_elem.attributes.get("srcset")
-            if srcset:
-                image_url = srcset.split()[0]
-        if not image_url:
-            img_elem = talker.css_first("img")
-            if img_elem:
-                image_url = img_elem.attributes.get("src") or img_elem.attributes.get("data-src")
-
-        if image_url and "no_image" in image_url:
-            image_url = None
-
-        # Volume / ABV / brand / category
-        # CityHive truncates volume suffixes ("330c" / "330b" / "700m"),
-        # so expand them before parsing.
-        volume_info = (
-            parse_volume(expand_cityhive_size_codes(size_text))
-            or parse_volume(expand_cityhive_size_codes(full_name))
-        )
-        pack_count = volume_info.pack_count if volume_info else None
-        unit_volume_ml = volume_info.unit_volume_ml if volume_info else None
-        total_volume_ml = volume_info.total_volume_ml if volume_info else None
-
-        abv_percent = extract_abv(full_name) or extract_abv(size_text)
-        brand = infer_brand(full_name)
-        category = infer_category(full_name)
-
-        # Promotions
-        promo_price = None
-        promo_text = None
-        promo_ends_at = None
-        is_member_only = False
-
-        talker_classes = talker.attributes.get("class", "")
-        is_special = "talker--Special" in talker_classes or "talker--Discount" in talker_classes
-
-        if is_special:
-            sticker_label = talker.css_first(".talker__sticker__label")
-            if sticker_label:
-                badge_text = sticker_label.text(strip=True)
-                if badge_text:
-                    promo_text = badge_text[:255]
-
-                    multi_buy = parse_multi_buy_deal(badge_text)
-                    if multi_buy:
-                        if multi_buy.get("unit_price"):
-                            promo_price = multi_buy["unit_price"]
-                        promo_text = multi_buy["deal_text"][:255]
-                    else:
-                        promo_price = price_nzd
-
-                    promo_ends_at = parse_promo_end_date(badge_text)
-                    is_member_only = detect_member_only(badge_text)
+                pool = get_parse_pool()
+                parsed_batches = await asyncio.gather(*(
+                    loop.run_in_executor(
+                        pool, _parse_pages, [(pages[i], self.chain) for i in batch]
+                    )
+                    for batch in batches
+                ))
+            except BrokenProcessPool as e:
+                logger.warning(f"Parse worker pool broke, parsing in-process: {e}")
+                discard_parse_pool()
             else:
-                promo_price = price_nzd
-                promo_text = "Special"
-
-        # Secondary promo badge check
-        if not promo_text:
-            promo_badge = (
-                talker.css_first('[class*="promo"]')
-                or talker.css_first('[class*="deal"]')
-                or talker.css_first('[class*="save"]')
-                or talker.css_first('[class*="offer"]')
-            )
-            if promo_badge:
-                badge_text = promo_badge.text(strip=True)
-                if badge_text:
-                    promo_text = badge_text[:255]
-
-                    extracted_price = parse_promo_price(badge_text)
-                    if extracted_price and extracted_price < price_nzd:
-                        promo_price = extracted_price
-
-                    multi_buy = parse_multi_buy_deal(badge_text)
-                    if multi_buy:
-                        if multi_buy.get("unit_price"):
-                            promo_price = multi_buy["unit_price"]
-                        promo_text = multi_buy["deal_text"][:255]
-
-                    promo_ends_at = parse_promo_end_date(badge_text)
-                    is_member_only = detect_member_only(badge_text)
-
-        return {
-            "chain": self.chain,
-            "source_id": source_id,
-            "name": full_name,
-            "brand": brand,
-            "category": category,
-            "price_nzd": price_nzd,
-            "promo_price_nzd": promo_price,
-            "promo_text": promo_text,
-            "promo_ends_at": promo_ends_at,
-            "is_member_only": is_member_only,
-            "pack_count": pack_count,
-            "unit_volume_ml": unit_volume_ml,
-            "total_volume_ml": total_volume_ml,
-            "abv_percent": abv_percent,
-            "url": url,
-            "image_url": image_url,
-            "store_identifier": store_slug,
-        }
+                for batch, parsed_pages in zip(batches, parsed_batches):
+                    for i, parsed in zip(batch, parsed_pages):
+                        results[i] = parsed
+
+        for i, page in enumerate(pages):
+            if results[i] is None:
+                try:
+                    results[i] = await self.parse_products(page)
+                except Exception as e:
+                    results[i] = e
+        return results
 
     # ------------------------------------------------------------------
     # Franchise (GTM) parsing — fallback for non-shoppable stores
     # ------------------------------------------------------------------
 
-    def _parse_franchise_products(self, payload: str) -> List[dict]:
-        """Parse products from franchise GTM dataLayer JSON."""
+    def _parse_franchise_products(self, payload: dict | str) -> List[dict]:
+        """Parse products from franchise GTM dataLayer data (decoded or JSON)."""
         products = []
         try:
-            data = json.loads(payload)
+            data = payload if isinstance(payload, dict) else orjson.loads(payload)
             gtm_data = data.get("gtm", [])
             html = data.get("html", "")
 
             if not isinstance(gtm_data, list):
                 return products
 
-            images_by_name = self._extract_images_from_html(html)
+            images_by_name, image_variants = self._extract_images_from_html(html)
 
             for event in gtm_data:
                 if not isinstance(event, dict):
@@ -511,21 +684,23 @@ class BottleOScraper(Scraper):
                 if event.get("event") == "productListImpression":
                     impressions = event.get("ecommerce", {}).get("impressions", [])
                     for item in impressions:
-                        product = self._parse_gtm_product(item, images_by_name)
+                        product = self._parse_gtm_product(item, images_by_name, image_variants)
                         if product:
                             # Mark as franchise (no store_identifier)
                             product["_franchise"] = True
                             products.append(product)
 
             logger.info(f"Parsed {len(products)} products from franchise catalog")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse franchise JSON: {e}")
         except Exception as e:
             logger.error(f"Error parsing franchise products: {e}")
 
         return products
 
-    def _parse_gtm_product(self, item: dict, images_by_name: dict) -> Optional[dict]:
+    def _parse_gtm_product(
+        self, item: dict, images_by_name: dict, image_variants: Optional[dict] = None
+    ) -> Optional[dict]:
         """Parse a single product from GTM dataLayer impression."""
         try:
             source_id = item.get("id", "")
@@ -537,10 +712,7 @@ class BottleOScraper(Scraper):
             if not name or not source_id or price is None:
                 return None
 
-            if isinstance(price, str):
-                price = float(price.replace("$", "").replace(",", ""))
-            else:
-                price = float(price)
+            price = _coerce_price(price)
 
             if not brand:
                 brand = infer_brand(name)
@@ -579,23 +751,20 @@ class BottleOScraper(Scraper):
                     promo_text = coupon_text[:255]
 
             if item.get("original_price") or item.get("was_price"):
-                old_val = item.get("original_price") or item.get("was_price")
-                if isinstance(old_val, str):
-                    old_price = float(old_val.replace("$", "").replace(",", ""))
-                else:
-                    old_price = float(old_val)
+                old_price = _coerce_price(item.get("original_price") or item.get("was_price"))
                 if price < old_price and not promo_price:
                     promo_price = price
                     price = old_price
                     if not promo_text:
                         promo_text = "Special"
 
-            url = f"https://thebottleo.co.nz/products/{source_id}"
+            url = FRANCHISE_PRODUCT_URL_PREFIX + str(source_id)
 
-            normalized_name = self._normalize_name(name)
-            image_url = images_by_name.get(normalized_name)
-            if not image_url:
-                image_url = images_by_name.get(self._normalize_name_without_volume(name))
+            image_key = _normalize_name_without_volume(name) or _normalize_name(name)
+            image_url = images_by_name.get(image_key)
+            variants = image_variants.get(image_key) if image_variants else None
+            if variants:
+                image_url = variants.get(_normalize_name(name), image_url)
 
             return {
                 "chain": self.chain,
@@ -615,7 +784,7 @@ class BottleOScraper(Scraper):
                 "url": url,
                 "image_url": image_url,
             }
-        except Exception as e:
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
             logger.debug(f"Failed to parse GTM product: {e}")
             return None
 
@@ -623,30 +792,29 @@ class BottleOScraper(Scraper):
     # HTML helpers (shared with franchise GTM image extraction)
     # ------------------------------------------------------------------
 
-    def _normalize_name(self, name: str) -> str:
-        normalized = " ".join(name.replace("\n", " ").split()).lower()
-        normalized = re.sub(r"(\d+)\s*x\s*(\d+)", r"\1x\2", normalized)
-        return normalized
-
-    def _normalize_name_without_volume(self, name: str) -> str:
-        normalized = self._normalize_name(name)
-        normalized = re.sub(r"\b\d+x\d+ml\b", "", normalized)
-        normalized = re.sub(r"\b\d+ml\b", "", normalized)
-        normalized = re.sub(r"\b\d+l\b", "", normalized)
-        normalized = re.sub(r"\b\d+pk\b", "", normalized)
-        return " ".join(normalized.split())
-
-    def _extract_images_from_html(self, html: str) -> dict:
-        """Extract product images from HTML, keyed by normalised product name."""
+    def _extract_images_from_html(
+        self, html: str
+    ) -> tuple[dict[str, str], dict[str, dict[str, str]]]:
+        """Extract product images from HTML, keyed by volume-stripped name.
+
+        Returns (images, variants). ``images`` holds the first card's image
+        for each volume-stripped name; ``variants`` holds, per such name, the
+        full-name images of later cards that differ from it (e.g. a 6-pack
+        and a 24-pack of one beer).
+        """
         images: dict[str, str] = {}
-        tree = HTMLParser(html)
+        variants: dict[str, dict[str, str]] = {}
+        tree = LexborHTMLParser(html)
 
         for talker in tree.css(".talker"):
-            img = talker.css_first("img[src], img[data-src]")
+            # One plain descent for the image; the src/data-src fallback is
+            # cheaper as an attribute lookup than as a second selector
+            img = talker.css_first("img")
             if not img:
                 continue
-            src = img.attributes.get("src") or img.attributes.get("data-src")
-            if not src or "placeholder" in src.lower():
+            attrs = img.attrs
+            src = attrs.get("src") or attrs.get("data-src")
+            if not src or "placeholder" in src:
                 continue
             if not src.startswith("http"):
                 src = f"https:{src}" if src.startswith("//") else f"https://thebottleo.co.nz{src}"
@@ -655,15 +823,15 @@ class BottleOScraper(Scraper):
             if name_elem:
                 product_name = name_elem.text().strip()
                 if product_name:
-                    images[self._normalize_name(product_name)] = src
-                    no_vol = self._normalize_name_without_volume(product_name)
-                    if no_vol and no_vol not in images:
-                        images[no_vol] = src
+                    full_name = _normalize_name(product_name)
+                    key = _normalize_name_without_volume(product_name) or full_name
+                    if images.setdefault(key, src) != src:
+                        variants.setdefault(key, {})[full_name] = src
 
-        return images
+        return images, variants
 
     # ------------------------------------------------------------------
-    # CityHive HTML metadata tagging (mirroring LiquorCentreScraper)
+    # CityHive URL building and page tagging
     # ------------------------------------------------------------------
 
     def _build_url(self, store_slug: str, category: str, page: int = 1) -> str:
@@ -677,30 +845,15 @@ class BottleOScraper(Scraper):
         """Check for a next-page link in raw HTML."""
         return 'rel="next"' in html
 
-    def _tag_html(self, html: str, store: str, category: str, page: int) -> str:
-        return f"<!--METADATA:store={store},category={category},page={page}-->{html}"
-
-    def _untag_html(self, tagged_html: str) -> tuple:
-        metadata: dict[str, str] = {}
-        html = tagged_html
-
-        if tagged_html.startswith("<!--METADATA:"):
-            end_idx = tagged_html.find("-->")
-            if end_idx != -1:
-                metadata_str = tagged_html[13:end_idx]
-                html = tagged_html[end_idx + 3:]
-                for pair in metadata_str.split(","):
-                    if "=" in pair:
-                        key, value = pair.split("=", 1)
-                        metadata[key] = value
-
-        return metadata, html
+    def _tag_html(self, html: str, store: str, category: str, page: int) -> TaggedPage:
+        # Metadata rides beside the HTML; prefixing it would copy the whole page
+        return TaggedPage(store, category, page, html)
 
     # ------------------------------------------------------------------
     # Fixture support
     # ------------------------------------------------------------------
 
-    async def _fetch_from_fixtures(self) -> List[str]:
+    async def _fetch_from_fixtures(self) -> List[TaggedPage]:
         import os
 
         fixture_path = "app/scrapers/fixtures/bottle_o.html"
@@ -711,10 +864,6 @@ class BottleOScraper(Scraper):
         with open(fixture_path, "r", encoding="utf-8") as f:
             html = f.read()
 
-        # If the fixture already starts with a METADATA tag, return as-is
-        if html.startswith("<!--METADATA:"):
-            return [html]
-
         tagged = self._tag_html(html, "test-store", "beer", 1)
         return [tagged]
 
@@ -840,18 +989,21 @@ class BottleOScraper(Scraper):
         )
         product_id_map = {row.source_product_id: row.id for row in result}
 
-        # Existing prices for THIS store
+        # Existing prices for THIS store. Only the compared columns are
+        # projected, streamed in yield_per batches.
         product_ids = list(product_id_map.values())
-        existing_result = await session.execute(
-            select(Price).where(
+        existing_result = await session.stream(
+            select(
+                Price.product_id,
+                Price.price_nzd,
+                Price.promo_price_nzd,
+                Price.price_last_changed_at,
+            ).where(
                 Price.product_id.in_(product_ids),
                 Price.store_id == target_store.id,
-            )
+            ).execution_options(yield_per=EXISTING_PRICES_YIELD_PER)
         )
-        existing_map = {
-            price.product_id: price
-            for price in existing_result.scalars().all()
-        }
+        existing_map = {row.product_id: row async for row in existing_result}
 
         # Bulk upsert prices
         price_values = []
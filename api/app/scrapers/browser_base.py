@@ -23,7 +23,7 @@ from sqlalchemy.dialects.postgresql import insert
 
 from app.db.models import IngestionRun, Price, PriceHistory, Product, Store
 from app.db.session import async_transaction
-from app.scrapers.base import Scraper
+from app.scrapers.base import Scraper, get_chain_stores
 
 try:
     from undetected_playwright.tarnished import Malenia
@@ -366,10 +366,7 @@ class BrowserScraper(Scraper):
 
             async with async_transaction() as session:
                 # Get all stores for this chain
-                result = await session.execute(
-                    select(Store).where(Store.chain == self.chain)
-                )
-                stores = result.scalars().all()
+                stores = await get_chain_stores(session, self.chain)
 
                 if not stores:
                     logger.warning(f"No stores found for chain {self.chain}")
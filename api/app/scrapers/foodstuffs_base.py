@@ -13,8 +13,9 @@ from typing import List, Optional
 
 import httpx
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import Insert, insert
 
-from app.db.models import IngestionRun, Store
+from app.db.models import IngestionRun, Store, uuid7
 from app.db.session import async_transaction, get_async_session
 from app.scrapers.base import Scraper
 from app.scrapers.api_auth_base import APIAuthBase
@@ -330,6 +331,41 @@ class FoodstuffsAPIScraper(Scraper, APIAuthBase):
 
     _sweep_per_store = True
 
+    def _missing_stores_insert(self, api_ids) -> Insert:
+        """
+        Build one INSERT for stores seen in the API but not yet in the DB.
+
+        ON CONFLICT DO NOTHING relies on uq_store_chain_api_id/uq_store_chain_name,
+        so a store created concurrently by another run is skipped instead of
+        failing the whole batch.
+        """
+        from app.services.licensing_trusts import classify_store
+
+        rows = []
+        for api_id in api_ids:
+            store_name = f"{self.chain} #{api_id}"
+            # No lat/lon at creation; classifier falls back to override
+            # table by (chain, api_id) — which covers the known West
+            # Auckland supermarkets. Stores not in the override and
+            # without coordinates default to sells_alcohol=True.
+            classification = classify_store(
+                chain=self.chain, name=store_name, api_id=str(api_id)
+            )
+            if not classification.sells_alcohol:
+                logger.warning(
+                    f"Auto-created {self.chain} store {api_id} flagged "
+                    f"as sells_alcohol=False ({classification.reason})"
+                )
+            rows.append({
+                "id": uuid7(),
+                "chain": self.chain,
+                "api_id": str(api_id),
+                "name": store_name,
+                "sells_alcohol": classification.sells_alcohol,
+                "licensing_trust_area": classification.licensing_trust_area,
+            })
+        return insert(Store).values(rows).on_conflict_do_nothing()
+
     async def run(self) -> IngestionRun:
         """
         Run the scraper and persist data to database.
@@ -385,31 +421,8 @@ class FoodstuffsAPIScraper(Scraper, APIAuthBase):
             missing_api_ids = set(products_by_store.keys()) - set(store_map.keys())
             if missing_api_ids:
                 logger.info(f"Auto-creating {len(missing_api_ids)} new {self.chain} stores")
-                from app.services.licensing_trusts import classify_store
                 async with async_transaction() as session:
-                    for api_id in missing_api_ids:
-                        store_name = f"{self.chain} #{api_id}"
-                        # No lat/lon at creation; classifier falls back to override
-                        # table by (chain, api_id) — which covers the known West
-                        # Auckland supermarkets. Stores not in the override and
-                        # without coordinates default to sells_alcohol=True.
-                        classification = classify_store(
-                            chain=self.chain, name=store_name, api_id=str(api_id)
-                        )
-                        new_store = Store(
-                            chain=self.chain,
-                            api_id=str(api_id),
-                            name=store_name,
-                            sells_alcohol=classification.sells_alcohol,
-                            licensing_trust_area=classification.licensing_trust_area,
-                        )
-                        if not classification.sells_alcohol:
-                            logger.warning(
-                                f"Auto-created {self.chain} store {api_id} flagged "
-                                f"as sells_alcohol=False ({classification.reason})"
-                            )
-                        session.add(new_store)
-                    await session.flush()
+                    await session.execute(self._missing_stores_insert(missing_api_ids))
                     # Reload into store_map
                     result = await session.execute(
                         select(Store).where(
@@ -534,20 +547,17 @@ class FoodstuffsAPIScraper(Scraper, APIAuthBase):
         Returns:
             List of product dictionaries
         """
-        if not self.auth_token:
-            self.auth_token = await self._get_auth_token()
-            if not self.auth_token:
-                logger.error(
-                    f"Unable to authenticate {self.chain}: "
-                    "both direct HTTP and browser token capture failed"
-                )
-                return []
+        if not await self.ensure_auth():
+            logger.error(
+                f"Unable to authenticate {self.chain}: "
+                "both direct HTTP and browser token capture failed"
+            )
+            return []
 
         # Validate auth before full scrape
         if not await self._validate_auth():
             logger.warning(f"{self.chain}: stale token detected, refreshing...")
-            self.auth_token = await self._get_auth_token()
-            if not self.auth_token or not await self._validate_auth():
+            if not await self.ensure_auth(refresh=True) or not await self._validate_auth():
                 logger.error(f"{self.chain}: auth validation failed after refresh")
                 return []
 
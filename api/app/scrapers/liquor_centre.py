@@ -20,7 +20,7 @@ import httpx
 from datetime import datetime, timezone
 from sqlalchemy import select
 
-from app.scrapers.base import Scraper
+from app.scrapers.base import EXISTING_PRICES_YIELD_PER, Scraper
 from app.db.models import Price, Product, Store
 from app.db.session import get_async_session
 from app.services.parser_utils import (
@@ -639,16 +639,23 @@ class LiquorCentreScraper(Scraper):
             )
             product_id_map = {row.source_product_id: row.id for row in result}
 
-            # Get existing prices for THIS STORE ONLY
+            # Get existing prices for THIS STORE ONLY. Only the compared
+            # columns are projected, streamed in yield_per batches.
             product_ids = list(product_id_map.values())
-            existing_prices_result = await session.execute(
-                select(Price).where(
+            existing_prices_result = await session.stream(
+                select(
+                    Price.product_id,
+                    Price.price_nzd,
+                    Price.promo_price_nzd,
+                    Price.price_last_changed_at,
+                ).where(
                     Price.product_id.in_(product_ids),
                     Price.store_id == target_store.id
-                )
+                ).execution_options(yield_per=EXISTING_PRICES_YIELD_PER)
             )
-            existing_prices = existing_prices_result.scalars().all()
-            existing_prices_map = {price.product_id: price for price in existing_prices}
+            existing_prices_map = {
+                row.product_id: row async for row in existing_prices_result
+            }
 
             # Bulk upsert prices for this store
             price_values = []
@@ -27,6 +27,9 @@ DELAY_BETWEEN_CATEGORIES = 1.5  # seconds between different categories
 MAX_RETRIES = 3  # max retries for failed requests
 RETRY_DELAY = 2.0  # initial retry delay (doubles each retry)
 
+# Respectful User-Agent, sent per request since the HTTP client is shared
+HEADERS = {"User-Agent": "Liquorfy/1.0 (Price Comparison Bot; +https://liquorfy.co.nz)"}
+
 
 class SuperLiquorScraper(Scraper):
     chain = "super_liquor"
@@ -60,15 +63,10 @@ class SuperLiquorScraper(Scraper):
         self._specials_by_source_id: Dict[str, float] = {}
         self._specials_by_name: Dict[str, float] = {}
 
-        # Set respectful User-Agent header
-        self.client.headers.update({
-            "User-Agent": "Liquorfy/1.0 (Price Comparison Bot; +https://liquorfy.co.nz)"
-        })
-
     async def _fetch_with_retry(self, url: str, retry_count: int = 0) -> str:
         """Fetch URL with exponential backoff on errors."""
         try:
-            response = await self.client.get(url)
+            response = await self.client.get(url, headers=HEADERS)
             response.raise_for_status()
             return response.text
 
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Awaitable, Callable, Optional
 
+import orjson
 from redis import asyncio as aioredis
 
 from app.core.config import get_settings
@@ -16,7 +16,7 @@ class CacheClient:
     def __init__(self) -> None:
         # This will raise an exception if the URL is invalid or Redis is not available,
         # which is desirable to catch configuration issues early.
-        self._redis = aioredis.from_url(str(_settings.redis_url), decode_responses=True)
+        self._redis = aioredis.from_url(_settings.redis_url, decode_responses=True)
 
     async def get(self, key: str) -> Optional[str]:
         """Gets a value from the cache."""
@@ -50,7 +50,7 @@ async def cached_json(key: str, ttl: Optional[int], producer: Callable[[], Await
         try:
             cached = await _cache.get(key)
             if cached:
-                return json.loads(cached)
+                return orjson.loads(cached)
         except Exception:
             # If cache fails, log it but proceed to call the producer.
             # In a real-world scenario, you'd add logging here.
@@ -63,7 +63,7 @@ async def cached_json(key: str, ttl: Optional[int], producer: Callable[[], Await
         try:
             # We assume 'result' is JSON-serializable.
             # The producer function is responsible for returning a valid structure.
-            await _cache.set(key, json.dumps(result), ttl)
+            await _cache.set(key, orjson.dumps(result).decode(), ttl)
         except Exception:
             # If writing to cache fails, log it but don't fail the request.
             # In a real-world scenario, you'd add logging here.
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 VOLUME_PATTERN = re.compile(
@@ -24,6 +25,11 @@ PACK_ONLY_PATTERN = re.compile(
 )
 ABV_PATTERN = re.compile(r"(?<!\d)(?P<abv>\d{1,2}(?:\.\d+)?)\s*%")
 
+# Multi-store scrapers see the same product title once per store, so the
+# pure name parsers below are memoised. Bounded so long-running workers
+# don't grow without limit.
+PARSE_CACHE_SIZE = 65536
+
 # CityHive (Bottle-O / Liquor Centre) product names truncate the volume
 # suffix to a single letter — "330c" = 330ml can, "330b" = 330ml bottle,
 # "700m" = 700ml (truncated mL). The volume parser doesn't recognise
@@ -57,6 +63,7 @@ class ParsedVolume:
     total_volume_ml: Optional[float]
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def parse_volume(text: str) -> ParsedVolume:
     normalized = text.lower().replace("litres", "l").replace("liters", "l")
     normalized = normalized.replace("litre", "l").replace("ltr", "l")
@@ -89,6 +96,7 @@ def parse_volume(text: str) -> ParsedVolume:
     return ParsedVolume(pack_count=None, unit_volume_ml=None, total_volume_ml=None)
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def extract_abv(text: str) -> Optional[float]:
     match = ABV_PATTERN.search(text)
     if match:
@@ -133,12 +141,46 @@ KNOWN_BRANDS = [
     "Long White", "White Claw", "Pals", "Alba",
 ]
 
-# Pre-compile word-boundary brand patterns, sorted longest-first so
-# "Smirnoff Ice" is tried before "Smirnoff".
-_BRAND_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
-    (brand, re.compile(r"\b" + re.escape(brand.lower()) + r"\b"))
-    for brand in sorted(KNOWN_BRANDS, key=len, reverse=True)
-]
+
+def _compile_keyword_scanner(keywords: list[str]) -> re.Pattern[str]:
+    """Compile keywords into one word-boundary alternation.
+
+    The alternation sits inside a lookahead so ``finditer`` reports a match
+    at every position, including overlapping ones. ``keywords`` must be
+    sorted longest-first so the longest keyword wins at each position.
+    """
+    alternation = "|".join(re.escape(kw) for kw in keywords)
+    return re.compile(r"(?=\b(" + alternation + r")\b)")
+
+
+def _best_keyword(
+    scanner: re.Pattern[str], rank: dict[str, int], text: str
+) -> Optional[str]:
+    """Return the lowest-ranked keyword found in text in a single scan."""
+    best: Optional[str] = None
+    for match in scanner.finditer(text):
+        keyword = match.group(1)
+        if best is None or rank[keyword] < rank[best]:
+            best = keyword
+    return best
+
+
+# Brands sorted longest-first so "Smirnoff Ice" beats "Smirnoff"; ties keep
+# KNOWN_BRANDS order.
+_BRANDS_BY_KEYWORD: dict[str, str] = {
+    brand.lower(): brand for brand in sorted(KNOWN_BRANDS, key=len, reverse=True)
+}
+_BRAND_RANK: dict[str, int] = {kw: i for i, kw in enumerate(_BRANDS_BY_KEYWORD)}
+_BRAND_SCANNER = _compile_keyword_scanner(list(_BRANDS_BY_KEYWORD))
+
+# Leading descriptor words skipped by the unknown-brand fallback.
+_BRAND_FALLBACK_DESCRIPTORS = frozenset({
+    "red", "white", "dry", "sweet", "light", "dark", "premium",
+    "classic", "special", "reserve", "estate", "select", "original",
+    "vintage", "gold", "silver", "extra", "super", "pure", "craft",
+    "limited", "edition", "double", "triple", "single", "old", "new",
+    "best", "fine", "smooth", "crisp", "fresh", "natural",
+})
 
 # Words that must NOT appear as the second word in a two-word brand fallback.
 # Prevents "Akarua Pinot", "1792 Small", "Alba Cuba", etc.
@@ -205,16 +247,20 @@ CATEGORY_KEYWORDS = {
     "non_alcoholic": ["non-alcoholic", "alcohol free", "0%", "zero alcohol"],
 }
 
-# Pre-compile word-boundary patterns for category keywords.
-# For each category, keywords sorted longest-first.
-_CATEGORY_KEYWORD_PATTERNS: dict[str, list[tuple[str, re.Pattern[str]]]] = {}
+# Category keywords sorted longest-first; a keyword shared by several
+# categories (or a length tie) resolves to the category listed first above.
+_CATEGORY_BY_KEYWORD: dict[str, str] = {}
 for _cat, _kws in CATEGORY_KEYWORDS.items():
-    _CATEGORY_KEYWORD_PATTERNS[_cat] = [
-        (kw, re.compile(r"\b" + re.escape(kw) + r"\b"))
-        for kw in sorted(_kws, key=len, reverse=True)
-    ]
+    for _kw in _kws:
+        _CATEGORY_BY_KEYWORD.setdefault(_kw, _cat)
+_CATEGORY_BY_KEYWORD = dict(
+    sorted(_CATEGORY_BY_KEYWORD.items(), key=lambda item: -len(item[0]))
+)
+_CATEGORY_KEYWORD_RANK: dict[str, int] = {kw: i for i, kw in enumerate(_CATEGORY_BY_KEYWORD)}
+_CATEGORY_KEYWORD_SCANNER = _compile_keyword_scanner(list(_CATEGORY_BY_KEYWORD))
 
 
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def infer_brand(product_name: str) -> Optional[str]:
     """
     Infer brand from product name by matching against known brands.
@@ -222,24 +268,17 @@ def infer_brand(product_name: str) -> Optional[str]:
     """
     name_lower = product_name.lower()
 
-    for brand, pattern in _BRAND_PATTERNS:
-        if pattern.search(name_lower):
-            return brand
+    keyword = _best_keyword(_BRAND_SCANNER, _BRAND_RANK, name_lower)
+    if keyword is not None:
+        return _BRANDS_BY_KEYWORD[keyword]
 
     # If no known brand found, try to extract first word(s) before common separators
     # This catches brands we don't know about
     words = product_name.split()
     if words:
-        common_descriptors = {
-            "red", "white", "dry", "sweet", "light", "dark", "premium",
-            "classic", "special", "reserve", "estate", "select", "original",
-            "vintage", "gold", "silver", "extra", "super", "pure", "craft",
-            "limited", "edition", "double", "triple", "single", "old", "new",
-            "best", "fine", "smooth", "crisp", "fresh", "natural",
-        }
         # Skip leading descriptors — they aren't brand names
         start = 0
-        while start < len(words) and words[start].lower() in common_descriptors:
+        while start < len(words) and words[start].lower() in _BRAND_FALLBACK_DESCRIPTORS:
             start += 1
         if start >= len(words):
             return None
@@ -248,7 +287,7 @@ def infer_brand(product_name: str) -> Optional[str]:
             second = words[start + 1]
             second_lower = second.lower()
             if (
-                second_lower not in common_descriptors
+                second_lower not in _BRAND_FALLBACK_DESCRIPTORS
                 and second_lower not in _FALLBACK_SECOND_WORD_REJECT
                 and not any(c.isdigit() for c in second)
             ):
@@ -462,13 +501,25 @@ BRAND_CATEGORY_MAP = {
     "the macallan": "scotch",
 }
 
-# Pre-compile word-boundary patterns for brand-category map, sorted longest-first.
-_BRAND_CATEGORY_PATTERNS: list[tuple[str, str, re.Pattern[str]]] = [
-    (brand, cat, re.compile(r"\b" + re.escape(brand) + r"\b"))
-    for brand, cat in sorted(BRAND_CATEGORY_MAP.items(), key=lambda x: len(x[0]), reverse=True)
-]
+# Brand-category map keywords, sorted longest-first.
+_BRAND_CATEGORY_KEYWORDS = sorted(BRAND_CATEGORY_MAP, key=len, reverse=True)
+_BRAND_CATEGORY_RANK: dict[str, int] = {kw: i for i, kw in enumerate(_BRAND_CATEGORY_KEYWORDS)}
+_BRAND_CATEGORY_SCANNER = _compile_keyword_scanner(_BRAND_CATEGORY_KEYWORDS)
+
+
+_ALCOHOL_WORD_PATTERN = re.compile(r"\b(?:alc|hard)\b")
 
 
+def _has_alcohol_indicator(text: str) -> bool:
+    return bool(
+        ABV_PATTERN.search(text)
+        or "alcoholic" in text
+        or "spiked" in text
+        or _ALCOHOL_WORD_PATTERN.search(text)
+    )
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
 def infer_category(product_name: str) -> Optional[str]:
     """
     Infer product category from name by matching keywords.
@@ -476,47 +527,56 @@ def infer_category(product_name: str) -> Optional[str]:
     """
     name_lower = product_name.lower()
 
-    def has_alcohol_indicator(text: str) -> bool:
-        return bool(
-            ABV_PATTERN.search(text)
-            or "alcoholic" in text
-            or re.search(r"\balc\b", text)
-            or "spiked" in text
-            or re.search(r"\bhard\b", text)
-        )
-
     # First, try keyword-based matching (most specific)
     # This catches "India Pale Ale", "Sauvignon Blanc", etc.
     best_match = None
     best_match_length = 0
 
-    for category, kw_patterns in _CATEGORY_KEYWORD_PATTERNS.items():
-        for keyword, pattern in kw_patterns:
-            if len(keyword) > best_match_length and pattern.search(name_lower):
-                best_match = category
-                best_match_length = len(keyword)
+    keyword = _best_keyword(_CATEGORY_KEYWORD_SCANNER, _CATEGORY_KEYWORD_RANK, name_lower)
+    if keyword is not None:
+        best_match = _CATEGORY_BY_KEYWORD[keyword]
+        best_match_length = len(keyword)
 
     # If we found a specific keyword match (longer than 4 chars), use it
     # This prevents generic brand mappings from overriding specific types
     if best_match and best_match_length > 4:
-        if best_match == "mixer" and has_alcohol_indicator(name_lower):
+        if best_match == "mixer" and _has_alcohol_indicator(name_lower):
             return "rtd"
         return best_match
 
     # Mixer keywords with alcohol indicators should be RTDs, not mixers
-    if best_match == "mixer" and has_alcohol_indicator(name_lower):
+    if best_match == "mixer" and _has_alcohol_indicator(name_lower):
         return "rtd"
 
     # Otherwise, check brand-specific mappings as fallback
     # Only use these for products without clear type indicators
-    for _brand, category, pattern in _BRAND_CATEGORY_PATTERNS:
-        if pattern.search(name_lower):
-            return category
+    brand_keyword = _best_keyword(_BRAND_CATEGORY_SCANNER, _BRAND_CATEGORY_RANK, name_lower)
+    if brand_keyword is not None:
+        return BRAND_CATEGORY_MAP[brand_keyword]
 
     # Return the keyword match even if it's short (e.g., "ale", "gin")
     return best_match
 
 
+@dataclass(frozen=True)
+class TitleAttrs:
+    volume: ParsedVolume
+    abv: Optional[float]
+    brand: Optional[str]
+    category: Optional[str]
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_title_attrs(title: str) -> TitleAttrs:
+    """Volume, ABV, brand and category of a product title, from one cache lookup."""
+    return TitleAttrs(
+        volume=parse_volume(title),
+        abv=extract_abv(title),
+        brand=infer_brand(title),
+        category=infer_category(title),
+    )
+
+
 # Category hierarchy - maps specific categories to their parent categories
 CATEGORY_HIERARCHY = {
     # Beer subcategories → beer
@@ -663,9 +723,10 @@ _SUGAR_FREE_KEYWORDS = [
     "low carb", "low-carb", "zero carb", "zero carbs", "no carbs",
 ]
 
-_SUGAR_FREE_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"\b" + re.escape(kw) + r"\b") for kw in _SUGAR_FREE_KEYWORDS
-]
+# One alternation over every keyword, so a name is scanned once.
+_SUGAR_FREE_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(kw) for kw in _SUGAR_FREE_KEYWORDS) + r")\b"
+)
 
 # Brands whose entire product line is sugar-free
 _SUGAR_FREE_BRANDS = {"clean collective"}
@@ -674,7 +735,7 @@ _SUGAR_FREE_BRANDS = {"clean collective"}
 def detect_sugar_free(product_name: str) -> bool:
     """Detect if a product is sugar-free based on its name."""
     name_lower = product_name.lower()
-    if any(p.search(name_lower) for p in _SUGAR_FREE_PATTERNS):
+    if _SUGAR_FREE_PATTERN.search(name_lower):
         return True
     return any(brand in name_lower for brand in _SUGAR_FREE_BRANDS)
 
@@ -686,6 +747,8 @@ __all__ = [
     "expand_cityhive_size_codes",
     "infer_brand",
     "infer_category",
+    "parse_title_attrs",
+    "TitleAttrs",
     "CATEGORY_HIERARCHY",
     "format_product_name",
     "detect_sugar_free",
@@ -112,18 +112,17 @@ def client(mock_redis) -> Iterator[TestClient]:
         with patch("app.db.session.async_transaction", mock_transaction):
             with patch("app.routes.health.async_transaction", mock_transaction):
                 with patch("app.routes.products.get_async_session", mock_get_session):
-                    with patch("app.routes.stores.get_async_session", mock_get_session):
-                        with patch("app.routes.worker.get_async_session", mock_get_session):
-                            # Mock Redis
-                            async def mock_get_redis():
-                                return mock_redis
-
-                            with patch("app.core.auth.get_redis_client", mock_get_redis):
-                                with patch("app.routes.health.get_redis_client", mock_get_redis):
-                                    with patch("app.services.cache._cache._redis", mock_redis):
-                                        from app.main import app
-                                        with TestClient(app) as test_client:
-                                            yield test_client
+                    with patch("app.routes.worker.get_async_session", mock_get_session):
+                        # Mock Redis
+                        async def mock_get_redis():
+                            return mock_redis
+
+                        with patch("app.core.auth.get_redis_client", mock_get_redis):
+                            with patch("app.routes.health.get_redis_client", mock_get_redis):
+                                with patch("app.services.cache._cache._redis", mock_redis):
+                                    from app.main import app
+                                    with TestClient(app) as test_client:
+                                        yield test_client
 
 
 @pytest.fixture
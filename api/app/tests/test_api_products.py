@@ -107,6 +107,24 @@ class TestListProductsEndpoint:
 
         assert response.status_code == 200
 
+    def test_products_cache_key_is_sorted_compact_json(self, client: TestClient):
+        """The list cache key should be stable, key-sorted JSON of the query params."""
+        mock_response = {"items": [], "total": 0, "page": 1, "page_size": 20}
+        keys = []
+
+        async def capture_cache_key(cache_key: str, *_args):
+            keys.append(cache_key)
+            return mock_response
+
+        with patch("app.routes.products.cached_json", AsyncMock(side_effect=capture_cache_key)):
+            client.get("/products?lat=-36.8485&lon=174.7633&radius_km=5&chain=countdown")
+            client.get("/products?chain=countdown&radius_km=5&lon=174.7633&lat=-36.8485")
+
+        assert keys[0] == keys[1]
+        parsed = json.loads(keys[0])
+        assert list(parsed) == sorted(parsed)
+        assert keys[0] == json.dumps(parsed, sort_keys=True, separators=(",", ":"))
+
     def test_products_distance_sort_requires_location(self, client: TestClient):
         """Distance sort should return 422 when location is missing."""
         response = client.get("/products?promo_only=true&sort=distance&page_size=10")
@@ -261,3 +279,27 @@ class TestProductsLocationValidation:
         """Radius below 1km should be rejected."""
         response = client.get("/products?lat=-36.8485&lon=174.7633&radius_km=0.5")
         assert response.status_code in [400, 422]
+
+
+class TestSplitCsvParams:
+    """Tests for the comma-separated filter splitting used by _params."""
+
+    def test_split_csv_params_flattens_and_strips(self):
+        """Repeated and comma-joined values should flatten into one cleaned list."""
+        from app.routes.products import _split_csv_params
+
+        assert _split_csv_params(["countdown, paknsave", " new_world ", ",", ""]) == [
+            "countdown", "paknsave", "new_world",
+        ]
+        assert _split_csv_params(None) == []
+
+    def test_split_csv_is_cached_and_returns_fresh_lists(self):
+        """Repeated values should hit the cache without sharing the returned list."""
+        from app.routes.products import _split_csv, _split_csv_params
+
+        _split_csv.cache_clear()
+        first = _split_csv_params(["countdown,paknsave"])
+        second = _split_csv_params(["countdown,paknsave"])
+
+        assert first == second and first is not second
+        assert _split_csv.cache_info().hits == 1
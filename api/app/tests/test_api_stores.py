@@ -61,6 +61,38 @@ class TestStoresNearbyEndpoint:
         call_kwargs = mock_fetch.call_args.kwargs
         assert call_kwargs["radius_km"] == 2.0
 
+    def test_stores_uses_injected_session(self, client: TestClient):
+        """The handler should query with the session provided by the db_dep dependency."""
+        from app.db.session import db_dep
+        from app.schemas.products import StoreListResponse
+
+        session = object()
+        mock_fetch = AsyncMock(return_value=StoreListResponse(items=[]))
+        client.app.dependency_overrides[db_dep] = lambda: session
+        try:
+            with patch("app.routes.stores.fetch_stores_nearby", mock_fetch):
+                client.get("/stores?lat=-36.8485&lon=174.7633")
+        finally:
+            client.app.dependency_overrides.pop(db_dep, None)
+
+        assert mock_fetch.call_args.args[0] is session
+
+    def test_stores_default_radius_comes_from_injected_settings(self, client: TestClient):
+        """Handlers read settings per request via Depends(get_settings)."""
+        from app.core.config import get_settings
+        from app.schemas.products import StoreListResponse
+
+        settings = get_settings().copy(update={"default_radius_km": 4.5})
+        mock_fetch = AsyncMock(return_value=StoreListResponse(items=[]))
+        client.app.dependency_overrides[get_settings] = lambda: settings
+        try:
+            with patch("app.routes.stores.fetch_stores_nearby", mock_fetch):
+                client.get("/stores?lat=-36.8485&lon=174.7633")
+        finally:
+            client.app.dependency_overrides.pop(get_settings, None)
+
+        assert mock_fetch.call_args.kwargs["radius_km"] == 4.5
+
     def test_stores_radius_max_exceeded(self, client: TestClient):
         """Stores endpoint should reject radius > 10km."""
         response = client.get("/stores?lat=-36.8485&lon=174.7633&radius_km=11")
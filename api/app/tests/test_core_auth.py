@@ -92,6 +92,56 @@ class TestTokenCreation:
         # Allow 2 minute tolerance for test execution time
         assert abs((exp_time - expected_exp).total_seconds()) < 120
 
+    def test_precomputed_hs256_matches_stock_hmac(self):
+        """The cached HS256 template should sign exactly like PyJWT's HMACAlgorithm."""
+        from jwt.algorithms import HMACAlgorithm
+
+        from app.core import auth
+
+        secret = b"s" * 32
+        alg = auth._PrecomputedHS256(secret)
+        stock = HMACAlgorithm(HMACAlgorithm.SHA256)
+        msg = b"header.payload"
+
+        key = alg.prepare_key(secret)
+        assert alg.sign(msg, key) == stock.sign(msg, secret)
+        assert alg.sign(msg, key) == alg.sign(msg, key)  # template is copied, not consumed
+        assert alg.verify(msg, key, stock.sign(msg, secret))
+        assert not alg.verify(msg, key, stock.sign(msg, b"o" * 32))
+        # A different key takes the stock path
+        assert alg.sign(msg, b"o" * 32) == stock.sign(msg, b"o" * 32)
+
+    def test_shared_jwt_rejects_tampered_signature(self):
+        """Tokens decoded through the shared JWS instance still verify signatures."""
+        from app.core import auth
+
+        header, payload, signature = create_admin_token().split(".")
+        forged = ".".join([header, payload, signature[:-2] + ("AA" if signature[-2:] != "AA" else "BB")])
+
+        with pytest.raises(jwt.InvalidSignatureError):
+            auth._decode_token(forged)
+
+    def test_shared_jwt_matches_stock_pyjwt(self):
+        """Tokens round-trip with jwt.encode/jwt.decode, and exp/nbf are enforced like PyJWT."""
+        import time
+        from app.core import auth
+
+        claims = {"sub": "admin", "exp": int(time.time()) + 60}
+        token = auth._encode_token(claims)
+
+        assert token == jwt.encode(claims, auth._jwt_secret, algorithm="HS256")
+        assert jwt.decode(token, auth._jwt_secret, algorithms=["HS256"]) == claims
+        assert auth._decode_token(jwt.encode(claims, auth._jwt_secret, algorithm="HS256")) == claims
+
+        with pytest.raises(jwt.ExpiredSignatureError):
+            auth._decode_token(auth._encode_token({**claims, "exp": int(time.time()) - 1}))
+        with pytest.raises(jwt.ImmatureSignatureError):
+            auth._decode_token(auth._encode_token({**claims, "nbf": int(time.time()) + 60}))
+        with pytest.raises(jwt.DecodeError):
+            auth._decode_token(auth._encode_token({**claims, "exp": "tomorrow"}))
+        with pytest.raises(jwt.InvalidAlgorithmError):
+            auth._decode_token(jwt.encode(claims, auth._jwt_secret, algorithm="HS512"))
+
     def test_create_token_with_valid_credentials(self):
         """create_token_with_credentials should return token for valid creds."""
         from app.core.config import get_settings
@@ -293,3 +343,110 @@ class TestRequireAdmin:
 
         assert exc_info.value.status_code == 403
         assert "Forbidden" in str(exc_info.value.detail)
+
+    @pytest.mark.asyncio
+    async def test_require_admin_caches_verified_token(self):
+        """require_admin should skip jwt.decode for a recently verified token."""
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core import auth
+
+        auth._token_cache.clear()
+        token = create_admin_token()
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with patch("app.core.auth.is_token_revoked", AsyncMock(return_value=False)):
+            first = await require_admin(credentials)
+            with patch.object(auth, "_decode_token", side_effect=AssertionError("decoded twice")):
+                second = await require_admin(credentials)
+
+        assert first == second
+        assert list(auth._token_cache) == [auth._token_digest(token)]
+
+    @pytest.mark.asyncio
+    async def test_require_admin_cache_entry_ttl_is_capped(self):
+        """Cache entries should expire at min(token exp, now + 30s)."""
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core import auth
+        from app.core.config import get_settings
+
+        secret = get_settings().secret_key
+        username = get_settings().admin_username
+        now = float(int(dt.datetime.now(dt.timezone.utc).timestamp()))
+
+        long_token = jwt.encode({"sub": username, "exp": int(now) + 3600}, secret, algorithm="HS256")
+        short_token = jwt.encode({"sub": username, "exp": int(now) + 10}, secret, algorithm="HS256")
+
+        auth._token_cache.clear()
+        with patch("app.core.auth.is_token_revoked", AsyncMock(return_value=False)), \
+                patch("app.core.auth.time.time", return_value=now):
+            for token in (long_token, short_token):
+                await require_admin(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token))
+
+        assert auth._token_cache[auth._token_digest(long_token)][1] == now + auth._TOKEN_CACHE_TTL
+        assert auth._token_cache[auth._token_digest(short_token)][1] == now + 10
+
+        # Once the capped expiry passes, the entry is dropped on lookup
+        with patch("app.core.auth.time.time", return_value=now + auth._TOKEN_CACHE_TTL):
+            assert auth._cached_admin(auth._token_digest(long_token)) is None
+        assert auth._token_digest(long_token) not in auth._token_cache
+
+    @pytest.mark.asyncio
+    async def test_revoke_token_evicts_cache_even_if_redis_fails(self):
+        """revoke_token should drop the cached entry before touching Redis."""
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core import auth
+
+        auth._token_cache.clear()
+        token = create_admin_token()
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with patch("app.core.auth.is_token_revoked", AsyncMock(return_value=False)):
+            await require_admin(credentials)
+        assert auth._token_digest(token) in auth._token_cache
+
+        with patch("app.core.auth.get_redis_client", AsyncMock(side_effect=Exception("Redis down"))):
+            await revoke_token(token)
+
+        assert auth._token_digest(token) not in auth._token_cache
+
+    @pytest.mark.asyncio
+    async def test_require_admin_cache_still_checks_revocation(self):
+        """A cached token should still be rejected once revoked."""
+        from fastapi import HTTPException
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core import auth
+
+        auth._token_cache.clear()
+        token = create_admin_token()
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with patch("app.core.auth.is_token_revoked", AsyncMock(return_value=False)):
+            await require_admin(credentials)
+
+        with patch("app.core.auth.is_token_revoked", AsyncMock(return_value=True)):
+            with pytest.raises(HTTPException) as exc_info:
+                await require_admin(credentials)
+
+        assert exc_info.value.status_code == 401
+
+    @pytest.mark.asyncio
+    async def test_require_admin_does_not_cache_forbidden_token(self):
+        """Tokens for non-admin subjects should never be cached."""
+        from fastapi import HTTPException
+        from fastapi.security import HTTPAuthorizationCredentials
+        from app.core import auth
+        from app.core.config import get_settings
+
+        auth._token_cache.clear()
+        payload = {
+            "sub": "not_admin",
+            "exp": dt.datetime.utcnow() + dt.timedelta(hours=12),
+        }
+        token = jwt.encode(payload, get_settings().secret_key, algorithm="HS256")
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with patch("app.core.auth.is_token_revoked", AsyncMock(return_value=False)):
+            with pytest.raises(HTTPException):
+                await require_admin(credentials)
+
+        assert len(auth._token_cache) == 0
@@ -134,6 +134,18 @@ class TestFeatureFlagsValidation:
         assert settings.feature_enabled_chains["countdown"] is True
         assert settings.feature_enabled_chains["paknsave"] is True
 
+    def test_feature_flags_on_and_bare_keys(self):
+        """'on' counts as truthy; bare keys and empty entries are handled."""
+        settings = Settings(
+            secret_key="valid-secret-key-that-is-long-enough-123",
+            feature_enabled_chains="countdown:on,,paknsave, :true,newworld:"
+        )
+        assert settings.feature_enabled_chains == {
+            "countdown": True,
+            "paknsave": False,
+            "newworld": False,
+        }
+
     def test_feature_flags_invalid_format_raises(self):
         """Feature flags should reject invalid formats."""
         with pytest.raises(ValueError, match="Unsupported feature flag format"):
@@ -174,6 +186,17 @@ class TestSettingsDefaults:
         )
         assert settings.api_cache_ttl_seconds == 600
 
+    def test_urls_are_plain_strings(self):
+        """Connection URLs are kept verbatim as str for SQLAlchemy/redis to parse."""
+        settings = Settings(
+            secret_key="valid-secret-key-that-is-long-enough-123",
+            database_url="postgresql://u:p@host:5432/db?sslmode=require&pgbouncer=true",
+            redis_url="redis://redis:6379/0",
+        )
+        assert type(settings.database_url) is str
+        assert settings.database_url == "postgresql://u:p@host:5432/db?sslmode=require&pgbouncer=true"
+        assert type(settings.redis_url) is str
+
 
 class TestGetSettings:
     """Tests for get_settings function."""
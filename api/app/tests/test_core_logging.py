@@ -0,0 +1,34 @@
+"""Tests for logging configuration."""
+from __future__ import annotations
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config import get_settings
+from app.core.logging import configure_logging
+
+
+@pytest.fixture
+def sqlalchemy_logger():
+    """Restore the sqlalchemy.engine logger level after each test."""
+    logger = logging.getLogger("sqlalchemy.engine")
+    level = logger.level
+    yield logger
+    logger.setLevel(level)
+
+
+class TestConfigureLogging:
+    """Tests for configure_logging()."""
+
+    @pytest.mark.parametrize(
+        "environment, expected",
+        [("development", logging.INFO), ("staging", logging.WARNING), ("production", logging.WARNING)],
+    )
+    def test_sqlalchemy_engine_level_follows_environment(self, sqlalchemy_logger, environment, expected):
+        """SQL statements are logged at INFO in development only."""
+        settings = get_settings().copy(update={"environment": environment})
+        with patch("app.core.logging.get_settings", return_value=settings):
+            configure_logging()
+        assert sqlalchemy_logger.level == expected
@@ -0,0 +1,68 @@
+"""Tests for COPY-based bulk inserts."""
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.db.bulk import copy_insert
+from app.db.models import Price
+
+
+def _asyncpg_session():
+    raw = MagicMock()
+    raw.driver_connection.copy_records_to_table = AsyncMock()
+    conn = MagicMock()
+    conn.dialect.driver = "asyncpg"
+    conn.get_raw_connection = AsyncMock(return_value=raw)
+    session = MagicMock()
+    session.connection = AsyncMock(return_value=conn)
+    session.execute = AsyncMock()
+    return session, raw.driver_connection.copy_records_to_table
+
+
+class TestCopyInsert:
+    """Tests for copy_insert()."""
+
+    @pytest.mark.asyncio
+    async def test_uses_copy_on_asyncpg(self):
+        """On asyncpg, rows go through copy_records_to_table with Python-side defaults filled in."""
+        session, copy = _asyncpg_session()
+        row = {"id": "p1", "product_id": "prod", "store_id": "store", "price_nzd": 9.99}
+
+        await copy_insert(session, Price, [row])
+
+        session.execute.assert_not_awaited()
+        call = copy.await_args
+        assert call.args == ("prices",)
+        columns = call.kwargs["columns"]
+        record = dict(zip(columns, call.kwargs["records"][0]))
+        assert record["price_nzd"] == 9.99
+        assert record["currency"] == "NZD"
+        assert record["is_member_only"] is False
+        assert "created_at" not in columns  # left to the server default
+
+    @pytest.mark.asyncio
+    async def test_callable_defaults_are_generated_per_row(self):
+        """Rows without an id get a fresh UUID each from the column's Python default."""
+        session, copy = _asyncpg_session()
+        rows = [{"product_id": "prod", "store_id": f"s{i}", "price_nzd": 1.0} for i in range(2)]
+
+        await copy_insert(session, Price, rows)
+
+        columns = copy.await_args.kwargs["columns"]
+        ids = [dict(zip(columns, record))["id"] for record in copy.await_args.kwargs["records"]]
+        assert all(isinstance(value, uuid.UUID) for value in ids)
+        assert ids[0] != ids[1]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_insert_on_other_drivers(self):
+        """Non-asyncpg drivers get a plain multi-row INSERT."""
+        session, copy = _asyncpg_session()
+        (await session.connection()).dialect.driver = "aiosqlite"
+
+        await copy_insert(session, Price, [{"product_id": "prod"}])
+
+        session.execute.assert_awaited_once()
+        copy.assert_not_awaited()
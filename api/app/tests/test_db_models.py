@@ -3,10 +3,13 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
 
-from app.db.models import IngestionRun, Price, Product, Store
+from app.db.models import IngestionRun, Price, Product, Store, uuid7
 
 
 class TestStoreModel:
@@ -84,6 +87,18 @@ class TestProductModel:
         assert product.abv_percent is None
 
 
+    def test_source_product_id_uses_c_collation_on_postgres_only(self):
+        """source_product_id is byte-compared on Postgres; other dialects get a plain VARCHAR."""
+        from sqlalchemy.dialects import sqlite
+        from sqlalchemy.schema import CreateTable
+
+        pg_ddl = str(CreateTable(Product.__table__).compile(dialect=postgresql.dialect()))
+        sqlite_ddl = str(CreateTable(Product.__table__).compile(dialect=sqlite.dialect()))
+
+        assert 'source_product_id VARCHAR(128) COLLATE "C" NOT NULL' in pg_ddl
+        assert "source_product_id VARCHAR(128) NOT NULL" in sqlite_ddl
+
+
 class TestPriceModel:
     """Tests for Price model."""
 
@@ -121,6 +136,32 @@ class TestPriceModel:
         )
         assert price.is_member_only is False
 
+    def test_price_value_indexes(self):
+        """Price filters should be served by the store-scoped and partial promo indexes."""
+        indexes = {index.name: index for index in Price.__table__.indexes}
+
+        assert [c.name for c in indexes["ix_price_store_price"].columns] == ["store_id", "price_nzd"]
+        promo = indexes["ix_price_promo"]
+        assert [c.name for c in promo.columns] == ["promo_price_nzd"]
+        assert str(promo.dialect_options["postgresql"]["where"]) == "promo_price_nzd IS NOT NULL"
+        assert "ix_price_price_nzd" not in indexes
+        assert "ix_price_promo_price_nzd" not in indexes
+
+    def test_relationships_raise_instead_of_lazy_loading(self):
+        """Store/Product/Price relationships must be loaded explicitly (selectinload/joinedload)."""
+        from sqlalchemy import inspect
+
+        for model, key in [(Store, "prices"), (Product, "prices"), (Price, "product"), (Price, "store")]:
+            assert inspect(model).relationships[key].lazy == "raise_on_sql"
+
+    def test_price_last_changed_index_is_brin(self):
+        """ix_price_last_changed should be a BRIN index on Postgres."""
+        index = next(i for i in Price.__table__.indexes if i.name == "ix_price_last_changed")
+        ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+        assert "USING brin" in ddl
+        assert "pages_per_range = 32" in ddl
+
 
 class TestIngestionRunModel:
     """Tests for IngestionRun model."""
@@ -221,3 +262,27 @@ class TestUuidGeneration:
             status="running",
             started_at=datetime.utcnow()
         )
+
+    def test_uuid7_version_and_variant(self):
+        """uuid7 should produce RFC 9562 version-7 UUIDs."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_uuid7_embeds_millisecond_timestamp(self):
+        """The top 48 bits should be the creation time in Unix milliseconds."""
+        with patch("app.db.models.time.time_ns", return_value=1_700_000_000_123_456_789):
+            value = uuid7()
+        assert value.int >> 80 == 1_700_000_000_123
+
+    def test_uuid7_orders_by_time(self):
+        """Keys generated in later milliseconds should sort after earlier ones."""
+        with patch("app.db.models.time.time_ns", side_effect=[n * 1_000_000 for n in range(1, 51)]):
+            values = [uuid7() for _ in range(50)]
+        assert values == sorted(values)
+
+    def test_primary_keys_default_to_uuid7(self):
+        """All UUID primary keys should default to time-ordered ids."""
+        for model in (Store, Product, Price, IngestionRun):
+            default = model.__table__.c.id.default
+            assert default.arg(None).version == 7
@@ -0,0 +1,120 @@
+"""Tests for the development seed script."""
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import MetaData, func, insert, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.schema import CreateTable
+
+from app.db import seed as seed_module
+from app.db.base import Base
+from app.db.models import Price, PriceHistory, Product, Store
+
+
+@pytest.fixture
+async def seed_session_factory():
+    """SQLite engine with the app schema, minus the PostGIS-only geog column."""
+    metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        copy = table.to_metadata(metadata)
+        if "geog" in copy.c:
+            copy._columns.remove(copy.c.geog)
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        # Plain CREATE TABLE (no DDL events) so geoalchemy2 doesn't add its spatial index
+        await conn.run_sync(
+            lambda sync_conn: [sync_conn.execute(CreateTable(t)) for t in metadata.sorted_tables]
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _run_seed(factory) -> None:
+    @asynccontextmanager
+    async def session_cm():
+        async with factory() as session:
+            yield session
+
+    with patch("app.db.seed.get_async_session", session_cm):
+        await seed_module.seed()
+
+
+class TestSeed:
+    """Tests for seed()."""
+
+    @pytest.mark.asyncio
+    async def test_seed_row_counts(self, seed_session_factory):
+        """seed() should write 3 stores per chain, 60 products/prices and 30 days of history each."""
+        await _run_seed(seed_session_factory)
+
+        async with seed_session_factory() as session:
+            counts = {
+                model.__name__: (await session.execute(select(func.count()).select_from(model))).scalar()
+                for model in (Store, Product, Price, PriceHistory)
+            }
+
+        assert counts == {
+            "Store": 3 * len(seed_module.CHAINS),
+            "Product": 60,
+            "Price": 60,
+            "PriceHistory": 60 * 30,
+        }
+
+    @pytest.mark.asyncio
+    async def test_seed_foreign_keys_link_up(self, seed_session_factory):
+        """Price and history rows should reference seeded products and same-chain stores."""
+        await _run_seed(seed_session_factory)
+
+        async with seed_session_factory() as session:
+            price_rows = (await session.execute(
+                select(Product.chain, Store.chain)
+                .select_from(Price)
+                .join(Product, Product.id == Price.product_id)
+                .join(Store, Store.id == Price.store_id)
+            )).all()
+            orphan_history = (await session.execute(
+                select(func.count())
+                .select_from(PriceHistory)
+                .outerjoin(
+                    Price,
+                    (Price.product_id == PriceHistory.product_id)
+                    & (Price.store_id == PriceHistory.store_id),
+                )
+                .where(Price.id.is_(None))
+            )).scalar()
+
+        assert len(price_rows) == 60
+        assert all(product_chain == store_chain for product_chain, store_chain in price_rows)
+        assert orphan_history == 0
+
+    @pytest.mark.asyncio
+    async def test_seed_fills_server_defaults(self, seed_session_factory):
+        """Base timestamps should be filled by the server default on the Core insert path."""
+        await _run_seed(seed_session_factory)
+
+        async with seed_session_factory() as session:
+            missing = (await session.execute(
+                select(func.count()).select_from(Store).where(
+                    Store.created_at.is_(None) | Store.updated_at.is_(None)
+                )
+            )).scalar()
+
+        assert missing == 0
+
+    def test_store_insert_leaves_geog_to_server(self):
+        """The bulk Store INSERT must not bind geog so Postgres computes it from lat/lon."""
+        compiled = insert(Store).compile(
+            dialect=postgresql.dialect(),
+            column_keys=["id", "name", "chain", "lat", "lon", "address", "region"],
+        )
+        assert "geog" not in str(compiled)
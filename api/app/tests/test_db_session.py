@@ -0,0 +1,111 @@
+"""Tests for lazy engine/session construction in app.db.session."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.db import session as db_session
+
+API_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture(autouse=True)
+def fresh_engines():
+    """Start and finish each test with no engines or session factories cached."""
+    caches = (
+        db_session.get_async_engine,
+        db_session.get_sync_engine,
+        db_session._get_async_session_factory,
+        db_session._get_session_factory,
+    )
+    for cached in caches:
+        cached.cache_clear()
+    yield
+    for cached in caches:
+        cached.cache_clear()
+
+
+class TestLazyEngines:
+    """Engines are only built on first use."""
+
+    def test_import_does_not_create_engines(self):
+        """Importing app.db.session should not build any engine."""
+        code = (
+            "import app.db.session as s; "
+            "print(s.get_async_engine.cache_info().currsize, s.get_sync_engine.cache_info().currsize)"
+        )
+        env = {**os.environ, "PYTHONPATH": str(API_ROOT)}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=API_ROOT, env=env, capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.split() == ["0", "0"]
+
+    def test_async_engine_is_built_once(self):
+        """get_async_engine should return the same engine on every call."""
+        engine = db_session.get_async_engine()
+        assert db_session.get_async_engine() is engine
+        assert engine.url.drivername == "postgresql+asyncpg"
+
+    def test_sync_engine_uses_psycopg(self):
+        """get_sync_engine should adapt the URL to the psycopg driver."""
+        assert db_session.get_sync_engine().url.drivername == "postgresql+psycopg"
+
+    def test_legacy_engine_attributes_resolve_lazily(self):
+        """_async_engine/_sync_engine remain importable and point at the cached engines."""
+        from app.db.session import _async_engine, _sync_engine
+
+        assert _async_engine is db_session.get_async_engine()
+        assert _sync_engine is db_session.get_sync_engine()
+
+    def test_unknown_attribute_raises(self):
+        """Module __getattr__ should not swallow typos."""
+        with pytest.raises(AttributeError):
+            db_session.not_a_real_engine  # noqa: B018
+
+    @pytest.mark.parametrize("environment", ["development", "production"])
+    def test_engine_echo_is_disabled(self, environment):
+        """SQL logging is left to the sqlalchemy.engine logger, never engine echo."""
+        settings = get_settings().copy(update={"environment": environment})
+        with patch("app.db.session.get_settings", return_value=settings):
+            engine = db_session.get_async_engine()
+        assert not engine.echo
+
+
+class TestLazySessions:
+    """Session helpers build the factory on first use."""
+
+    @pytest.mark.asyncio
+    async def test_get_async_session_binds_cached_engine(self):
+        """get_async_session should hand out sessions bound to the lazily built engine."""
+        async with db_session.get_async_session() as session:
+            assert isinstance(session, AsyncSession)
+            assert session.bind is db_session.get_async_engine()
+        assert db_session._get_async_session_factory.cache_info().currsize == 1
+
+    @pytest.mark.asyncio
+    async def test_dispose_engines_skips_unbuilt_engines(self):
+        """dispose_engines should not build engines just to dispose them."""
+        await db_session.dispose_engines()
+        assert db_session.get_async_engine.cache_info().currsize == 0
+        assert db_session.get_sync_engine.cache_info().currsize == 0
+
+    @pytest.mark.asyncio
+    async def test_db_dep_yields_session_and_closes_it(self):
+        """db_dep should yield a session from get_async_session and close it afterwards."""
+        dep = db_session.db_dep()
+        session = await dep.__anext__()
+        assert isinstance(session, AsyncSession)
+        assert session.bind is db_session.get_async_engine()
+
+        with patch.object(session, "close", wraps=session.close) as close:
+            with pytest.raises(StopAsyncIteration):
+                await dep.__anext__()
+        close.assert_awaited()
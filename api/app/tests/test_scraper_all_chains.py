@@ -6,25 +6,31 @@ and that we have complete NZ-wide coverage.
 """
 from __future__ import annotations
 
+import asyncio
+import gzip
 import json
 from datetime import datetime
 from pathlib import Path
 from typing import List
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from app.scrapers.registry import CHAINS, get_chain_scraper
+from app.scrapers import base as base_module
 from app.scrapers.base import Scraper
 from app.scrapers.countdown_api import CountdownAPIScraper
 from app.scrapers.new_world_api import NewWorldAPIScraper
 from app.scrapers.paknsave_api import PakNSaveAPIScraper
 from app.scrapers.liquorland import LiquorlandScraper, SPECIALS_PAYLOAD_PREFIX
 from app.scrapers.super_liquor import SuperLiquorScraper
-from app.scrapers.bottle_o import BottleOScraper
+from app.scrapers import bottle_o as bottle_o_module
+from app.scrapers.bottle_o import BottleOScraper, TaggedPage
 from app.scrapers.glengarry import GlengarryScraper
 from app.scrapers.thirsty_liquor import ThirstyLiquorScraper
-from app.scrapers.black_bull import BlackBullScraper
+from app.scrapers import black_bull as black_bull_module
+from app.scrapers.black_bull import DEFAULT_STORES as BLACK_BULL_STORES, BlackBullScraper
 
 
 # ============================================================================
@@ -348,13 +354,154 @@ class TestBottleOScraper:
         assert scraper.chain == "bottle_o"
         assert len(scraper.catalog_urls) > 0
 
+    @pytest.mark.asyncio
+    async def test_fetch_uses_shared_client_with_pjax_headers(self):
+        """Store and franchise pages go through the pooled shared client with Pjax headers."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text='<div class="talker ">x</div>')
+
+        scraper = BottleOScraper(stores=["albany"])
+        scraper.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(bottle_o_module, "CATEGORIES", ["beer"]), \
+             patch.object(bottle_o_module, "FRANCHISE_CATALOG_URLS", ["https://thebottleo.co.nz/search?q[]=category:beer"]), \
+             patch.object(bottle_o_module.asyncio, "sleep", AsyncMock()):
+            pages = await scraper.fetch_catalog_pages()
+        await scraper.client.aclose()
+
+        assert [r.url.host for r in requests] == ["albany.shop.thebottleo.co.nz", "thebottleo.co.nz"]
+        assert all(r.headers["X-PJAX"] == "true" for r in requests)
+        assert pages[0] == TaggedPage("albany", "beer", 1, '<div class="talker ">x</div>')
+
+    @pytest.mark.asyncio
+    async def test_stores_are_streamed_concurrently(self):
+        """Stores overlap up to STORE_CONCURRENCY, a failing store is skipped, franchise pages come last."""
+        slugs = [f"store-{i}" for i in range(6)]
+        scraper = BottleOScraper(stores=slugs)
+        in_flight = {"now": 0, "peak": 0}
+
+        async def stream_store(client, slug):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0)
+            in_flight["now"] -= 1
+            if slug == "store-5":
+                raise RuntimeError("boom")
+            yield f"page-{slug}"
+
+        with patch.object(scraper, "_stream_store_pages", side_effect=stream_store), \
+             patch.object(scraper, "_fetch_franchise_pages", AsyncMock(return_value=["franchise"])):
+            pages = await scraper.fetch_catalog_pages()
+
+        assert sorted(pages[:-1]) == [f"page-store-{i}" for i in range(5)]
+        assert pages[-1] == "franchise"
+        assert in_flight["peak"] == bottle_o_module.STORE_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_no_category_delay_after_last_category(self):
+        """The inter-category pause only runs between categories, not after the last one."""
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda r: httpx.Response(200, text="")))
+        sleep = AsyncMock()
+        with patch.object(bottle_o_module, "CATEGORIES", ["beer", "wine"]), \
+             patch.object(bottle_o_module.asyncio, "sleep", sleep):
+            pages = [page async for page in BottleOScraper()._stream_store_pages(client, "albany")]
+        await client.aclose()
+
+        assert len(pages) == 2
+        sleep.assert_awaited_once_with(bottle_o_module.DELAY_BETWEEN_CATEGORIES)
+
+    @pytest.mark.asyncio
+    async def test_store_pages_retry_transient_errors(self):
+        """A 503 or dropped connection is retried with backoff instead of abandoning the category."""
+        responses = [httpx.Response(503), httpx.ConnectError("reset"), httpx.Response(200, text="ok")]
+
+        def handler(request):
+            outcome = responses.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        sleep = AsyncMock()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch.object(bottle_o_module, "CATEGORIES", ["beer"]), \
+             patch.object(base_module.asyncio, "sleep", sleep):
+            pages = [page async for page in BottleOScraper()._stream_store_pages(client, "albany")]
+        await client.aclose()
+
+        assert pages == [TaggedPage("albany", "beer", 1, "ok")]
+        assert sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_store_slugs_reuse_cached_chain_stores(self):
+        """Store slugs come from the per-process chain store cache, so repeat runs skip the query."""
+        from contextlib import asynccontextmanager
+
+        from app.db.models import Store
+        rows = [
+            Store(chain="bottle_o", url="https://Albany.shop.thebottleo.co.nz", name="Albany"),
+            Store(chain="bottle_o", url="https://thebottleo.co.nz", name="Franchise"),
+            Store(chain="bottle_o", url=None, name="No site"),
+        ]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(scalars=lambda: MagicMock(all=lambda: rows)))
+
+        @asynccontextmanager
+        async def session_cm():
+            yield session
+
+        base_module._stores_cache.clear()
+        try:
+            with patch.object(bottle_o_module, "get_async_session", session_cm):
+                first = await BottleOScraper()._load_store_slugs_from_db()
+                second = await BottleOScraper()._load_store_slugs_from_db()
+        finally:
+            base_module._stores_cache.clear()
+
+        assert first == second == ["albany"]
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_store_prices_are_streamed_as_column_projection(self):
+        """Existing per-store prices are streamed as (id, price) tuples, not ORM rows."""
+        from sqlalchemy.dialects import postgresql
+
+        scraper = BottleOScraper()
+        store = MagicMock(url="https://albany.shop.thebottleo.co.nz", id="s1")
+        existing = MagicMock(product_id="pid-1", price_nzd=29.99, promo_price_nzd=None)
+
+        async def rows():
+            yield existing
+
+        session = MagicMock()
+        session.flush = AsyncMock()
+        session.execute = AsyncMock(side_effect=[
+            None,
+            [MagicMock(id="pid-1", source_product_id="steinlager")],
+            None,
+        ])
+        session.stream = AsyncMock(return_value=rows())
+        product = {
+            "chain": "bottle_o", "source_id": "steinlager", "name": "Steinlager Pure 12x330ml",
+            "price_nzd": 29.99, "store_identifier": "albany",
+        }
+
+        changed = await scraper._upsert_for_store(session, [product], [store], "albany")
+
+        assert changed == 0
+        query = session.stream.await_args.args[0]
+        assert query.get_execution_options()["yield_per"] == 1000
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("SELECT prices.product_id, prices.price_nzd, prices.promo_price_nzd, prices.price_last_changed_at")
+
     @pytest.mark.asyncio
     async def test_parse_products_from_cityhive_html(self):
         """Test parsing products from CityHive .talker HTML."""
         scraper = BottleOScraper()
 
-        tagged_html = (
-            '<!--METADATA:store=test-store,category=beer,page=1-->'
+        tagged_html = TaggedPage(
+            "test-store", "beer", 1,
             '<html><body>'
             '<div class="talker" id="line_abc123def456">'
             '  <a href="/product/test-beer">'
@@ -430,13 +577,145 @@ class TestBottleOScraper:
         assert products[0]["chain"] == "bottle_o"
         assert products[0].get("_franchise") is True
 
+    @pytest.mark.asyncio
+    async def test_parse_products_accepts_decoded_gtm_data(self):
+        """Franchise data passed as a dict parses without a JSON round trip."""
+        scraper = BottleOScraper()
+        data = {
+            "gtm": [{"event": "productListImpression", "ecommerce": {"impressions": [
+                {"id": "test-beer-123", "name": "Test Beer 6x330ml", "price": 24.99},
+            ]}}],
+            "html": "",
+        }
+
+        with patch.object(bottle_o_module, "orjson") as orjson:
+            products = await scraper.parse_products(data)
+
+        orjson.loads.assert_not_called()
+        assert products == await scraper.parse_products("  " + json.dumps(data))
+        assert await scraper.parse_products("{not json") == []
+
+    def test_gtm_string_prices_are_coerced(self):
+        """String GTM prices are stripped of "$" and ","; a higher was_price marks a sale."""
+        scraper = BottleOScraper()
+        item = {"id": "gin", "name": "Test Gin 1L", "price": "$1,049.99", "was_price": "$1,199.99"}
+
+        product = scraper._parse_gtm_product(item, {})
+
+        assert product["price_nzd"] == 1199.99
+        assert product["promo_price_nzd"] == 1049.99
+        assert product["url"] == "https://thebottleo.co.nz/products/gin"
+        assert scraper._parse_gtm_product({**item, "price": "n/a"}, {}) is None
+
+    @pytest.mark.asyncio
+    async def test_secondary_promo_badge_prefers_promo_class(self):
+        """With several badge-like elements, a "promo" class beats "deal"/"save"/"offer"."""
+        tagged_html = TaggedPage(
+            "test-store", "beer", 1,
+            '<div class="talker" id="line_1">'
+            '  <a href="/product/badge-beer">'
+            '    <div class="talker__name"><span>Badge Beer</span></div>'
+            '    <div class="price"><span class="price__sell">$20.00</span></div>'
+            '    <span class="offer-tag">Great offer</span>'
+            '    <span class="promo-tag">Save $5</span>'
+            '  </a>'
+            '</div>'
+        )
+
+        (product,) = await BottleOScraper().parse_products(tagged_html)
+
+        assert product["promo_text"] == "Save $5"
+
+    @pytest.mark.asyncio
+    async def test_special_class_matches_whole_class_tokens(self):
+        """talker--Discount marks a special; a class merely containing the name does not."""
+        def card(classes):
+            return TaggedPage(
+                "test-store", "beer", 1,
+                f'<div class="{classes}" id="line_1">'
+                '  <a href="/product/class-beer">'
+                '    <div class="talker__name"><span>Class Beer</span></div>'
+                '    <div class="price"><span class="price__sell">$20.00</span></div>'
+                '  </a>'
+                '</div>'
+            )
+
+        scraper = BottleOScraper()
+        (discounted,) = await scraper.parse_products(card("talker talker--Discount"))
+        (plain,) = await scraper.parse_products(card("talker talker--SpecialOrder"))
+
+        assert discounted["promo_text"] == "Special"
+        assert discounted["promo_price_nzd"] == 20.0
+        assert plain["promo_text"] is None
+
+    @pytest.mark.asyncio
+    async def test_large_pages_parse_in_worker_process(self):
+        """Pages over PROCESS_PARSE_MIN_CHARS parse in the pool with the same result as in-process."""
+        scraper = BottleOScraper()
+        page = TaggedPage(
+            "albany", "beer", 1,
+            '<div class="talker" id="line_1">'
+            '  <a href="/product/pool-beer">'
+            '    <div class="talker__name"><span>Pool Beer</span>'
+            '      <span class="talker__name__size">6 x 330ml</span></div>'
+            '    <div class="price"><span class="price__sell">$19.99</span></div>'
+            '  </a>'
+            '</div>'
+        )
+        (inline,) = await scraper.parse_all([page])
+
+        try:
+            with patch.object(bottle_o_module, "PROCESS_PARSE_MIN_CHARS", 0), \
+                 patch.object(bottle_o_module, "get_parse_pool", wraps=base_module.get_parse_pool) as pool:
+                (pooled,) = await scraper.parse_all([page])
+        finally:
+            base_module.discard_parse_pool()
+
+        assert pooled == inline
+        assert inline[0]["source_id"] == "pool-beer"
+        pool.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_parse_all_keeps_franchise_payloads_in_process(self):
+        """Only big CityHive pages are dispatched, one batch per worker; GTM payloads parse inline."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        scraper = BottleOScraper()
+        pages = [
+            TaggedPage(f"store-{i}", "beer", 1, '<div class="talker"></div>') for i in range(3)
+        ]
+        franchise = {"gtm": [{"event": "productListImpression", "ecommerce": {"impressions": [
+            {"id": "gin", "name": "Test Gin 1L", "price": 49.99},
+        ]}}], "html": ""}
+        loop = asyncio.get_running_loop()
+
+        async def run_inline(pool, fn, batch):
+            return fn(batch)
+
+        with patch.object(bottle_o_module, "PROCESS_PARSE_MIN_CHARS", 0), \
+             patch.object(bottle_o_module.os, "cpu_count", return_value=2), \
+             patch.object(bottle_o_module, "get_parse_pool"), \
+             patch.object(loop, "run_in_executor", AsyncMock(side_effect=run_inline)) as dispatch:
+            results = await scraper.parse_all(pages + [franchise])
+
+        assert dispatch.await_count == 2
+        assert results[:3] == [[], [], []]
+        assert [p["source_id"] for p in results[3]] == ["gin"]
+
+        with patch.object(bottle_o_module, "PROCESS_PARSE_MIN_CHARS", 0), \
+             patch.object(bottle_o_module, "get_parse_pool"), \
+             patch.object(bottle_o_module, "discard_parse_pool") as discard, \
+             patch.object(loop, "run_in_executor", AsyncMock(side_effect=BrokenProcessPool("dead"))):
+            assert await scraper.parse_all(pages[:1]) == [[]]
+        discard.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_parse_cityhive_special_product(self):
         """Test parsing a product with Special class from CityHive HTML."""
         scraper = BottleOScraper()
 
-        tagged_html = (
-            '<!--METADATA:store=test-store,category=beer,page=1-->'
+        tagged_html = TaggedPage(
+            "test-store", "beer", 1,
             '<html><body>'
             '<div class="talker talker--Special" id="line_aabbccdd1122">'
             '  <a href="/product/promo-beer">'
@@ -458,13 +737,65 @@ class TestBottleOScraper:
         assert len(products) == 1
         assert products[0]["promo_text"] is not None
 
+    def test_extract_images_from_html(self):
+        """Franchise images are keyed by normalised name; placeholders and imageless cards are skipped."""
+        html = (
+            '<div class="talker"><img data-src="//cdn.example/beer.jpg">'
+            '<div class="talker__name">Test Beer 6 x 330ml</div></div>'
+            '<div class="talker"><img src="/img/placeholder.png">'
+            '<div class="talker__name">Placeholder Wine</div></div>'
+            '<div class="talker"><div class="talker__name">No Image Cider</div></div>'
+        )
+
+        images, variants = BottleOScraper()._extract_images_from_html(html)
+
+        assert images == {"test beer": "https://cdn.example/beer.jpg"}
+        assert variants == {}
+
+    def test_gtm_image_lookup_disambiguates_pack_sizes(self):
+        """Cards sharing a volume-stripped name fall back to a full-name match."""
+        scraper = BottleOScraper()
+        html = (
+            '<div class="talker"><img src="https://cdn.example/6pk.jpg">'
+            '<div class="talker__name">Test Beer 6 x 330ml</div></div>'
+            '<div class="talker"><img src="https://cdn.example/24pk.jpg">'
+            '<div class="talker__name">Test Beer 24 x 330ml</div></div>'
+        )
+        images, variants = scraper._extract_images_from_html(html)
+
+        def image_for(name):
+            item = {"id": "beer", "name": name, "price": 10}
+            return scraper._parse_gtm_product(item, images, variants)["image_url"]
+
+        assert image_for("Test Beer 24x330ml") == "https://cdn.example/24pk.jpg"
+        assert image_for("Test Beer 6x330ml") == "https://cdn.example/6pk.jpg"
+        assert image_for("Test Beer 12x330ml") == "https://cdn.example/6pk.jpg"
+
     def test_normalize_name(self):
         """Test product name normalization."""
-        scraper = BottleOScraper()
+        normalize = bottle_o_module._normalize_name
+
+        assert normalize("Test Beer 12 x 330ml") == "test beer 12x330ml"
+        assert normalize("Test  Beer") == "test beer"
+        assert normalize("TEST BEER") == "test beer"
 
-        assert scraper._normalize_name("Test Beer 12 x 330ml") == "test beer 12x330ml"
-        assert scraper._normalize_name("Test  Beer") == "test beer"
-        assert scraper._normalize_name("TEST BEER") == "test beer"
+    def test_normalize_name_without_volume(self):
+        """Volume and pack tokens are dropped from the image-matching key."""
+        normalize = bottle_o_module._normalize_name_without_volume
+
+        assert normalize("Test Beer 12 x 330ml") == "test beer"
+        assert normalize("Test Wine 750ml") == "test wine"
+        assert normalize("Cask Red 3l 6pk") == "cask red"
+
+    def test_normalize_name_is_memoised(self):
+        """A name seen on the HTML side is served from cache on the GTM side."""
+        normalize = bottle_o_module._normalize_name
+        normalize.cache_clear()
+
+        normalize("Test Beer 12 x 330ml")
+        normalize("Test Beer 12 x 330ml")
+
+        assert normalize.cache_info().hits == 1
 
     @pytest.mark.asyncio
     async def test_same_sku_different_stores_shares_source_id(self):
@@ -479,8 +810,8 @@ class TestBottleOScraper:
 
         # Same product (/product/corona-extra-6x355ml) at two different stores,
         # with different per-store line_<hex> IDs and different prices.
-        store_a_html = (
-            '<!--METADATA:store=albany,category=beer,page=1-->'
+        store_a_html = TaggedPage(
+            "albany", "beer", 1,
             '<html><body>'
             '<div class="talker" id="line_aaaaaaaaaaaa">'
             '  <a href="/product/corona-extra-6x355ml">'
@@ -493,8 +824,8 @@ class TestBottleOScraper:
             '</div>'
             '</body></html>'
         )
-        store_b_html = (
-            '<!--METADATA:store=botany,category=beer,page=1-->'
+        store_b_html = TaggedPage(
+            "botany", "beer", 1,
             '<html><body>'
             '<div class="talker" id="line_bbbbbbbbbbbb">'
             '  <a href="/product/corona-extra-6x355ml">'
@@ -526,8 +857,8 @@ class TestBottleOScraper:
         """A talker with no usable href must be skipped, not faked into a row."""
         scraper = BottleOScraper()
 
-        html = (
-            '<!--METADATA:store=test-store,category=beer,page=1-->'
+        html = TaggedPage(
+            "test-store", "beer", 1,
             '<html><body>'
             '<div class="talker" id="line_xxxxxxxx">'
             '  <div class="talker__name"><span>Orphan Beer</span></div>'
@@ -661,8 +992,8 @@ class TestCityHiveDedupOnUpsert:
         scraper = BottleOScraper()
         products = []
         for store in ("albany", "botany", "napier"):
-            html = (
-                f'<!--METADATA:store={store},category=beer,page=1-->'
+            html = TaggedPage(
+                store, "beer", 1,
                 '<html><body>'
                 f'<div class="talker" id="line_{store}xxxx">'
                 '  <a href="/product/steinlager-pure-12x330ml">'
@@ -1008,6 +1339,506 @@ class TestShopifyScrapers:
         assert scraper.chain == chain_name
 
 
+class TestBlackBullScraper:
+    """Tests for the Black Bull multi-store Shopify scraper."""
+
+    @pytest.mark.asyncio
+    async def test_stores_and_collections_fetch_concurrently(self):
+        """All (store, collection) pairs run at once, capped per store host."""
+        scraper = BlackBullScraper(stores=BLACK_BULL_STORES)
+        in_flight: dict[str, int] = {}
+        peaks = {"total": 0, "per_host": 0}
+
+        async def fetch(client, store, collection, sem):
+            assert client is scraper.client
+            async with sem:
+                in_flight[store["url"]] = in_flight.get(store["url"], 0) + 1
+                peaks["total"] = max(peaks["total"], sum(in_flight.values()))
+                peaks["per_host"] = max(peaks["per_host"], in_flight[store["url"]])
+                await asyncio.sleep(0)
+                in_flight[store["url"]] -= 1
+            yield {"store_id": store["store_id"], "collection": collection}
+
+        with patch.object(scraper, "_fetch_collection", side_effect=fetch):
+            pages = await scraper.fetch_catalog_pages()
+
+        assert len(pages) == len(BLACK_BULL_STORES) * len(scraper.collections)
+        assert peaks["per_host"] == black_bull_module.HOST_CONCURRENCY
+        assert peaks["total"] == len(BLACK_BULL_STORES) * black_bull_module.HOST_CONCURRENCY
+
+    def test_uses_shared_http2_client(self):
+        """Black Bull reuses the process-wide pooled HTTP/2 client."""
+        from app.scrapers.base import get_shared_client
+
+        assert BlackBullScraper().client is get_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_collection_pages_are_decoded_from_bytes(self):
+        """Pages are decoded from the raw response body and tagged with their store."""
+        def handler(request):
+            since_id = int(request.url.params["since_id"])
+            count = 250 if since_id == 0 else 1
+            products = [{"id": since_id + i + 1} for i in range(count)]
+            return httpx.Response(200, content=json.dumps({"products": products}))
+
+        store = BLACK_BULL_STORES[0]
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            pages = [
+                page async for page in
+                BlackBullScraper()._fetch_collection(client, store, "wine", asyncio.Semaphore(1))
+            ]
+
+        assert [len(page["products"]) for page in pages] == [250, 1]
+        assert {page["store_id"] for page in pages} == {store["store_id"]}
+
+    @pytest.mark.asyncio
+    async def test_compressed_pages_are_requested_and_decoded(self):
+        """The client asks for compressed bodies and pages decode from the inflated content."""
+        seen = {}
+
+        def handler(request):
+            seen["accept-encoding"] = request.headers["accept-encoding"]
+            body = gzip.compress(json.dumps({"products": [{"id": 1}]}).encode())
+            return httpx.Response(200, content=body, headers={"content-encoding": "gzip"})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            pages = [
+                page async for page in
+                BlackBullScraper()._fetch_collection(client, BLACK_BULL_STORES[0], "wine", asyncio.Semaphore(1))
+            ]
+
+        assert "gzip" in seen["accept-encoding"]
+        assert pages[0]["products"] == [{"id": 1}]
+
+    @pytest.mark.asyncio
+    async def test_collection_walks_since_id_cursor(self):
+        """Each request resumes after the highest id seen; a short page ends the walk."""
+        requested = []
+
+        def handler(request):
+            since_id = int(request.url.params["since_id"])
+            requested.append(since_id)
+            count = 250 if since_id < 500 else 3
+            return httpx.Response(200, content=json.dumps({"products": [{"id": since_id + i + 1} for i in range(count)]}))
+
+        sleep = AsyncMock()
+        with patch.object(black_bull_module.asyncio, "sleep", sleep):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                pages = [
+                    page async for page in
+                    BlackBullScraper()._fetch_collection(client, BLACK_BULL_STORES[0], "wine", asyncio.Semaphore(1))
+                ]
+
+        sleep.assert_not_awaited()  # pacing comes from the host semaphore, not sleeps
+        assert requested == [0, 250, 500]
+        assert [len(page["products"]) for page in pages] == [250, 250, 3]
+
+    @pytest.mark.asyncio
+    async def test_host_slot_is_held_only_during_requests(self):
+        """A yielded page doesn't keep the host semaphore, so other collections can fetch meanwhile."""
+        def handler(request):
+            return httpx.Response(200, content=json.dumps({"products": [{"id": 1}]}))
+
+        sem = asyncio.Semaphore(1)
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            pages = BlackBullScraper()._fetch_collection(client, BLACK_BULL_STORES[0], "wine", sem)
+            await pages.__anext__()
+            assert not sem.locked()
+            await pages.aclose()
+
+    @pytest.mark.asyncio
+    async def test_stalled_cursor_stops_pagination(self):
+        """A server that ignores since_id and page= must not cause an endless refetch of page one."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, content=json.dumps({"products": [{"id": i} for i in range(1, 251)]}))
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            pages = [
+                page async for page in BlackBullScraper()._fetch_collection(
+                    client, BLACK_BULL_STORES[0], "wine", asyncio.Semaphore(1)
+                )
+            ]
+
+        assert len(calls) == 4  # cursor page, ignored cursor, then page=1 and a repeated page=2
+        assert [len(page["products"]) for page in pages] == [250]
+
+    @pytest.mark.asyncio
+    async def test_ignored_since_id_falls_back_to_page_numbers(self):
+        """When since_id is ignored the repeated page is not yielded and page= fetches the rest."""
+        catalog = [{"id": i} for i in range(1, 601)]
+        requested = []
+
+        def handler(request):
+            page = int(request.url.params.get("page", 1))
+            requested.append(dict(request.url.params))
+            chunk = catalog[(page - 1) * 250:page * 250]
+            return httpx.Response(200, content=json.dumps({"products": chunk}))
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            pages = [
+                page async for page in BlackBullScraper()._fetch_collection(
+                    client, BLACK_BULL_STORES[0], "wine", asyncio.Semaphore(1)
+                )
+            ]
+
+        ids = [product["id"] for page in pages for product in page["products"]]
+        assert sorted(ids) == list(range(1, 601))
+        assert len(ids) == len(set(ids))
+        assert [params.get("page") for params in requested[2:]] == ["1", "2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_large_pages_parse_in_worker_process(self):
+        """Pages over PROCESS_PARSE_MIN_PRODUCTS parse in the pool with the same result as in-process."""
+        scraper = BlackBullScraper()
+        page = {
+            "store_id": "porirua",
+            "store_name": "Porirua",
+            "products": [
+                {"id": i, "title": f"Lager {i} 6x330ml", "handle": f"lager-{i}",
+                 "variants": [{"price": "19.99", "available": True}]}
+                for i in range(3)
+            ],
+        }
+        inline = await scraper.parse_products(page)
+
+        try:
+            with patch.object(black_bull_module, "PROCESS_PARSE_MIN_PRODUCTS", 0), \
+                 patch.object(black_bull_module, "get_parse_pool", wraps=base_module.get_parse_pool) as pool:
+                pooled = await scraper.parse_products(page)
+        finally:
+            base_module.discard_parse_pool()
+
+        assert pooled == inline
+        pool.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_parse_all_dispatches_one_batch_per_worker(self):
+        """A window of big pages goes to the pool in one call per worker, results kept in page order."""
+        scraper = BlackBullScraper()
+        pages = [
+            {"store_id": "porirua", "products": [
+                {"id": i, "title": "Lager", "handle": "lager", "variants": [{"price": "10", "available": True}]}
+            ]}
+            for i in range(5)
+        ]
+        loop = asyncio.get_running_loop()
+
+        async def run_inline(pool, fn, batch):
+            return fn(batch)
+
+        with patch.object(black_bull_module, "PROCESS_PARSE_MIN_PRODUCTS", 0), \
+             patch.object(black_bull_module.os, "cpu_count", return_value=2), \
+             patch.object(black_bull_module, "get_parse_pool"), \
+             patch.object(loop, "run_in_executor", AsyncMock(side_effect=run_inline)) as dispatch:
+            results = await scraper.parse_all(pages + [b"not json"])
+
+        assert dispatch.await_count == 2
+        assert [r[0]["source_id"] for r in results[:5]] == [f"porirua_{i}" for i in range(5)]
+        assert isinstance(results[5], Exception)
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_falls_back_to_inline_parse(self):
+        """A dead worker pool is discarded and the page is parsed in-process."""
+        from concurrent.futures.process import BrokenProcessPool
+
+        scraper = BlackBullScraper()
+        page = {"store_id": "porirua", "products": [
+            {"id": 1, "title": "Lager", "handle": "lager", "variants": [{"price": "10", "available": True}]}
+        ]}
+        loop = asyncio.get_running_loop()
+
+        with patch.object(black_bull_module, "PROCESS_PARSE_MIN_PRODUCTS", 0), \
+             patch.object(black_bull_module, "get_parse_pool"), \
+             patch.object(black_bull_module, "discard_parse_pool") as discard, \
+             patch.object(loop, "run_in_executor", AsyncMock(side_effect=BrokenProcessPool("dead"))):
+            products = await scraper.parse_products(page)
+
+        assert [p["source_id"] for p in products] == ["porirua_1"]
+        discard.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self):
+        """429s and connection errors are retried, honouring Retry-After, before giving up."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "3"}),
+            httpx.ConnectError("reset"),
+            httpx.Response(200, content=json.dumps({"products": [{"id": 1}]})),
+        ]
+
+        def handler(request):
+            outcome = responses.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        sleep = AsyncMock()
+        with patch.object(black_bull_module.asyncio, "sleep", sleep):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                pages = [
+                    page async for page in
+                    BlackBullScraper()._fetch_collection(client, BLACK_BULL_STORES[0], "wine", asyncio.Semaphore(1))
+                ]
+
+        assert [len(page["products"]) for page in pages] == [1]
+        delays = [call.args[0] for call in sleep.await_args_list]
+        assert delays[0] == 3.0
+        assert 0 <= delays[1] <= base_module.RETRY_BASE_DELAY * 2
+
+    @pytest.mark.asyncio
+    async def test_retries_are_bounded(self):
+        """A persistently failing page is attempted FETCH_RETRIES + 1 times, then the collection stops."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        with patch.object(black_bull_module.asyncio, "sleep", AsyncMock()):
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                pages = [
+                    page async for page in
+                    BlackBullScraper()._fetch_collection(client, BLACK_BULL_STORES[0], "wine", asyncio.Semaphore(1))
+                ]
+
+        assert pages == []
+        assert len(calls) == base_module.FETCH_RETRIES + 1
+
+    @pytest.mark.asyncio
+    async def test_missing_collection_is_not_retried(self):
+        """A 404 means the store has no such collection: one request, no pages."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            pages = [
+                page async for page in
+                BlackBullScraper()._fetch_collection(client, BLACK_BULL_STORES[0], "wine", asyncio.Semaphore(1))
+            ]
+
+        assert pages == [] and len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_strings_are_shared_across_stores(self):
+        """The same SKU parsed for two stores shares its name/brand/category strings."""
+        scraper = BlackBullScraper()
+        parsed = []
+        for store in BLACK_BULL_STORES[:2]:
+            # Decoded separately, as each store's page is
+            page = json.loads(json.dumps({"store_id": store["store_id"], "store_name": store["name"], "products": [{
+                "id": 1, "title": "Heineken Lager 12x330ml", "vendor": "Heineken", "handle": "heineken",
+                "variants": [{"price": "25.99", "available": True}],
+            }]}))
+            parsed.extend(await scraper.parse_products(page))
+
+        first, second = parsed
+        assert first["name"] is second["name"]
+        assert first["brand"] is second["brand"]
+        assert first["category"] is second["category"]
+
+    @pytest.mark.asyncio
+    async def test_parse_products_accepts_raw_json(self):
+        """str and bytes payloads are parsed without store context."""
+        body = {"products": [{
+            "id": 1, "title": "Heineken Lager 12x330ml", "handle": "heineken",
+            "variants": [{"price": "25.99", "available": True}],
+        }]}
+        scraper = BlackBullScraper()
+
+        for payload in (json.dumps(body), json.dumps(body).encode()):
+            products = await scraper.parse_products(payload)
+            assert [(p["source_id"], p["price_nzd"]) for p in products] == [("1", 25.99)]
+
+    @pytest.mark.asyncio
+    async def test_db_stores_are_cached_between_scrapes(self):
+        """Repeat scrapes within the TTL reuse the chain's store list instead of re-querying."""
+        from contextlib import asynccontextmanager
+
+        from app.db.models import Store
+
+        rows = [
+            Store(chain="black_bull", api_id="porirua", url="blackbullporirua.co.nz", name="Porirua"),
+            Store(chain="black_bull", api_id=None, url="https://www.blackbullliquor.co.nz", name="Head office"),
+        ]
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(scalars=lambda: MagicMock(all=lambda: rows)))
+
+        @asynccontextmanager
+        async def session_cm():
+            yield session
+
+        base_module._stores_cache.clear()
+        try:
+            with patch.object(black_bull_module, "get_async_session", session_cm):
+                first = await BlackBullScraper()._load_stores_from_db()
+                second = await BlackBullScraper()._load_stores_from_db()
+        finally:
+            base_module._stores_cache.clear()
+
+        assert first == second == [
+            {"name": "Porirua", "url": "https://blackbullporirua.co.nz", "store_id": "porirua"}
+        ]
+        session.execute.assert_awaited_once()
+
+    @pytest.mark.parametrize("host, expected", [
+        ("blackbullporirua.co.nz", True),
+        ("www.blackbullliquor.co.nz", False),
+        ("blackbullporirua.com", False),
+        ("liquorporirua.co.nz", False),
+        ("", False),
+    ])
+    def test_is_ecommerce_host(self, host, expected):
+        """Only Black Bull .co.nz store sites count; the head-office site does not."""
+        assert BlackBullScraper._is_ecommerce_host(host) is expected
+
+    def test_pages_parse_to_slotted_products(self):
+        """Workers build slotted ParsedProducts; the dict is built once at the persistence boundary."""
+        product = {"id": 1, "title": "Lager", "handle": "lager", "variants": [{"price": "10", "available": True}]}
+        (parsed,) = black_bull_module._parse_page(
+            [product], "black_bull", "https://blackbullporirua.co.nz", "porirua", "Porirua"
+        )
+
+        assert isinstance(parsed, black_bull_module.ParsedProduct)
+        assert not hasattr(parsed, "__dict__")
+        assert parsed.to_dict() == BlackBullScraper()._parse_product(product, "porirua", "Porirua")
+        assert parsed.to_dict()["source_id"] == "porirua_1"
+
+    def test_product_url_uses_store_lookup(self):
+        """Product URLs come from the store-id index, which follows store reassignment."""
+        scraper = BlackBullScraper()
+        scraper.stores = [{"name": "Test", "url": "https://blackbulltest.co.nz", "store_id": "test"}]
+        product = {"id": 1, "title": "Lager", "handle": "lager", "variants": [{"price": "10", "available": True}]}
+
+        assert scraper._parse_product(product, "test")["url"] == "https://blackbulltest.co.nz/products/lager"
+        assert scraper._parse_product(product, "porirua")["url"] is None
+
+    def test_compare_at_price_becomes_promo(self):
+        """A higher compare_at_price is the regular price and the variant price the promo."""
+        product = {
+            "id": 1, "title": "Lager", "handle": "lager", "images": [{"src": "https://cdn/x.jpg"}],
+            "variants": [{"price": "18.00", "compare_at_price": "24.00", "available": True}],
+        }
+        parsed = BlackBullScraper()._parse_product(product, "porirua")
+
+        assert (parsed["price_nzd"], parsed["promo_price_nzd"], parsed["promo_text"]) == (24.0, 18.0, "Sale")
+        assert parsed["image_url"] == "https://cdn/x.jpg"
+
+    def test_unavailable_variant_skipped_before_price_parse(self):
+        """Out-of-stock products return None without touching (possibly malformed) prices."""
+        product = {"id": 1, "title": "Lager", "variants": [{"price": "n/a", "available": False}]}
+
+        assert BlackBullScraper()._parse_product(product, "porirua") is None
+
+    @pytest.mark.parametrize("product", [
+        {"id": 1, "title": "Lager"},
+        {"id": 1, "title": "Lager", "variants": []},
+        {"id": 1, "title": "Lager", "variants": [{"price": "10"}]},
+    ])
+    def test_products_without_stock_skip_title_parsing(self, product):
+        """No variants or no availability returns None before the title parsers run."""
+        with patch.object(black_bull_module, "parse_title_attrs") as parse_title_attrs:
+            assert BlackBullScraper()._parse_product(product, "porirua") is None
+        parse_title_attrs.assert_not_called()
+
+    def test_sale_tag_marks_promo(self):
+        """A sale tag without compare_at_price still flags the product as on promo."""
+        product = {
+            "id": 1, "title": "Lager", "handle": "lager", "tags": "Beer, Clearance",
+            "variants": [{"price": "10", "available": True}],
+        }
+        parsed = BlackBullScraper()._parse_product(product, "porirua")
+
+        assert (parsed["promo_text"], parsed["promo_price_nzd"]) == ("Clearance", 10.0)
+
+    @pytest.mark.parametrize("tags, expected", [
+        (["Beer", " SALE ", "clearance"], "Sale"),
+        ("beer,special,reduced", "Special"),
+        ("", None),
+        (None, None),
+    ])
+    def test_first_sale_tag_wins(self, tags, expected):
+        """Tags may be a list or comma-separated string; the first sale tag sets promo_text."""
+        product = {
+            "id": 1, "title": "Lager", "handle": "lager", "tags": tags,
+            "variants": [{"price": "10", "available": True}],
+        }
+        assert BlackBullScraper()._parse_product(product, "porirua")["promo_text"] == expected
+
+    @pytest.mark.parametrize("api_id, host, expected", [
+        ("Hornby Hub", "blackbullliquorhornbyhub.co.nz", "hornby_hub"),
+        (None, "blackbull.porirua.co.nz", "blackbull"),
+        ("  ", "blackbull-x.co.nz", "blackbull-x"),
+    ])
+    def test_store_id_from_row(self, api_id, host, expected):
+        """Store ids are slugged from api_id, falling back to the host's first label."""
+        assert BlackBullScraper._store_id_from_row(api_id, host) == expected
+
+    @pytest.mark.asyncio
+    async def test_failed_collection_does_not_drop_others(self):
+        """An exception from one collection is logged and the rest are kept."""
+        scraper = BlackBullScraper(stores=BLACK_BULL_STORES[:1])
+
+        async def fetch(client, store, collection, sem):
+            if collection == "wine":
+                raise RuntimeError("boom")
+            yield {"collection": collection}
+
+        with patch.object(scraper, "_fetch_collection", side_effect=fetch):
+            pages = await scraper.fetch_catalog_pages()
+
+        assert sorted(page["collection"] for page in pages) == sorted(c for c in scraper.collections if c != "wine")
+
+    @pytest.mark.asyncio
+    async def test_pages_stream_before_all_fetches_finish(self):
+        """The first page is yielded while other collections are still fetching."""
+        scraper = BlackBullScraper(stores=BLACK_BULL_STORES[:1])
+        release = asyncio.Event()
+
+        async def fetch(client, store, collection, sem):
+            if collection != "wine":
+                await release.wait()
+            yield {"collection": collection}
+
+        with patch.object(scraper, "_fetch_collection", side_effect=fetch):
+            stream = scraper.stream_catalog_pages()
+            first = await stream.__anext__()
+            assert first == {"collection": "wine"}
+            release.set()
+            rest = [page async for page in stream]
+
+        assert len(rest) == len(scraper.collections) - 1
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_cancels_fetches(self):
+        """Abandoning the stream early cancels the outstanding producers."""
+        scraper = BlackBullScraper(stores=BLACK_BULL_STORES[:1])
+        cancelled = []
+
+        async def fetch(client, store, collection, sem):
+            if collection == "wine":
+                yield {"collection": collection}
+                return
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(collection)
+                raise
+            yield {}
+
+        with patch.object(scraper, "_fetch_collection", side_effect=fetch):
+            stream = scraper.stream_catalog_pages()
+            await stream.__anext__()
+            await stream.aclose()
+            await asyncio.sleep(0)
+
+        assert sorted(cancelled) == sorted(c for c in scraper.collections if c != "wine")
+
+
 # ============================================================================
 # NZ-Wide Coverage Tests
 # ============================================================================
@@ -0,0 +1,511 @@
+"""Tests for browser-based auth in APIAuthBase."""
+from __future__ import annotations
+
+import asyncio
+import os
+import stat
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.scrapers import api_auth_base
+from app.scrapers.api_auth_base import APIAuthBase, _BrowserPool
+
+
+@pytest.fixture(autouse=True)
+def empty_auth_cache():
+    """Each test starts without process-wide cached credentials."""
+    api_auth_base._auth_cache.clear()
+    api_auth_base._auth_locks.clear()
+    yield
+    api_auth_base._auth_cache.clear()
+    api_auth_base._auth_locks.clear()
+
+
+@pytest.fixture(autouse=True)
+def auth_state_dir(tmp_path):
+    """Keep saved browser storage states out of the real state dir."""
+    state_dir = tmp_path / "auth_state"
+    with patch.object(api_auth_base, "AUTH_STATE_DIR", state_dir):
+        yield state_dir
+
+
+def _write_state(path):
+    """A saved storage state as the scraper leaves it: owner-only."""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    path.write_text("{}")
+    path.chmod(0o600)
+
+
+class _AuthScraper(APIAuthBase):
+    site_url = "https://shop.example.co.nz"
+    api_domain = "api.example.co.nz"
+
+
+def _fake_page():
+    page = MagicMock()
+    page.on = MagicMock()
+    page.goto = AsyncMock()
+    page.query_selector = AsyncMock(return_value=None)
+    page.evaluate = AsyncMock(return_value={"local": {}, "session": {}})
+    return page
+
+
+def _fake_context(page):
+    context = MagicMock()
+    context.new_page = AsyncMock(return_value=page)
+    context.cookies = AsyncMock(return_value=[{"name": "session", "value": "abc"}])
+    context.close = AsyncMock()
+    context.route = AsyncMock()
+    context.storage_state = AsyncMock(side_effect=lambda path: Path(path).write_text("{}"))
+    return context
+
+
+def _fake_playwright(browser):
+    playwright = MagicMock()
+    playwright.chromium.launch = AsyncMock(return_value=browser)
+    playwright.stop = AsyncMock()
+    starter = MagicMock()
+    starter.start = AsyncMock(return_value=playwright)
+    return starter, playwright
+
+
+def _fake_browser(context=None):
+    browser = MagicMock()
+    browser.is_connected = MagicMock(return_value=True)
+    browser.new_context = AsyncMock(return_value=context)
+    browser.close = AsyncMock()
+    return browser
+
+
+class TestBrowserPool:
+    """Tests for the shared auth browser."""
+
+    @pytest.mark.asyncio
+    async def test_browser_is_launched_once_per_mode(self):
+        """Repeated get_browser calls should reuse the running browser."""
+        browser = _fake_browser()
+        starter, playwright = _fake_playwright(browser)
+        pool = _BrowserPool()
+
+        with patch.object(api_auth_base, "async_playwright", return_value=starter):
+            first = await pool.get_browser(True)
+            second = await pool.get_browser(True)
+
+        assert first is second is browser
+        starter.start.assert_awaited_once()
+        playwright.chromium.launch.assert_awaited_once_with(
+            headless=True, args=api_auth_base.BROWSER_LAUNCH_ARGS
+        )
+
+    @pytest.mark.asyncio
+    async def test_disconnected_browser_is_relaunched(self):
+        """A crashed/disconnected browser should be replaced on next use."""
+        browser = _fake_browser()
+        starter, playwright = _fake_playwright(browser)
+        pool = _BrowserPool()
+
+        with patch.object(api_auth_base, "async_playwright", return_value=starter):
+            await pool.get_browser(True)
+            browser.is_connected.return_value = False
+            await pool.get_browser(True)
+
+        assert playwright.chromium.launch.await_count == 2
+        starter.start.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_stops_browser_and_playwright(self):
+        """close() should close every browser and stop Playwright."""
+        browser = _fake_browser()
+        starter, playwright = _fake_playwright(browser)
+        pool = _BrowserPool()
+
+        with patch.object(api_auth_base, "async_playwright", return_value=starter):
+            await pool.get_browser(True)
+            await pool.close()
+
+        browser.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_without_browser_is_noop(self):
+        """close() should not start Playwright just to shut it down."""
+        starter, _ = _fake_playwright(_fake_browser())
+        with patch.object(api_auth_base, "async_playwright", return_value=starter):
+            await _BrowserPool().close()
+        starter.start.assert_not_awaited()
+
+
+class TestGetAuthViaBrowser:
+    """Tests for _get_auth_via_browser()."""
+
+    @pytest.mark.asyncio
+    async def test_uses_shared_browser_and_closes_only_context(self):
+        """Each auth should open and close its own context on the shared browser."""
+        page = _fake_page()
+        context = _fake_context(page)
+        browser = _fake_browser(context)
+        scraper = _AuthScraper()
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            await scraper._get_auth_via_browser(headless=True, wait_time=0)
+
+        context.close.assert_awaited_once()
+        browser.close.assert_not_awaited()
+        assert scraper.cookies == {"session": "abc"}
+
+    @pytest.mark.asyncio
+    async def test_navigation_waits_for_dom_only(self):
+        """goto should return at DOMContentLoaded rather than waiting on every subresource."""
+        page = _fake_page()
+        browser = _fake_browser(_fake_context(page))
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            await _AuthScraper()._get_auth_via_browser(headless=True, wait_time=0)
+
+        page.goto.assert_awaited_once_with(
+            _AuthScraper.site_url, wait_until="domcontentloaded", timeout=30000
+        )
+
+    @pytest.mark.asyncio
+    async def test_context_closed_when_navigation_fails(self):
+        """The per-auth context should be closed even if the page errors."""
+        page = _fake_page()
+        page.goto = AsyncMock(side_effect=RuntimeError("net::ERR_FAILED"))
+        context = _fake_context(page)
+        browser = _fake_browser(context)
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)):
+            token = await _AuthScraper()._get_auth_via_browser(headless=True, wait_time=0)
+
+        assert token is None
+        context.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_network_listeners_detach_after_token_capture(self):
+        """Request/response listeners should be removed as soon as a token is captured."""
+        page = _fake_page()
+        listeners = {}
+        page.on = MagicMock(side_effect=lambda event, handler: listeners.__setitem__(event, handler))
+
+        async def goto(*_args, **_kwargs):
+            request = MagicMock(url="https://api.example.co.nz/v1/products")
+            request.headers = {"authorization": "Bearer aaa.bbb.ccc"}
+            listeners["request"](request)
+
+        page.goto = AsyncMock(side_effect=goto)
+        context = _fake_context(page)
+        browser = _fake_browser(context)
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            token = await _AuthScraper()._get_auth_via_browser(headless=True, wait_time=0)
+
+        assert token == "aaa.bbb.ccc"
+        page.remove_listener.assert_any_call("request", listeners["request"])
+        page.remove_listener.assert_any_call("response", listeners["response"])
+
+    @pytest.mark.asyncio
+    async def test_wait_ends_as_soon_as_token_is_captured(self):
+        """wait_time is an upper bound: a captured token should skip the rest of the wait."""
+        page = _fake_page()
+        listeners = {}
+        page.on = MagicMock(side_effect=lambda event, handler: listeners.__setitem__(event, handler))
+
+        async def goto(*_args, **_kwargs):
+            request = MagicMock(url="https://api.example.co.nz/v1/products")
+            request.headers = {"authorization": "Bearer aaa.bbb.ccc"}
+            listeners["request"](request)
+
+        page.goto = AsyncMock(side_effect=goto)
+        browser = _fake_browser(_fake_context(page))
+        sleep = AsyncMock()
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", sleep):
+            token = await _AuthScraper()._get_auth_via_browser(headless=True, wait_time=60)
+
+        assert token == "aaa.bbb.ccc"
+        slept = [call.args[0] for call in sleep.await_args_list]
+        assert 60 not in slept
+        assert api_auth_base.TOKEN_SETTLE_SECONDS in slept
+
+    @pytest.mark.asyncio
+    async def test_cookie_only_auth_still_waits_full_time(self):
+        """Without token capture there is nothing to wait on, so the full wait_time applies."""
+        browser = _fake_browser(_fake_context(_fake_page()))
+        sleep = AsyncMock()
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", sleep):
+            await _AuthScraper()._get_auth_via_browser(capture_token=False, headless=True, wait_time=7)
+
+        assert 7 in [call.args[0] for call in sleep.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_cloudflare_challenge_waits_for_detach(self):
+        """A Cloudflare interstitial should be awaited via wait_for_selector, not polled."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        page = _fake_page()
+        page.query_selector = AsyncMock(return_value=MagicMock())
+        page.wait_for_selector = AsyncMock(side_effect=PlaywrightTimeoutError("timeout"))
+        browser = _fake_browser(_fake_context(page))
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            await _AuthScraper()._get_auth_via_browser(headless=True, wait_time=0)
+
+        page.query_selector.assert_awaited_once()
+        page.wait_for_selector.assert_awaited_once_with(
+            'text="Just a moment"', state="detached", timeout=30000
+        )
+
+
+def _capturing_page(token="aaa.bbb.ccc"):
+    """A page whose navigation fires an API request carrying ``token``."""
+    page = _fake_page()
+    listeners = {}
+    page.on = MagicMock(side_effect=lambda event, handler: listeners.__setitem__(event, handler))
+
+    async def goto(*_args, **_kwargs):
+        request = MagicMock(url="https://api.example.co.nz/v1/products")
+        request.headers = {"authorization": f"Bearer {token}"}
+        listeners["request"](request)
+
+    page.goto = AsyncMock(side_effect=goto)
+    return page
+
+
+class TestStorageStateCache:
+    """Tests for reusing a saved browser storage state across auths."""
+
+    @pytest.mark.asyncio
+    async def test_headless_by_default(self):
+        """Browser auth should not open a visible window unless asked to."""
+        get_browser = AsyncMock(return_value=_fake_browser(_fake_context(_fake_page())))
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", get_browser), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            await _AuthScraper()._get_auth_via_browser(wait_time=0)
+
+        get_browser.assert_awaited_once_with(True)
+
+    @pytest.mark.asyncio
+    async def test_successful_auth_saves_storage_state(self, auth_state_dir):
+        """A captured token should persist the context's storage state for the site."""
+        context = _fake_context(_capturing_page())
+        browser = _fake_browser(context)
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            await _AuthScraper()._get_auth_via_browser(wait_time=0)
+
+        state = auth_state_dir / "auth_shop.example.co.nz.json"
+        context.storage_state.assert_awaited_once_with(path=str(state))
+        assert browser.new_context.await_args.kwargs["storage_state"] is None
+        assert stat.S_IMODE(auth_state_dir.stat().st_mode) == 0o700
+        assert stat.S_IMODE(state.stat().st_mode) == 0o600
+
+    @pytest.mark.asyncio
+    async def test_failed_auth_does_not_save_storage_state(self):
+        """Without credentials there is nothing worth caching."""
+        context = _fake_context(_fake_page())
+        context.cookies = AsyncMock(return_value=[])
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=_fake_browser(context))), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            await _AuthScraper()._get_auth_via_browser(wait_time=0)
+
+        context.storage_state.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fresh_storage_state_is_reused(self, auth_state_dir):
+        """A saved state younger than the TTL seeds the context and skips a second attempt."""
+        state = auth_state_dir / "auth_shop.example.co.nz.json"
+        _write_state(state)
+        browser = _fake_browser(_fake_context(_capturing_page()))
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            token = await _AuthScraper()._get_auth_via_browser(wait_time=0)
+
+        assert token == "aaa.bbb.ccc"
+        browser.new_context.assert_awaited_once()
+        assert browser.new_context.await_args.kwargs["storage_state"] == str(state)
+
+    @pytest.mark.asyncio
+    async def test_unproductive_storage_state_falls_back_to_full_auth(self, auth_state_dir):
+        """If the saved state yields no token it is deleted and a clean context is tried."""
+        state = auth_state_dir / "auth_shop.example.co.nz.json"
+        _write_state(state)
+        stale_context = _fake_context(_fake_page())
+        stale_context.cookies = AsyncMock(return_value=[])
+        fresh_context = _fake_context(_capturing_page())
+        browser = _fake_browser()
+        browser.new_context = AsyncMock(side_effect=[stale_context, fresh_context])
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            token = await _AuthScraper()._get_auth_via_browser(wait_time=0)
+
+        assert token == "aaa.bbb.ccc"
+        assert [call.kwargs["storage_state"] for call in browser.new_context.await_args_list] == [str(state), None]
+        # The stale state is dropped; only the clean context's session is saved
+        stale_context.storage_state.assert_not_awaited()
+        fresh_context.storage_state.assert_awaited_once_with(path=str(state))
+
+    @pytest.mark.asyncio
+    async def test_expired_storage_state_is_ignored(self, auth_state_dir):
+        """A state older than AUTH_STATE_TTL_SECONDS is not loaded."""
+        state = auth_state_dir / "auth_shop.example.co.nz.json"
+        _write_state(state)
+        expired = state.stat().st_mtime - api_auth_base.AUTH_STATE_TTL_SECONDS - 1
+        os.utime(state, (expired, expired))
+        browser = _fake_browser(_fake_context(_capturing_page()))
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            await _AuthScraper()._get_auth_via_browser(wait_time=0)
+
+        assert browser.new_context.await_args.kwargs["storage_state"] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("foreign", ["world_readable", "other_owner"])
+    async def test_untrusted_storage_state_is_ignored(self, auth_state_dir, foreign):
+        """A state readable by others, or owned by another user, is never loaded."""
+        state = auth_state_dir / "auth_shop.example.co.nz.json"
+        _write_state(state)
+        uid = os.getuid()
+        if foreign == "world_readable":
+            state.chmod(0o644)
+        else:
+            uid += 1
+        browser = _fake_browser(_fake_context(_capturing_page()))
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch.object(api_auth_base.os, "getuid", return_value=uid), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            await _AuthScraper()._get_auth_via_browser(wait_time=0)
+
+        assert browser.new_context.await_args.kwargs["storage_state"] is None
+
+    def test_loose_state_dir_is_tightened(self, auth_state_dir):
+        """An existing state dir of ours with group/other access is reset to 0700."""
+        auth_state_dir.mkdir(mode=0o755)
+        auth_state_dir.chmod(0o755)
+
+        assert _AuthScraper()._storage_state_path() == auth_state_dir / "auth_shop.example.co.nz.json"
+        assert stat.S_IMODE(auth_state_dir.stat().st_mode) == 0o700
+
+
+class TestEnsureAuth:
+    """Tests for the in-memory auth token cache."""
+
+    @staticmethod
+    def _scraper(token="tok"):
+        scraper = _AuthScraper()
+        scraper._get_auth_token = AsyncMock(side_effect=lambda: token)
+        return scraper
+
+    @pytest.mark.asyncio
+    async def test_cached_token_is_shared_across_instances(self):
+        """A second scraper for the same site reuses the token and cookies without authenticating."""
+        first = self._scraper()
+        first.cookies = {"session": "abc"}
+        await first.ensure_auth()
+        second = self._scraper("other")
+
+        assert await second.ensure_auth() == "tok"
+        assert second.cookies == {"session": "abc"}
+        second._get_auth_token.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_expired_token_is_refetched(self):
+        """Once the TTL has passed the next call authenticates again."""
+        scraper = self._scraper()
+        with patch.object(api_auth_base.time, "monotonic", side_effect=[0.0, 61.0, 61.0, 61.0]):
+            await scraper.ensure_auth(ttl=60)
+            await scraper.ensure_auth(ttl=60)
+
+        assert scraper._get_auth_token.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refresh_bypasses_cache(self):
+        """refresh=True replaces a rejected token even within the TTL."""
+        scraper = self._scraper()
+        await scraper.ensure_auth()
+        scraper._get_auth_token.side_effect = lambda: "new"
+
+        assert await scraper.ensure_auth(refresh=True) == "new"
+        assert await self._scraper("unused").ensure_auth() == "new"
+
+    @pytest.mark.asyncio
+    async def test_failed_auth_is_not_cached(self):
+        """A None token is returned but the next call tries again."""
+        scraper = self._scraper(None)
+        assert await scraper.ensure_auth() is None
+        await scraper.ensure_auth()
+
+        assert scraper._get_auth_token.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_authenticate_once(self):
+        """Callers racing on an empty cache wait for a single authentication."""
+        async def slow_auth():
+            await asyncio.sleep(0)
+            return "tok"
+
+        scrapers = [_AuthScraper() for _ in range(3)]
+        auth = AsyncMock(side_effect=slow_auth)
+        for scraper in scrapers:
+            scraper._get_auth_token = auth
+
+        tokens = await asyncio.gather(*(scraper.ensure_auth() for scraper in scrapers))
+
+        assert tokens == ["tok"] * 3
+        auth.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_default_auth_uses_browser(self):
+        """Without an override, fresh credentials come from the browser flow."""
+        scraper = _AuthScraper()
+        with patch.object(scraper, "_get_auth_via_browser", AsyncMock(return_value="tok")) as browser_auth:
+            assert await scraper.ensure_auth() == "tok"
+        browser_auth.assert_awaited_once_with()
+
+
+class TestBlockStaticAssets:
+    """Tests for the auth-context resource blocker."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("resource_type, aborted", [
+        ("image", True), ("font", True), ("media", True), ("stylesheet", True),
+        ("document", False), ("script", False), ("xhr", False), ("fetch", False),
+    ])
+    async def test_only_static_assets_are_aborted(self, resource_type, aborted):
+        """Images/fonts/media/CSS are dropped; documents, scripts and API calls go through."""
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        route.abort = AsyncMock()
+        route.continue_ = AsyncMock()
+
+        await api_auth_base._block_static_assets(route)
+
+        assert route.abort.await_count == int(aborted)
+        assert route.continue_.await_count == int(not aborted)
+
+    @pytest.mark.asyncio
+    async def test_auth_context_installs_blocker(self):
+        """Every auth context should route requests through the blocker."""
+        context = _fake_context(_fake_page())
+        browser = _fake_browser(context)
+
+        with patch.object(api_auth_base._browser_pool, "get_browser", AsyncMock(return_value=browser)), \
+             patch("app.scrapers.api_auth_base.asyncio.sleep", AsyncMock()):
+            await _AuthScraper()._get_auth_via_browser(headless=True, wait_time=0)
+
+        context.route.assert_awaited_once_with("**/*", api_auth_base._block_static_assets)
@@ -0,0 +1,418 @@
+"""Tests for the shared Scraper base class."""
+from __future__ import annotations
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.scrapers import base as base_module
+from app.db.models import Price, PriceHistory
+from app.scrapers.base import Scraper
+
+
+class _PagedScraper(Scraper):
+    chain = "test_chain"
+
+    def __init__(self, pages: List[str]) -> None:
+        super().__init__()
+        self.pages = pages
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def fetch_catalog_pages(self) -> List[str]:
+        return self.pages
+
+    async def parse_products(self, payload: str) -> List[dict]:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if payload == "bad":
+            raise ValueError("unparseable")
+        return [{"source_id": payload}]
+
+
+_PRICE = {
+    "price_nzd": 9.99, "promo_price_nzd": None, "promo_text": None,
+    "promo_ends_at": None, "is_member_only": False,
+}
+
+
+@asynccontextmanager
+async def _fake_transaction():
+    session = MagicMock()
+    session.flush = AsyncMock()
+    session.execute = AsyncMock(return_value=MagicMock(scalar_one=MagicMock(return_value=MagicMock())))
+    yield session
+
+
+class TestRun:
+    """Tests for Scraper.run()."""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_parsed_concurrently_in_bounded_windows(self):
+        """Pages should be parsed in overlapping windows of at most PARSE_CONCURRENCY."""
+        scraper = _PagedScraper([f"p{i}" for i in range(12)])
+        upsert = AsyncMock(return_value=1)
+
+        with patch.object(base_module, "async_transaction", _fake_transaction), \
+             patch.object(scraper, "_upsert_products_batch", upsert):
+            run = await scraper.run()
+
+        assert scraper.peak_in_flight == base_module.PARSE_CONCURRENCY
+        assert [call.args[1] for call in upsert.await_args_list] == [
+            [{"source_id": f"p{i}"}] for i in range(12)
+        ]
+        assert run.items_total == 12
+        assert run.items_changed == 12
+
+    @pytest.mark.asyncio
+    async def test_failed_page_does_not_abort_window(self):
+        """A page that fails to parse is counted and the rest of its window is still persisted."""
+        scraper = _PagedScraper(["p0", "bad", "p2"])
+        upsert = AsyncMock(return_value=0)
+
+        with patch.object(base_module, "async_transaction", _fake_transaction), \
+             patch.object(scraper, "_upsert_products_batch", upsert):
+            run = await scraper.run()
+
+        assert upsert.await_count == 2
+        assert run.items_total == 2
+        assert run.items_failed == 1
+
+    @pytest.mark.asyncio
+    async def test_run_is_finalized_with_single_update(self):
+        """The IngestionRun row is finalized by one UPDATE by id, not SELECT + mutate."""
+        from sqlalchemy.dialects import postgresql
+
+        scraper = _PagedScraper(["p0"])
+        executed = []
+
+        @asynccontextmanager
+        async def recording_transaction():
+            session = MagicMock()
+            session.flush = AsyncMock()
+
+            async def execute(stmt, params=None):
+                executed.append(str(stmt.compile(dialect=postgresql.dialect())))
+                return MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[]))))
+
+            session.execute = execute
+            yield session
+
+        with patch.object(base_module, "async_transaction", recording_transaction), \
+             patch.object(scraper, "_upsert_products_batch", AsyncMock(return_value=0)):
+            run = await scraper.run()
+
+        run_statements = [sql for sql in executed if "ingestion_runs" in sql]
+        assert len(run_statements) == 1
+        assert run_statements[0].startswith("UPDATE ingestion_runs SET")
+        assert run.status == "completed"
+        assert run.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_failed_promo_sweep_rolls_back_to_savepoint(self):
+        """Finalizing and sweeping share one transaction; a sweep failure only drops its SAVEPOINT."""
+        scraper = _PagedScraper(["p0"])
+        sessions = []
+
+        @asynccontextmanager
+        async def tracking_transaction():
+            async with _fake_transaction() as session:
+                sessions.append(session)
+                yield session
+
+        with patch.object(base_module, "async_transaction", tracking_transaction), \
+             patch.object(scraper, "_upsert_products_batch", AsyncMock(return_value=0)), \
+             patch("app.services.freshness.sweep_chain_promos", AsyncMock(side_effect=RuntimeError("boom"))):
+            run = await scraper.run()
+
+        assert run.status == "completed"
+        # setup (run + stores), one page, finalize + sweep
+        assert len(sessions) == 3
+        sessions[-1].begin_nested.assert_called_once()
+
+
+class TestUpsertPriceRows:
+    """Tests for the server-side price change detection."""
+
+    @staticmethod
+    def _row(product_id, changed):
+        return MagicMock(
+            product_id=product_id, store_id="s1", price_nzd=9.99,
+            promo_price_nzd=None, is_member_only=False, changed=changed,
+        )
+
+    @pytest.mark.asyncio
+    async def test_price_upsert_detects_changes_in_on_conflict(self):
+        """No existing prices are selected; the upsert bumps price_last_changed_at via CASE and RETURNs it."""
+        from sqlalchemy.dialects import postgresql
+
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=[self._row("p1", True), self._row("p2", False)])
+        now = datetime.now(timezone.utc)
+        prices = [{**_PRICE, "product_id": pid} for pid in ("p1", "p2")]
+
+        changed = await _PagedScraper([])._upsert_price_rows(session, prices, [MagicMock(id="s1")], now)
+
+        assert changed == 1
+        upsert_sql = str(session.execute.await_args_list[0].args[0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT ON CONSTRAINT uq_price_product_store DO UPDATE" in upsert_sql
+        assert "CASE WHEN" in upsert_sql
+        assert "IS DISTINCT FROM excluded.price_nzd" in upsert_sql
+        assert "RETURNING" in upsert_sql
+        assert all(not str(call.args[0]).startswith("SELECT") for call in session.execute.await_args_list)
+
+    @pytest.mark.asyncio
+    async def test_history_written_only_for_changed_rows(self):
+        """Only rows reported as changed get a PriceHistory entry."""
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=[[self._row("p1", True), self._row("p2", False)], None])
+        now = datetime.now(timezone.utc)
+
+        await _PagedScraper([])._upsert_price_rows(
+            session, [{**_PRICE, "product_id": "p1"}], [MagicMock(id="s1")], now
+        )
+
+        history_stmt = session.execute.await_args_list[1].args[0]
+        assert history_stmt.table.name == "price_history"
+        params = history_stmt.compile().params
+        assert "p1" in params.values()
+        assert "p2" not in params.values()
+
+
+    @pytest.mark.asyncio
+    async def test_store_fan_out_happens_in_sql(self):
+        """Each product is sent once and cross joined with the stores by INSERT ... SELECT."""
+        from sqlalchemy.dialects import postgresql
+
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=[])
+        stores = [MagicMock(id=uuid.uuid4()) for _ in range(3)]
+        prices = [{**_PRICE, "product_id": uuid.uuid4()} for _ in range(2)]
+
+        await _PagedScraper([])._upsert_price_rows(session, prices, stores, datetime.now(timezone.utc))
+
+        session.execute.assert_awaited_once()
+        compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        assert "INSERT INTO prices (id, product_id, store_id," in str(compiled)
+        assert "JOIN (VALUES" in str(compiled)
+        sent = list(compiled.params.values())
+        assert all(sent.count(price["product_id"]) == 1 for price in prices)
+        assert all(sent.count(store.id) == 1 for store in stores)
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_sized_by_fanned_out_rows(self):
+        """A chunk holds about PRICE_UPSERT_CHUNK_SIZE (product, store) rows, not products."""
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=[])
+        stores = [MagicMock(id=f"s{i}") for i in range(2)]
+        prices = [{**_PRICE, "product_id": f"p{i}"} for i in range(5)]
+
+        with patch.object(base_module, "PRICE_UPSERT_CHUNK_SIZE", 4):
+            await _PagedScraper([])._upsert_price_rows(session, prices, stores, datetime.now(timezone.utc))
+
+        assert session.execute.await_count == 3
+
+
+class TestUpsertProductsBatch:
+    """Tests for _upsert_products_batch()."""
+
+    @pytest.mark.asyncio
+    async def test_product_ids_come_from_upsert_returning(self):
+        """Product IDs are read from the upsert's RETURNING rows, not a follow-up SELECT."""
+        from sqlalchemy.dialects import postgresql
+
+        scraper = _PagedScraper([])
+        session = MagicMock()
+        session.execute = AsyncMock(
+            return_value=[MagicMock(id="pid-1", source_product_id="A1", inserted=False)]
+        )
+        upsert_prices = AsyncMock(return_value=1)
+        store = MagicMock(id="s1")
+        product = {"chain": "test_chain", "source_id": "A1", "name": "Lager 6x330ml", "price_nzd": 12.0}
+
+        with patch.object(scraper, "_upsert_price_rows", upsert_prices):
+            await scraper._upsert_products_batch(session, [product], [store])
+
+        session.execute.assert_awaited_once()
+        product_sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "RETURNING products.id, products.source_product_id, xmax = " in product_sql
+        price_rows, stores = upsert_prices.await_args.args[1:3]
+        assert [row["product_id"] for row in price_rows] == ["pid-1"]
+        assert stores == [store]
+
+    @pytest.mark.asyncio
+    async def test_products_are_upserted_in_chunks(self):
+        """Large pages are split into PRODUCT_UPSERT_CHUNK_SIZE-row statements."""
+        scraper = _PagedScraper([])
+        products = [
+            {"chain": "test_chain", "source_id": f"A{i}", "name": "Lager 6x330ml", "price_nzd": 12.0}
+            for i in range(5)
+        ]
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=[
+            [MagicMock(id=f"pid-{i}", source_product_id=f"A{i}", inserted=False) for i in chunk]
+            for chunk in ((0, 1), (2, 3), (4,))
+        ])
+        upsert_prices = AsyncMock(return_value=0)
+
+        with patch.object(base_module, "PRODUCT_UPSERT_CHUNK_SIZE", 2), \
+             patch.object(scraper, "_upsert_price_rows", upsert_prices):
+            await scraper._upsert_products_batch(session, products, [MagicMock(id="s1")])
+
+        assert session.execute.await_count == 3
+        price_rows = upsert_prices.await_args.args[1]
+        assert [row["product_id"] for row in price_rows] == [f"pid-{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_products_are_collapsed_keeping_last(self):
+        """A source_id listed twice on a page is upserted once, with its last price."""
+        from sqlalchemy.dialects import postgresql
+
+        scraper = _PagedScraper([])
+        session = MagicMock()
+        session.execute = AsyncMock(
+            return_value=[MagicMock(id="pid-1", source_product_id="A1", inserted=False)]
+        )
+        upsert_prices = AsyncMock(return_value=0)
+        products = [
+            {"chain": "test_chain", "source_id": "A1", "name": "Lager 6x330ml", "price_nzd": price}
+            for price in (12.0, 10.0)
+        ]
+
+        with patch.object(scraper, "_upsert_price_rows", upsert_prices):
+            await scraper._upsert_products_batch(session, products, [MagicMock(id="s1")])
+
+        compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        assert [key for key in compiled.params if key.startswith("source_product_id")] == ["source_product_id_m0"]
+        price_rows = upsert_prices.await_args.args[1]
+        assert [row["price_nzd"] for row in price_rows] == [10.0]
+
+    @pytest.mark.asyncio
+    async def test_prices_for_all_new_products_are_copied(self):
+        """When every product was just inserted, prices and history skip ON CONFLICT and use COPY."""
+        scraper = _PagedScraper([])
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=[
+            MagicMock(id="pid-1", source_product_id="A1", inserted=True),
+            MagicMock(id="pid-2", source_product_id="A2", inserted=True),
+        ])
+        upsert_prices = AsyncMock()
+        copy = AsyncMock()
+        products = [
+            {"chain": "test_chain", "source_id": sid, "name": "Lager 6x330ml", "price_nzd": 12.0}
+            for sid in ("A1", "A2")
+        ]
+
+        with patch.object(scraper, "_upsert_price_rows", upsert_prices), \
+             patch.object(base_module, "copy_insert", copy):
+            changed = await scraper._upsert_products_batch(session, products, [MagicMock(id="s1")])
+
+        assert changed == 2
+        upsert_prices.assert_not_awaited()
+        (price_model, prices), (history_model, history) = [call.args[1:] for call in copy.await_args_list]
+        assert (price_model, history_model) == (Price, PriceHistory)
+        assert [row["product_id"] for row in prices] == ["pid-1", "pid-2"]
+        assert [row["product_id"] for row in history] == ["pid-1", "pid-2"]
+
+    @pytest.mark.asyncio
+    async def test_existing_product_keeps_on_conflict_path(self):
+        """One pre-existing product in the batch is enough to fall back to the upsert."""
+        scraper = _PagedScraper([])
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=[
+            MagicMock(id="pid-1", source_product_id="A1", inserted=True),
+            MagicMock(id="pid-2", source_product_id="A2", inserted=False),
+        ])
+        upsert_prices = AsyncMock(return_value=0)
+        copy = AsyncMock()
+        products = [
+            {"chain": "test_chain", "source_id": sid, "name": "Lager 6x330ml", "price_nzd": 12.0}
+            for sid in ("A1", "A2")
+        ]
+
+        with patch.object(scraper, "_upsert_price_rows", upsert_prices), \
+             patch.object(base_module, "copy_insert", copy):
+            await scraper._upsert_products_batch(session, products, [MagicMock(id="s1")])
+
+        upsert_prices.assert_awaited_once()
+        copy.assert_not_awaited()
+
+
+class TestSharedClient:
+    """Tests for the process-wide scraper HTTP client."""
+
+    def test_scrapers_share_one_http2_client(self):
+        """Every Scraper instance uses the same pooled HTTP/2 client."""
+        first, second = _PagedScraper([]), _PagedScraper([])
+
+        assert first.client is second.client is base_module.get_shared_client()
+        pool = first.client._transport._pool
+        assert pool._http2 is True
+        assert pool._max_connections == base_module.HTTP_LIMITS.max_connections
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self):
+        """After close_shared_client(), the next scraper gets a fresh client."""
+        old = base_module.get_shared_client()
+        await base_module.close_shared_client()
+
+        assert old.is_closed
+        assert _PagedScraper([]).client is not old
+
+
+class TestChainStoresCache:
+    """Tests for get_chain_stores()."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        base_module._stores_cache.clear()
+        yield
+        base_module._stores_cache.clear()
+
+    @staticmethod
+    def _session(stores):
+        session = MagicMock()
+        session.execute = AsyncMock(
+            return_value=MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=stores))))
+        )
+        return session
+
+    @pytest.mark.asyncio
+    async def test_stores_are_cached_per_chain(self):
+        """A second lookup within the TTL is served without querying."""
+        stores = [MagicMock(id="s1")]
+        session = self._session(stores)
+
+        first = await base_module.get_chain_stores(session, "test_chain")
+        second = await base_module.get_chain_stores(session, "test_chain")
+
+        assert first == second == stores
+        session.execute.assert_awaited_once_with(base_module._CHAIN_STORES_STMT, {"chain": "test_chain"})
+
+    @pytest.mark.asyncio
+    async def test_cache_expires_after_ttl(self):
+        """Stores are re-read once the TTL has passed."""
+        session = self._session([MagicMock(id="s1")])
+
+        with patch.object(base_module.time, "monotonic", side_effect=[0.0, 601.0, 601.0]):
+            await base_module.get_chain_stores(session, "test_chain")
+            await base_module.get_chain_stores(session, "test_chain")
+
+        assert session.execute.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_store_list_is_not_cached(self):
+        """A chain with no stores yet is looked up again next time."""
+        session = self._session([])
+
+        await base_module.get_chain_stores(session, "test_chain")
+        await base_module.get_chain_stores(session, "test_chain")
+
+        assert session.execute.await_count == 2
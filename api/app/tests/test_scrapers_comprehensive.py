@@ -245,6 +245,22 @@ class TestFoodstuffsScraper:
         assert "/shop/product/" in result["url"]
         assert "r1234567" in result["url"].lower()
 
+    @pytest.mark.parametrize("scraper_class", [NewWorldAPIScraper, PakNSaveAPIScraper])
+    def test_missing_stores_insert_is_single_upsert(self, scraper_class):
+        """Missing stores should be created in one INSERT that skips existing (chain, api_id)."""
+        from sqlalchemy.dialects import postgresql
+
+        scraper = scraper_class(scrape_all_stores=False)
+
+        stmt = scraper._missing_stores_insert(["101", "102"])
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+
+        assert sql.count("INSERT INTO stores") == 1
+        assert "ON CONFLICT DO NOTHING" in sql
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert {params["api_id_m0"], params["api_id_m1"]} == {"101", "102"}
+        assert params["name_m0"] == f"{scraper.chain} #{params['api_id_m0']}"
+
 
 # ============================================================================
 # Super Liquor Tests
@@ -0,0 +1,51 @@
+"""Tests for the Redis JSON cache helper."""
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.cache import cached_json
+
+
+class TestCachedJson:
+    """Tests for cached_json()."""
+
+    @pytest.mark.asyncio
+    async def test_miss_calls_producer_and_stores_json(self, mock_redis):
+        """A cache miss should call the producer and store its result as a JSON string."""
+        producer = AsyncMock(return_value={"items": [1, 2], "name": "Kiwi"})
+
+        with patch("app.services.cache._cache._redis", mock_redis):
+            result = await cached_json("key", 60, producer)
+
+        assert result == {"items": [1, 2], "name": "Kiwi"}
+        key, stored = mock_redis.set.await_args.args
+        assert key == "key"
+        assert isinstance(stored, str)
+        assert json.loads(stored) == result
+        assert mock_redis.set.await_args.kwargs == {"ex": 60}
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_producer(self, mock_redis):
+        """A cache hit should be decoded without calling the producer."""
+        mock_redis.get = AsyncMock(return_value='{"total": 3}')
+        producer = AsyncMock()
+
+        with patch("app.services.cache._cache._redis", mock_redis):
+            result = await cached_json("key", 60, producer)
+
+        assert result == {"total": 3}
+        producer.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_zero_ttl_bypasses_cache(self, mock_redis):
+        """A TTL of 0 should neither read nor write the cache."""
+        producer = AsyncMock(return_value=[])
+
+        with patch("app.services.cache._cache._redis", mock_redis):
+            assert await cached_json("key", 0, producer) == []
+
+        mock_redis.get.assert_not_awaited()
+        mock_redis.set.assert_not_awaited()
@@ -8,10 +8,12 @@ from app.services.parser_utils import (
     CATEGORY_HIERARCHY,
     CATEGORY_KEYWORDS,
     KNOWN_BRANDS,
+    PARSE_CACHE_SIZE,
     ParsedVolume,
     extract_abv,
     infer_brand,
     infer_category,
+    parse_title_attrs,
     parse_volume,
 )
 
@@ -147,6 +149,15 @@ class TestInferBrand:
         result = infer_brand("")
         assert result is None
 
+    def test_longest_brand_wins_regardless_of_position(self):
+        """The longest known brand is returned even when a shorter one appears first."""
+        assert infer_brand("Smirnoff Ice Double Black 12x250ml") == "Smirnoff Ice"
+        assert infer_brand("Tui and Johnnie Walker Gift Pack") == "Johnnie Walker"
+
+    def test_brand_must_match_whole_words(self):
+        """Brands embedded inside other words are not matched."""
+        assert infer_brand("Dbx Lager 330ml") != "DB"
+
 
 class TestInferCategory:
     """Tests for category inference."""
@@ -189,6 +200,11 @@ class TestInferCategory:
         result = infer_category("Cloudy Bay 750ml")
         assert result == "wine"
 
+    def test_longest_keyword_wins_across_categories(self):
+        """The longest matching keyword decides the category, wherever it appears."""
+        assert infer_category("Lager Style Pale Ale 330ml") == "ale"
+        assert infer_category("Stout Barrel Aged Cream Liqueur") == "liqueur"
+
     def test_infer_category_no_match(self):
         """Should return None when no category detected."""
         result = infer_category("Random Product 123")
@@ -284,3 +300,32 @@ class TestBrandCategoryMap:
         assert BRAND_CATEGORY_MAP.get("smirnoff") == "vodka"
         assert BRAND_CATEGORY_MAP.get("gordon's") == "gin"
         assert BRAND_CATEGORY_MAP.get("jack daniel's") == "whisky"
+
+
+class TestParseCache:
+    """Tests for memoisation of the title parsers."""
+
+    @pytest.mark.parametrize(
+        "parser", [parse_volume, extract_abv, infer_brand, infer_category, parse_title_attrs]
+    )
+    def test_repeat_title_is_served_from_cache(self, parser):
+        """The same title parsed twice should only be computed once."""
+        title = "Heineken Lager 12x330ml 5% (cache test)"
+        parser.cache_clear()
+
+        first = parser(title)
+        second = parser(title)
+
+        assert first == second
+        assert parser.cache_info().hits == 1
+        assert parser.cache_info().maxsize == PARSE_CACHE_SIZE
+
+    def test_title_attrs_match_individual_parsers(self):
+        """parse_title_attrs bundles the four parsers' results for a title."""
+        title = "Heineken Lager 12x330ml 5%"
+        attrs = parse_title_attrs(title)
+
+        assert attrs.volume == parse_volume(title)
+        assert attrs.abv == extract_abv(title)
+        assert attrs.brand == infer_brand(title)
+        assert attrs.category == infer_category(title)
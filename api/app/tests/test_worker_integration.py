@@ -11,7 +11,7 @@ Tests cover:
 from __future__ import annotations
 
 import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -95,7 +95,7 @@ class TestWorkerScheduler:
     async def test_should_run_recently_completed(self):
         """Test scraper should not run if recently completed."""
         scheduler = WorkerScheduler()
-        scheduler.last_run["countdown"] = datetime.utcnow()
+        scheduler.last_run["countdown"] = datetime.now(timezone.utc)
 
         should_run = await scheduler.should_run_scraper("countdown")
 
@@ -105,7 +105,7 @@ class TestWorkerScheduler:
     async def test_should_run_old_execution(self):
         """Test scraper should run if execution is old."""
         scheduler = WorkerScheduler()
-        scheduler.last_run["countdown"] = datetime.utcnow() - timedelta(days=2)
+        scheduler.last_run["countdown"] = datetime.now(timezone.utc) - timedelta(days=2)
 
         should_run = await scheduler.should_run_scraper("countdown")
 
@@ -340,7 +340,7 @@ class TestHealthMonitoring:
         assert isinstance(scheduler.last_run, dict)
 
         # Update a timestamp
-        test_time = datetime.utcnow()
+        test_time = datetime.now(timezone.utc)
         scheduler.last_run["countdown"] = test_time
 
         assert scheduler.last_run["countdown"] == test_time
@@ -12,6 +12,8 @@ from sqlalchemy import text, update
 from app.core.logging import configure_logging
 from app.db.models import IngestionRun
 from app.db.session import async_transaction, get_async_session
+from app.scrapers.api_auth_base import close_shared_browser
+from app.scrapers.base import close_shared_client
 from app.scrapers.registry import CHAINS, get_chain_scraper
 
 configure_logging()
@@ -106,7 +108,7 @@ class WorkerScheduler:
         Returns True if the scraper completed successfully, False otherwise.
         """
         logger.info(f"Starting scraper: {chain}")
-        start_time = datetime.utcnow()
+        start_time = datetime.now(timezone.utc)
         timeout_minutes = CHAIN_TIMEOUT_MINUTES.get(chain, SCRAPER_TIMEOUT_MINUTES)
 
         try:
@@ -117,14 +119,15 @@ class WorkerScheduler:
                 timeout=timeout_minutes * 60
             )
 
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            finished_at = datetime.now(timezone.utc)
+            duration = (finished_at - start_time).total_seconds()
             logger.info(f"Scraper completed: {chain} ({duration:.1f}s)")
-            self.last_run[chain] = datetime.utcnow()
+            self.last_run[chain] = finished_at
             self.consecutive_failures[chain] = 0
             return True
 
         except asyncio.TimeoutError:
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = (datetime.now(timezone.utc) - start_time).total_seconds()
             logger.error(
                 f"Scraper timeout: {chain} (>{duration:.1f}s, limit={timeout_minutes}m)"
             )
@@ -132,7 +135,7 @@ class WorkerScheduler:
             return False
 
         except Exception as e:
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = (datetime.now(timezone.utc) - start_time).total_seconds()
             logger.error(f"Scraper failed: {chain} ({duration:.1f}s) - {type(e).__name__}: {e}")
             logger.exception(e)
             self.consecutive_failures[chain] = self.consecutive_failures.get(chain, 0) + 1
@@ -159,7 +162,7 @@ class WorkerScheduler:
         if last_run is None:
             return True
 
-        time_since_last_run = datetime.utcnow() - last_run
+        time_since_last_run = datetime.now(timezone.utc) - last_run
         return time_since_last_run >= timedelta(hours=SCRAPER_INTERVAL_HOURS)
 
     async def run_all_scrapers(self, force: bool = False) -> None:
@@ -186,7 +189,7 @@ class WorkerScheduler:
             else:
                 last_run = self.last_run.get(chain)
                 if last_run:
-                    time_since = datetime.utcnow() - last_run
+                    time_since = datetime.now(timezone.utc) - last_run
                     logger.info(f"Skipping {chain} (last run {time_since.total_seconds() / 3600:.1f}h ago)")
 
         # Retry failed chains once
@@ -265,46 +268,51 @@ async def main(chains_to_run: Optional[List[str]] = None) -> None:
     await _check_db_health()
     await _cleanup_zombie_runs()
 
-    scheduler = WorkerScheduler(chains_to_run=chains_to_run)
-
-    if SCRAPE_ON_STARTUP or run_once:
-        logger.info("Running initial scraper pass...")
-        await scheduler.run_all_scrapers(force=True)
-        await _post_scrape_tasks()
-
-        if run_once:
-            logger.info("LIQUORFY_RUN_ONCE enabled - exiting after initial pass")
-            return
-    else:
-        logger.info(f"Skipping startup scrape. Nightly run scheduled at {SCRAPE_START_HOUR:02d}:00 NZST")
-
-    # Run on schedule — check every 15 minutes, scrape at the configured hour
-    last_scrape_date: Optional[str] = None
-    while True:
-        await asyncio.sleep(900)  # 15-minute check interval
-
-        # Use NZST (UTC+13 during NZDT, UTC+12 during NZST)
-        now_nz = datetime.now(timezone(timedelta(hours=13)))
-        today = now_nz.strftime("%Y-%m-%d")
-        current_hour = now_nz.hour
-
-        # Run cleanup every cycle (lightweight)
-        try:
-            from app.workers.cleanup import run_promo_expiry_cleanup, run_price_history_cleanup
-            await run_promo_expiry_cleanup()
-            await run_price_history_cleanup()
-        except Exception as e:
-            logger.warning(f"Cleanup failed: {e}")
+    try:
+        scheduler = WorkerScheduler(chains_to_run=chains_to_run)
 
-        # Check if it's time for the nightly scrape
-        if current_hour == SCRAPE_START_HOUR and last_scrape_date != today:
-            logger.info(f"Nightly scrape triggered at {now_nz.strftime('%H:%M')} NZST")
-            last_scrape_date = today
+        if SCRAPE_ON_STARTUP or run_once:
+            logger.info("Running initial scraper pass...")
             await scheduler.run_all_scrapers(force=True)
             await _post_scrape_tasks()
-        elif last_scrape_date != today:
-            logger.debug(f"Waiting for {SCRAPE_START_HOUR:02d}:00 NZST (currently {now_nz.strftime('%H:%M')})")
 
+            if run_once:
+                logger.info("LIQUORFY_RUN_ONCE enabled - exiting after initial pass")
+                return
+        else:
+            logger.info(f"Skipping startup scrape. Nightly run scheduled at {SCRAPE_START_HOUR:02d}:00 NZST")
+
+        # Run on schedule — check every 15 minutes, scrape at the configured hour
+        last_scrape_date: Optional[str] = None
+        while True:
+            await asyncio.sleep(900)  # 15-minute check interval
+
+            # Use NZST (UTC+13 during NZDT, UTC+12 during NZST)
+            now_nz = datetime.now(timezone(timedelta(hours=13)))
+            today = now_nz.strftime("%Y-%m-%d")
+            current_hour = now_nz.hour
+
+            # Run cleanup every cycle (lightweight)
+            try:
+                from app.workers.cleanup import run_promo_expiry_cleanup, run_price_history_cleanup
+                await run_promo_expiry_cleanup()
+                await run_price_history_cleanup()
+            except Exception as e:
+                logger.warning(f"Cleanup failed: {e}")
+
+            # Check if it's time for the nightly scrape
+            if current_hour == SCRAPE_START_HOUR and last_scrape_date != today:
+                logger.info(f"Nightly scrape triggered at {now_nz.strftime('%H:%M')} NZST")
+                last_scrape_date = today
+                await scheduler.run_all_scrapers(force=True)
+                await _post_scrape_tasks()
+            elif last_scrape_date != today:
+                logger.debug(f"Waiting for {SCRAPE_START_HOUR:02d}:00 NZST (currently {now_nz.strftime('%H:%M')})")
+    finally:
+        # Scrapers share one auth browser and HTTP client per process; shut
+        # them down with the worker.
+        await close_shared_browser()
+        await close_shared_client()
 
 if __name__ == "__main__":
     try: